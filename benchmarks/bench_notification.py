@@ -0,0 +1,170 @@
+"""Microbenchmark of the `Notification` record.
+
+Compares the current record, whose fields are computed once when it is
+parsed, with the previous one, which kept the raw details and computed its
+fields on every access. For each, the benchmark reports:
+
+- the memory allocated by parsing a page of notifications and still held
+  once the page itself is dropped, per notification, in bytes
+- the time to read `sub_type`, `type_`, `url` and `created_at`, per
+  notification, in nanoseconds
+
+    python benchmarks/bench_notification.py --notifications 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "fenotek"))
+
+from fenotek_api.api_reponse import (  # noqa: E402
+    VisiophoneHomeNotificationDetailResponse,
+    VisiophoneHomeNotificationResponse,
+)
+from fenotek_api.client import FenotekClient  # noqa: E402
+from fenotek_api.codec import loads  # noqa: E402
+from fenotek_api.notification import (  # noqa: E402
+    Notification,
+    NotificationSubType,
+    NotificationType,
+)
+from mock_backend import MockFenotekBackend  # noqa: E402
+
+CLIENT = cast(FenotekClient, None)
+
+
+class LegacyNotification:
+    """Notification record before fields were precomputed, as a baseline."""
+
+    def __init__(
+        self,
+        fenotek_client: FenotekClient,
+        id_: str,
+        type_: str,
+        created_at: datetime,
+        details: VisiophoneHomeNotificationDetailResponse,
+    ) -> None:
+        """Legacy notification class constructor."""
+        self._fenotek_client: FenotekClient = fenotek_client
+        self._id: str = id_
+        self._type: str = type_
+        self._created_at: datetime = created_at
+        self._details: VisiophoneHomeNotificationDetailResponse = details
+        self._video_url: str = ""
+
+    @property
+    def id_(self) -> str:
+        """Return notification ID."""
+        return self._id
+
+    @property
+    def type_(self) -> NotificationType:
+        """Return notification type."""
+        return NotificationType(self._type)
+
+    @property
+    def created_at(self) -> datetime:
+        """Return notification creation date."""
+        return self._created_at
+
+    @property
+    def sub_type(self) -> NotificationSubType:
+        """Return notification sub type."""
+        return NotificationSubType(self._details.get("type", -1))
+
+    @property
+    def url(self) -> str:
+        """Return notification data url."""
+        return self._details.get("url", "")
+
+    @classmethod
+    def new(
+        cls,
+        fenotek_client: FenotekClient,
+        notification_raw_data: VisiophoneHomeNotificationResponse,
+    ) -> LegacyNotification:
+        """Create new notification object."""
+        return cls(
+            fenotek_client=fenotek_client,
+            id_=notification_raw_data["_id"],
+            type_=notification_raw_data["type"],
+            created_at=datetime.fromisoformat(notification_raw_data["createdAt"]),
+            details=notification_raw_data["detail"],
+        )
+
+
+Parser = Callable[[FenotekClient, VisiophoneHomeNotificationResponse], Any]
+
+
+def _payload(count: int) -> bytes:
+    """Build a page of `count` generated notifications, as the API sends it."""
+    backend = MockFenotekBackend()
+    doorbell_id = backend.doorbell_ids[0]
+    for _ in range(count):
+        backend.add_notification(doorbell_id)
+    return json.dumps(backend.notifications[doorbell_id]).encode()
+
+
+def _retained(parse: Parser, payload: bytes, count: int) -> float:
+    """Memory held by the parsed notifications, per notification."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        raw_notifications = loads(payload)
+        notifications = [parse(CLIENT, raw) for raw in raw_notifications]
+        del raw_notifications
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(notifications) == count
+    return retained / count
+
+
+def _access_time(parse: Parser, payload: bytes, count: int, repeat: int) -> float:
+    """Best time to read four fields of a notification, in nanoseconds."""
+    notifications = [parse(CLIENT, raw) for raw in loads(payload)]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for notification in notifications:
+            notification.sub_type
+            notification.type_
+            notification.url
+            notification.created_at
+        best = min(best, time.perf_counter_ns() - start)
+    return best / count
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory and field access time of notifications"
+    )
+    parser.add_argument("--notifications", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    payload = _payload(args.notifications)
+    print(f"{'record':>9} {'held B':>9} {'access ns':>9}")
+    parsers: dict[str, Parser] = {
+        "before": LegacyNotification.new,
+        "after": Notification.new,
+    }
+    for name, parse in parsers.items():
+        retained = _retained(parse, payload, args.notifications)
+        access = _access_time(parse, payload, args.notifications, args.repeat)
+        print(f"{name:>9} {retained:>9.0f} {access:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""End to end benchmark of `FenotekAccount.update()` against the mock backend.
+
+For each doorbell count, the mock backend is started in a subprocess, so its
+CPU and memory are not measured. Then the account is logged in, and the
+cold start of the integration is run: its doorbells are discovered and
+loaded by a first update. Then update ticks are run. For the cold start and
+for each tick, the benchmark reports:
+
+- the wall time
+- the number of requests received by the backend
+- the memory allocated by `fenotek_api` and still held, in KiB
+- the peak memory traced during the tick, in KiB
+
+    python benchmarks/bench_update.py --doorbells 1 10 100 --ticks 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "fenotek"))
+
+from fenotek_api.account import FenotekAccount  # noqa: E402
+
+MOCK_BACKEND = Path(__file__).with_name("mock_backend.py")
+TRACE_FILTER = tracemalloc.Filter(True, "*fenotek_api*", all_frames=True)
+
+
+@dataclass
+class Measure:
+    """Measures of a benchmark step."""
+
+    wall: float
+    requests: int
+    retained: int
+    peak: int
+
+
+@dataclass
+class Result:
+    """Measures of a doorbell count."""
+
+    doorbells: int
+    cold_start: Measure
+    ticks: list[Measure] = field(default_factory=list)
+
+
+class MockBackendProcess:
+    """Mock backend running in a subprocess."""
+
+    def __init__(self, args: list[str]) -> None:
+        """Mock backend process constructor."""
+        self._args = args
+        self._process: subprocess.Popen[str] | None = None
+        self.base_url: str = ""
+
+    def __enter__(self) -> MockBackendProcess:
+        """Start the backend and wait for its url."""
+        self._process = subprocess.Popen(
+            [sys.executable, str(MOCK_BACKEND), "--port", "0", *self._args],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert self._process.stdout is not None
+        self.base_url = self._process.stdout.readline().split()[-1]
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the backend."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+
+
+async def _request_count(session: aiohttp.ClientSession, base_url: str) -> int:
+    """Total number of requests received by the mock backend."""
+    async with session.get(f"{base_url}/_stats") as res:
+        return sum((await res.json()).values())
+
+
+def _retained() -> int:
+    """Memory allocated by fenotek_api and still held."""
+    snapshot = tracemalloc.take_snapshot().filter_traces([TRACE_FILTER])
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def _measure(
+    session: aiohttp.ClientSession, base_url: str, step: object
+) -> Measure:
+    """Run an awaitable and measure it."""
+    requests = await _request_count(session, base_url)
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    await step  # type: ignore[misc]
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    return Measure(
+        wall,
+        await _request_count(session, base_url) - requests,
+        _retained(),
+        peak,
+    )
+
+
+async def _cold_start(account: FenotekAccount) -> None:
+    """Discover and load the doorbells, as the integration setup does."""
+    await account.get_doorbells(update=False)
+    await account.update(ping=True)
+
+
+async def bench(
+    doorbells: int, ticks: int, events: int, backend_args: list[str]
+) -> Result:
+    """Benchmark an account with `doorbells` doorbells."""
+    with MockBackendProcess(["--doorbells", str(doorbells), *backend_args]) as backend:
+        async with aiohttp.ClientSession() as session:
+            account = FenotekAccount(
+                "benchmark", "benchmark", "UTC", session, base_url=backend.base_url
+            )
+            await account.login()
+            tracemalloc.start(25)
+            try:
+                result = Result(
+                    doorbells,
+                    await _measure(session, backend.base_url, _cold_start(account)),
+                )
+                for _ in range(ticks):
+                    if events:
+                        async with session.post(
+                            f"{backend.base_url}/_events", params={"count": events}
+                        ):
+                            pass
+                    result.ticks.append(
+                        await _measure(
+                            session, backend.base_url, account.update(ping=True)
+                        )
+                    )
+            finally:
+                tracemalloc.stop()
+    return result
+
+
+def _report(results: list[Result]) -> None:
+    """Print the results as a table."""
+    print(
+        f"{'doorbells':>9} {'step':>9} {'wall ms':>9} {'p95 ms':>9} "
+        f"{'requests':>9} {'held KiB':>9} {'peak KiB':>9}"
+    )
+    for result in results:
+        cold_start = result.cold_start
+        print(
+            f"{result.doorbells:>9} {'start':>9} {cold_start.wall * 1000:>9.1f} "
+            f"{'':>9} {cold_start.requests:>9} {cold_start.retained / 1024:>9.0f} "
+            f"{cold_start.peak / 1024:>9.0f}"
+        )
+        if not result.ticks:
+            continue
+        walls = sorted(tick.wall * 1000 for tick in result.ticks)
+        p95 = walls[min(len(walls) - 1, int(len(walls) * 0.95))]
+        print(
+            f"{result.doorbells:>9} {'tick':>9} {statistics.mean(walls):>9.1f} "
+            f"{p95:>9.1f} "
+            f"{statistics.mean(tick.requests for tick in result.ticks):>9.1f} "
+            f"{result.ticks[-1].retained / 1024:>9.0f} "
+            f"{max(tick.peak for tick in result.ticks) / 1024:>9.0f}"
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark FenotekAccount.update() against the mock backend"
+    )
+    parser.add_argument("--doorbells", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument(
+        "--events", type=int, default=1, help="new notifications before each tick"
+    )
+    parser.add_argument("--notifications", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    backend_args = [
+        "--notifications",
+        str(args.notifications),
+        "--latency",
+        str(args.latency),
+        "--error-rate",
+        str(args.error_rate),
+    ]
+    results = [
+        asyncio.run(bench(doorbells, args.ticks, args.events, backend_args))
+        for doorbells in args.doorbells
+    ]
+    _report(results)
+
+
+if __name__ == "__main__":
+    main()
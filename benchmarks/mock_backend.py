@@ -0,0 +1,351 @@
+"""Local stand-in for the Fenotek backend.
+
+It serves the endpoints used by `fenotek_api`, with generated doorbells and
+notifications, and counts the requests it receives. Latency, error rate and
+sizes are configurable, so the client can be measured without the real
+backend:
+
+    python benchmarks/mock_backend.py --doorbells 10 --port 8080
+
+GET /_stats returns the requests received by route, POST /_events?count=N
+adds N notifications to random doorbells.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from aiohttp import web
+
+# Notification sub types, as in fenotek_api.notification.NotificationSubType
+MOTION_IMAGE = 0
+ANSWERED_CALL = 3
+RING = 6
+MISSED_CALL = 8
+ACTIVATION = 10
+MOTION_VIDEO = 11
+GENERATED_SUB_TYPES = (
+    RING,
+    RING,
+    MOTION_IMAGE,
+    MOTION_VIDEO,
+    ANSWERED_CALL,
+    MISSED_CALL,
+    ACTIVATION,
+)
+
+
+@dataclass
+class MockConfig:
+    """Mock backend behavior."""
+
+    doorbells: int = 1
+    # Notifications per doorbell, and per page
+    notifications: int = 50
+    page_size: int = 20
+    # Seconds added to every response
+    latency: float = 0.0
+    # Share of API requests answered with HTTP 503
+    error_rate: float = 0.0
+    # Size in bytes of the served images and videos
+    media_size: int = 50_000
+    token_lifetime: float = 3600
+    seed: int = 0
+
+
+def _token(lifetime: float) -> str:
+    """Build an unsigned JWT token expiring after `lifetime` seconds."""
+
+    def encode(data: dict[str, Any]) -> str:
+        raw = base64.urlsafe_b64encode(json.dumps(data).encode())
+        return raw.rstrip(b"=").decode()
+
+    claims = {"sub": "benchmark", "exp": int(time.time() + lifetime)}
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+class MockFenotekBackend:
+    """Fenotek backend stand-in, an aiohttp application."""
+
+    def __init__(self, config: MockConfig | None = None) -> None:
+        """Mock backend constructor."""
+        self.config: MockConfig = config or MockConfig()
+        self.requests: Counter[str] = Counter()
+        self.base_url: str = ""
+        self._random = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        self._serial = 0
+        self.doorbell_ids = [
+            f"doorbell{index:04d}" for index in range(self.config.doorbells)
+        ]
+        # Most recent first, like the API. Generated once the base url of
+        # the media is known.
+        self.notifications: dict[str, list[dict[str, Any]]] = {
+            doorbell_id: [] for doorbell_id in self.doorbell_ids
+        }
+
+    @property
+    def request_count(self) -> int:
+        """Total number of requests received."""
+        return sum(self.requests.values())
+
+    def add_notification(
+        self, doorbell_id: str, sub_type: int | None = None
+    ) -> dict[str, Any]:
+        """Add a notification to a doorbell, more recent than the others.
+
+        The backend must be started, its media urls point to it.
+        """
+        if sub_type is None:
+            sub_type = self._random.choice(GENERATED_SUB_TYPES)
+        self._serial += 1
+        self._created_at += timedelta(seconds=30)
+        notification_id = f"{self._serial:024x}"
+        detail: dict[str, Any] = {"type": sub_type}
+        if sub_type in (RING, MOTION_IMAGE):
+            detail["url"] = f"{self.base_url}/media/{notification_id}.jpg"
+        elif sub_type == MOTION_VIDEO:
+            detail["url"] = f"{self.base_url}/media/{notification_id}.jpg"
+            detail["download"] = f"{self.base_url}/media/{notification_id}.mp4"
+        elif sub_type in (ANSWERED_CALL, MISSED_CALL):
+            detail["url"] = f"{self.base_url}/media/{notification_id}.json"
+            detail["name"] = "Visitor"
+        elif sub_type == ACTIVATION:
+            detail["label"] = "Gate"
+        notification = {
+            "vuid": doorbell_id,
+            "type": "missedcall" if sub_type == MISSED_CALL else "notification",
+            "detail": detail,
+            "expireAt": (self._created_at + timedelta(days=30)).isoformat(),
+            "_id": notification_id,
+            "createdAt": self._created_at.isoformat(),
+            "updatedAt": self._created_at.isoformat(),
+        }
+        self.notifications[doorbell_id].insert(0, notification)
+        return notification
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/authenticate", self._authenticate)
+        app.router.add_get("/user/visiophones", self._visiophones)
+        app.router.add_get("/visiophones/{id}", self._visiophone)
+        app.router.add_get("/page/{id}/home", self._home)
+        app.router.add_get("/visiophones/{id}/notifications", self._notifications)
+        app.router.add_post("/visiophones/{id}/ping", self._ping)
+        app.router.add_post(
+            "/visiophones/{id}/drycontacts/{contact}/activate", self._activate
+        )
+        app.router.add_get("/media/{name}", self._media)
+        # Control endpoints, not counted
+        app.router.add_get("/_stats", self._stats)
+        app.router.add_post("/_events", self._events)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, return the base url."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.base_url = f"http://{host}:{self._runner.addresses[0][1]}"
+        for doorbell_id in self.doorbell_ids:
+            for _ in range(self.config.notifications):
+                self.add_notification(doorbell_id)
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        """Count requests, add latency and errors."""
+        if request.path.startswith("/_"):
+            return await handler(request)
+        route = request.match_info.route.resource
+        self.requests[route.canonical if route else request.path] += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if (
+            self.config.error_rate
+            and not request.path.startswith("/media/")
+            and self._random.random() < self.config.error_rate
+        ):
+            return web.Response(status=503)
+        return await handler(request)
+
+    def _doorbell_id(self, request: web.Request) -> str:
+        """Doorbell ID of a request, 404 if unknown."""
+        doorbell_id = request.match_info["id"]
+        if doorbell_id not in self.notifications:
+            raise web.HTTPNotFound
+        return doorbell_id
+
+    async def _authenticate(self, request: web.Request) -> web.Response:
+        """Login."""
+        return web.json_response({"token": _token(self.config.token_lifetime)})
+
+    async def _visiophones(self, request: web.Request) -> web.Response:
+        """Doorbell IDs of the account."""
+        return web.json_response({"visiophones": self.doorbell_ids})
+
+    async def _visiophone(self, request: web.Request) -> web.Response:
+        """Doorbell data, with the fields the integration does not read."""
+        doorbell_id = self._doorbell_id(request)
+        stamp = "2024-01-01T00:00:00.000Z"
+        return web.json_response(
+            {
+                "_id": doorbell_id,
+                "description": f"Doorbell {doorbell_id}",
+                "connectionType": "wifi",
+                "major": 2,
+                "minor": 1,
+                "hiVersion": "3.4.5",
+                "lastPing": datetime.now(UTC).isoformat(),
+                "isTurnedOn": True,
+                "isInStandBy": False,
+                "suspended": False,
+                "dryContacts": [
+                    {
+                        "_id": f"{doorbell_id}-gate",
+                        "name": "Gate",
+                        "commandId": "1",
+                        "isOnHold": False,
+                        "icon": "j",
+                        "delay": 3,
+                        "createdAt": stamp,
+                        "updatedAt": stamp,
+                    }
+                ],
+                "zones": [
+                    {"label": f"zone{index}", "coords": [[0, 0], [10, 10]]}
+                    for index in range(8)
+                ],
+                "member": [{"userId": "user", "isAdmin": True}],
+                "invitations": [],
+                "contacts": [],
+                "address": {"street_1": "1 main street", "city": "Paris"},
+                "createdAt": stamp,
+                "updatedAt": stamp,
+            }
+        )
+
+    async def _home(self, request: web.Request) -> web.Response:
+        """Doorbell home page data."""
+        doorbell_id = self._doorbell_id(request)
+        notifications = self.notifications[doorbell_id]
+        return web.json_response(
+            {
+                "vuid": doorbell_id,
+                "users": [{"name": "User", "username": "user", "isAdmin": True}],
+                "dryContacts": [],
+                "lastNotification": notifications[0] if notifications else {},
+                "mediaUrl": f"{self.base_url}/media/last.jpg",
+            }
+        )
+
+    async def _notifications(self, request: web.Request) -> web.Response:
+        """Return a page of doorbell notifications, numbered from 1."""
+        doorbell_id = self._doorbell_id(request)
+        notifications = self.notifications[doorbell_id]
+        page_size = self.config.page_size
+        page = int(request.query.get("page", 1))
+        pages = max(1, -(-len(notifications) // page_size))
+        start = (page - 1) * page_size
+        end = start + page_size
+        return web.json_response(
+            {
+                "page": page,
+                "pages": pages,
+                "notifications": notifications[start:end],
+            }
+        )
+
+    async def _ping(self, request: web.Request) -> web.Response:
+        """Doorbell ping."""
+        self._doorbell_id(request)
+        return web.json_response({"success": True})
+
+    async def _activate(self, request: web.Request) -> web.Response:
+        """Dry contact activation."""
+        self._doorbell_id(request)
+        return web.json_response({"success": True})
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        """Return the requests received, by route."""
+        return web.json_response(dict(self.requests))
+
+    async def _events(self, request: web.Request) -> web.Response:
+        """Add `count` notifications to random doorbells."""
+        count = int(request.query.get("count", 1))
+        for _ in range(count):
+            self.add_notification(self._random.choice(self.doorbell_ids))
+        return web.json_response({"added": count})
+
+    async def _media(self, request: web.Request) -> web.Response:
+        """Notification media: images, videos and call details."""
+        name = request.match_info["name"]
+        if name.endswith(".json"):
+            video_url = f"{self.base_url}/media/{name[:-5]}.mp4"
+            return web.json_response({"data": {"url": video_url}})
+        content_type = "video/mp4" if name.endswith(".mp4") else "image/jpeg"
+        return web.Response(
+            body=b"\0" * self.config.media_size, content_type=content_type
+        )
+
+
+async def _serve(config: MockConfig, port: int) -> None:
+    """Serve until interrupted."""
+    backend = MockFenotekBackend(config)
+    base_url = await backend.start(port=port)
+    print(f"Mock Fenotek backend listening on {base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await backend.stop()
+
+
+def main() -> None:
+    """Parse the arguments and serve."""
+    parser = argparse.ArgumentParser(description="Local Fenotek backend stand-in")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--doorbells", type=int, default=1)
+    parser.add_argument("--notifications", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--media-size", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    config = MockConfig(
+        doorbells=args.doorbells,
+        notifications=args.notifications,
+        page_size=args.page_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        media_size=args.media_size,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve(config, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,41 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import aiohttp_client
-
-from .const import CONF_TIMEZONE, DOMAIN
-from .coordinator import FenotekDataUpdateCoordinator
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_ARCHIVE,
+    CONF_ARCHIVE_MAX_AGE,
+    CONF_ARCHIVE_MAX_SIZE,
+    CONF_PUSH,
+    CONF_TIMEZONE,
+    DATA_HUB,
+    DEFAULT_ARCHIVE_MAX_AGE,
+    DEFAULT_ARCHIVE_MAX_SIZE,
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .coordinator import SETUP_PHASE, FenotekDataUpdateCoordinator
 from .fenotek_api.account import FenotekAccount
 from .fenotek_api.doorbell import Doorbell
+from .fenotek_api.exceptions import FenotekError
+from .fenotek_api.hub import FenotekHub
+from .push import async_push_target, async_register_push
+from .views import FenotekMediaView
 
 DEFAULT_UPDATE_INTERVAL = timedelta(minutes=5)
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=20)
@@ -28,10 +49,13 @@ PLATFORMS = [
     Platform.BUTTON,
     Platform.CAMERA,
     Platform.SENSOR,
+    Platform.SWITCH,
 ]
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 @dataclass
 class HomeAssistantFenotekData:
@@ -41,35 +65,98 @@ class HomeAssistantFenotekData:
     platforms: defaultdict[Platform, list[Doorbell]]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Fenotek integration."""
+    hass.data[DATA_HUB] = FenotekHub()
+    hass.http.register_view(FenotekMediaView(hass))
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Set up EC as config entry."""
+    """Set up EC as config entry.
+
+    With a saved snapshot, entities start from it right away and the
+    backend is reached in the background, so setup does not fail when it
+    is unreachable. Otherwise doorbells are only discovered, their data is
+    loaded once by the first refresh, for all doorbells concurrently.
+    """
+    start = time.perf_counter()
     username: str = config_entry.data[CONF_USERNAME]
     password: str = config_entry.data[CONF_PASSWORD]
     timezone: str = config_entry.data[CONF_TIMEZONE]
 
     websession = aiohttp_client.async_get_clientsession(hass)
+    options = config_entry.options
+    push_target = None
+    if options.get(CONF_PUSH, False):
+        push_target = async_push_target(hass, config_entry)
 
     fenotek_account = FenotekAccount(
         username=username,
         password=password,
         timezone=timezone,
         websession=websession,
+        push_target=push_target,
+        hub=hass.data[DATA_HUB],
     )
-
-    connected = await fenotek_account.login()
-    if not connected:
-        _LOGGER.warning("Unable to connect to fenotek")
-        raise ConfigEntryNotReady
-
-    await fenotek_account.get_doorbells()
-
+    # Also run when the setup fails, so a retry does not leak the client
+    config_entry.async_on_unload(fenotek_account.close)
+    store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(config_entry.entry_id)
+    )
+    snapshot = await store.async_load()
+    restored = snapshot is not None and bool(fenotek_account.restore(snapshot))
     coordinator: FenotekDataUpdateCoordinator = FenotekDataUpdateCoordinator(
-        hass, fenotek_account, username, DEFAULT_UPDATE_INTERVAL
+        hass,
+        fenotek_account,
+        username,
+        DEFAULT_UPDATE_INTERVAL,
+        push=push_target is not None,
+        store=store,
     )
+
+    if restored:
+        coordinator.async_set_updated_data(
+            {doorbell.id_: doorbell for doorbell in fenotek_account.doorbells}
+        )
+    else:
+        try:
+            connected = await fenotek_account.login()
+            if connected:
+                await fenotek_account.get_doorbells(update=False)
+        except FenotekError as exp:
+            _LOGGER.warning("Unable to connect to fenotek: %s", exp)
+            raise ConfigEntryNotReady from exp
+        if not connected:
+            _LOGGER.warning("Unable to connect to fenotek")
+            raise ConfigEntryNotReady
+
+    if options.get(CONF_ARCHIVE, False):
+        max_age = options.get(CONF_ARCHIVE_MAX_AGE, DEFAULT_ARCHIVE_MAX_AGE)
+        max_size = options.get(CONF_ARCHIVE_MAX_SIZE, DEFAULT_ARCHIVE_MAX_SIZE)
+        await fenotek_account.enable_archive(
+            hass.config.path(DOMAIN, config_entry.entry_id),
+            max_age=timedelta(days=max_age).total_seconds(),
+            max_bytes=int(max_size) * 1024 * 1024,
+        )
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
-
-    await coordinator.async_config_entry_first_refresh()
+    if push_target is not None:
+        async_register_push(hass, config_entry)
+
+    if restored:
+        config_entry.async_create_background_task(
+            hass,
+            _async_start(hass, config_entry, coordinator),
+            f"{DOMAIN} {username} start",
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        if not all(doorbell.loaded for doorbell in fenotek_account.doorbells):
+            # Entities are built from the doorbell data
+            hass.data[DOMAIN].pop(config_entry.entry_id)
+            raise ConfigEntryNotReady("Unable to load all Fenotek doorbells")
 
     #    for doorbell in fenotek_account.doorbells:
     #        _LOGGER.debug("Added doorbell (%s)", doorbell)
@@ -87,5 +174,58 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     #        )
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+
+    duration = time.perf_counter() - start
+    coordinator.metrics.on_phase(SETUP_PHASE, duration)
+    _LOGGER.debug("Set up %s in %.3fs", username, duration)
 
     return True
+
+
+async def _async_start(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: FenotekDataUpdateCoordinator,
+) -> None:
+    """Connect an entry started from its snapshot and refresh it.
+
+    The entry is reloaded if doorbells were added or removed since the
+    snapshot. When the backend is unreachable, the entities keep the saved
+    data until a scheduled refresh succeeds.
+    """
+    fenotek_account = coordinator.fenotek_account
+    known = {doorbell.id_ for doorbell in fenotek_account.doorbells}
+    try:
+        if not await fenotek_account.login():
+            _LOGGER.warning("Unable to connect to fenotek, using saved data")
+            return
+        await fenotek_account.get_doorbells(update=False)
+    except FenotekError as exp:
+        _LOGGER.warning("Unable to connect to fenotek, using saved data: %s", exp)
+        return
+    if {doorbell.id_ for doorbell in fenotek_account.doorbells} != known:
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+    await coordinator.async_refresh()
+
+
+async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    unloaded = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if unloaded:
+        coordinator = hass.data[DOMAIN].pop(config_entry.entry_id)
+        await coordinator.async_save_snapshot()
+    return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the saved snapshot of a deleted entry."""
+    await Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(config_entry.entry_id)
+    ).async_remove()
+
+
+async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -12,8 +12,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ICON_MAPPING
 from .coordinator import FenotekDataUpdateCoordinator
+from .fenotek_api.consts import FENOTEK_SLICE_AVAILABILITY
 from .fenotek_api.doorbell import Doorbell
 from .fenotek_api.dry_contact import DryContact
+from .fenotek_api.exceptions import FenotekError
 
 
 async def async_setup_entry(
@@ -23,9 +25,11 @@ async def async_setup_entry(
 ) -> None:
     """Add buttons entities from a config_entry."""
     coordinator: FenotekDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for doorbell in coordinator.fenotek_account.doorbells:
-        for dry_contact in doorbell.dry_contacts:
-            async_add_entities([FenotekButton(coordinator, doorbell, dry_contact)])
+    async_add_entities(
+        FenotekButton(coordinator, doorbell, dry_contact)
+        for doorbell in coordinator.fenotek_account.doorbells
+        for dry_contact in doorbell.dry_contacts
+    )
 
 
 class FenotekButton(CoordinatorEntity, ButtonEntity):
@@ -67,16 +71,19 @@ class FenotekButton(CoordinatorEntity, ButtonEntity):
         """Handle the button press."""
         try:
             await self._dry_contact.activate()
-        except Exception:
-            try:
-                await self.coordinator.fenotek_account.login()
-                await self._dry_contact.activate()
-            except Exception as err:
-                raise HomeAssistantError(
-                    f"Can not activate dry contact: {err}"
-                ) from err
+        except FenotekError as err:
+            raise HomeAssistantError(f"Can not activate dry contact: {err}") from err
 
     @property
     def available(self) -> bool:
         """Button avaibility."""
         return self._doorbell.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update."""
+        if not self.coordinator.has_changed(
+            self._doorbell.id_, FENOTEK_SLICE_AVAILABILITY
+        ):
+            return
+        super()._handle_coordinator_update()
@@ -12,6 +12,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FenotekDataUpdateCoordinator
+from .fenotek_api.consts import FENOTEK_SLICE_AVAILABILITY, FENOTEK_SLICE_NOTIFICATIONS
 from .fenotek_api.doorbell import Doorbell
 from .fenotek_api.notification import Notification
 
@@ -23,11 +24,16 @@ async def async_setup_entry(
 ) -> None:
     """Add a weather entity from a config_entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for doorbell in coordinator.fenotek_account.doorbells:
-        async_add_entities([FenotekCameraMotion(coordinator, hass, doorbell)])
-        async_add_entities([FenotekCameraMissedCall(coordinator, hass, doorbell)])
-        async_add_entities([FenotekCameraAnsweredCall(coordinator, hass, doorbell)])
-        async_add_entities([FenotekCameraLastEvent(coordinator, hass, doorbell)])
+    async_add_entities(
+        camera_class(coordinator, hass, doorbell)
+        for doorbell in coordinator.fenotek_account.doorbells
+        for camera_class in (
+            FenotekCameraMotion,
+            FenotekCameraMissedCall,
+            FenotekCameraAnsweredCall,
+            FenotekCameraLastEvent,
+        )
+    )
 
 
 class FenotekCamera(CoordinatorEntity, Camera):
@@ -75,13 +81,19 @@ class FenotekCamera(CoordinatorEntity, Camera):
     ) -> bytes | None:
         """Return bytes of camera image."""
         stream_source = await self.stream_source()
-        if not stream_source:
+        if not stream_source or not self._last_notif:
             return None
-        image = await ffmpeg.async_get_image(
-            self.hass,
-            stream_source,
-            width=width,
-            height=height,
+        image = await self.coordinator.frames.get(
+            self._doorbell.id_,
+            self._last_notif.id_,
+            width,
+            height,
+            lambda: ffmpeg.async_get_image(
+                self.hass,
+                stream_source,
+                width=width,
+                height=height,
+            ),
         )
         if image:
             self._image = image
@@ -91,6 +103,9 @@ class FenotekCamera(CoordinatorEntity, Camera):
         """Return the source of the stream."""
         if not self._last_notif:
             return None
+        archive = self.coordinator.fenotek_account.archive
+        if archive and (media := archive.get(self._last_notif.id_)) and media.is_video:
+            return archive.path(media)
         return self._last_notif.video_url
 
     def _set_last_notif(self) -> None:
@@ -100,11 +115,15 @@ class FenotekCamera(CoordinatorEntity, Camera):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle new data."""
+        if not self.coordinator.has_changed(
+            self._doorbell.id_, FENOTEK_SLICE_NOTIFICATIONS, FENOTEK_SLICE_AVAILABILITY
+        ):
+            return
+        self._set_last_notif()
         if self._last_notif:
             self._attr_extra_state_attributes["last_update"] = (
                 self._last_notif.created_at
             )
-        self.async_write_ha_state()
         super()._handle_coordinator_update()
 
 
@@ -123,12 +142,6 @@ class FenotekCameraLastEvent(FenotekCamera):
             return None
         self._last_notif = notifs_with_video[-1]
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle new data."""
-        self._set_last_notif()
-        super()._handle_coordinator_update()
-
 
 class FenotekCameraMotion(FenotekCamera):
     """Last motion camera."""
@@ -142,12 +155,6 @@ class FenotekCameraMotion(FenotekCamera):
         """Save last notification."""
         self._last_notif = self._doorbell.last_motion
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle new data."""
-        self._set_last_notif()
-        super()._handle_coordinator_update()
-
 
 class FenotekCameraMissedCall(FenotekCamera):
     """Last missed call camera."""
@@ -161,12 +168,6 @@ class FenotekCameraMissedCall(FenotekCamera):
         """Save last notification."""
         self._last_notif = self._doorbell.last_missed_call
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle new data."""
-        self._set_last_notif()
-        super()._handle_coordinator_update()
-
 
 class FenotekCameraAnsweredCall(FenotekCamera):
     """Last answered call camera."""
@@ -179,9 +180,3 @@ class FenotekCameraAnsweredCall(FenotekCamera):
     def _set_last_notif(self) -> None:
         """Save last notification."""
         self._last_notif = self._doorbell.last_call
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle new data."""
-        self._set_last_notif()
-        super()._handle_coordinator_update()
@@ -6,16 +6,33 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.components import webhook
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import aiohttp_client
 
-from .const import CONF_TIMEZONE, DOMAIN
+from .const import (
+    CONF_ARCHIVE,
+    CONF_ARCHIVE_MAX_AGE,
+    CONF_ARCHIVE_MAX_SIZE,
+    CONF_PUSH,
+    CONF_TIMEZONE,
+    CONF_WEBHOOK_ID,
+    DEFAULT_ARCHIVE_MAX_AGE,
+    DEFAULT_ARCHIVE_MAX_SIZE,
+    DOMAIN,
+)
 
 # from .chihiros_led_control.device import BaseDevice, get_model_class_from_name
 from .fenotek_api.client import FenotekClient
+from .fenotek_api.exceptions import FenotekAuthError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,8 +63,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     try:
         connected = await fenotek_client.login()
+    except FenotekAuthError:
+        raise InvalidAuth
     except Exception:
         raise CannotConnect
+    finally:
+        # Stop the token refresh of the throwaway client
+        await fenotek_client.close()
     if not connected:
         raise InvalidAuth
     # TODO validate the data can be used to set up a connection.
@@ -84,6 +106,12 @@ class FenotekConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> FenotekOptionsFlow:
+        """Get the options flow for this handler."""
+        return FenotekOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -112,6 +140,42 @@ class FenotekConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class FenotekOptionsFlow(OptionsFlow):
+    """Handle Fenotek options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the local media archive and push options."""
+        options = self.config_entry.options
+        if user_input is not None:
+            # Keep the webhook, so the push target does not change
+            user_input[CONF_WEBHOOK_ID] = (
+                options.get(CONF_WEBHOOK_ID) or webhook.async_generate_id()
+            )
+            return self.async_create_entry(data=user_input)
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_ARCHIVE, default=options.get(CONF_ARCHIVE, False)
+                ): bool,
+                vol.Required(
+                    CONF_ARCHIVE_MAX_AGE,
+                    default=options.get(CONF_ARCHIVE_MAX_AGE, DEFAULT_ARCHIVE_MAX_AGE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_ARCHIVE_MAX_SIZE,
+                    default=options.get(
+                        CONF_ARCHIVE_MAX_SIZE, DEFAULT_ARCHIVE_MAX_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(CONF_PUSH, default=options.get(CONF_PUSH, False)): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=data_schema)
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -1,5 +1,7 @@
 """Constants for the fenotek integration."""
 
+from datetime import timedelta
+
 MANUFACTURER = "Fenotek"
 DOMAIN = "fenotek"
 CONF_TIMEZONE = "timezone"
@@ -7,3 +9,27 @@ ICON_MAPPING = {
     "W": "mdi:door",
     "j": "mdi:gate",
 }
+# Adaptive polling: fast interval right after an event, slow one when idle
+ADAPTIVE_BURST_INTERVAL = timedelta(seconds=2)
+ADAPTIVE_BURST_DURATION = timedelta(minutes=2)
+ADAPTIVE_IDLE_INTERVAL = timedelta(seconds=60)
+ADAPTIVE_IDLE_AFTER = timedelta(minutes=10)
+# Local media archive options, maximum age in days and size in MiB
+CONF_ARCHIVE = "archive"
+CONF_ARCHIVE_MAX_AGE = "archive_max_age"
+CONF_ARCHIVE_MAX_SIZE = "archive_max_size"
+DEFAULT_ARCHIVE_MAX_AGE = 30
+DEFAULT_ARCHIVE_MAX_SIZE = 1024
+# Push: notifications are received through a webhook, polling only reconciles
+CONF_PUSH = "push"
+CONF_WEBHOOK_ID = "webhook_id"
+PUSH_RECONCILIATION_INTERVAL = timedelta(minutes=5)
+# Snapshot of the last known doorbell data, restored at startup
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{}}"
+SNAPSHOT_SAVE_DELAY = 30
+# Hub shared by all entries, bounding their requests together
+DATA_HUB = f"{DOMAIN}_hub"
+# Update intervals are stretched by a random share up to this one, so
+# entries do not poll in lockstep
+TICK_JITTER = 0.1
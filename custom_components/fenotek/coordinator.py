@@ -1,17 +1,48 @@
 """Fenotek HA coordinator module."""
 
 import logging
+import random
+import time
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import (
+    ADAPTIVE_BURST_DURATION,
+    ADAPTIVE_BURST_INTERVAL,
+    ADAPTIVE_IDLE_AFTER,
+    ADAPTIVE_IDLE_INTERVAL,
+    DOMAIN,
+    PUSH_RECONCILIATION_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    TICK_JITTER,
+)
 from .fenotek_api.account import FenotekAccount
+from .fenotek_api.consts import FENOTEK_SLICE_NOTIFICATIONS
 from .fenotek_api.doorbell import Doorbell
+from .fenotek_api.exceptions import FenotekError
+from .fenotek_api.media_cache import FrameCache
+from .fenotek_api.metrics import MetricsRecorder
+from .fenotek_api.notification import Notification, NotificationSubType
+from .fenotek_api.scheduler import AdaptiveInterval
 
 _LOGGER = logging.getLogger(__name__)
 
+# Notifications usually followed by a call or a video
+BURST_SUB_TYPES = (
+    NotificationSubType.RING,
+    NotificationSubType.MOTION_VIDEO,
+    NotificationSubType.ACTIVATION,
+)
+# Notifications with a jpeg image
+SNAPSHOT_SUB_TYPES = (NotificationSubType.RING, NotificationSubType.MOTION_IMAGE)
+# Metrics phases of a whole coordinator refresh and of the entry setup
+UPDATE_PHASE = "coordinator.update"
+SETUP_PHASE = "setup"
+
 
 class FenotekDataUpdateCoordinator(
     DataUpdateCoordinator
@@ -24,28 +55,195 @@ class FenotekDataUpdateCoordinator(
         fenotek_account: FenotekAccount,
         name: str,
         update_interval: timedelta,
+        push: bool = False,
+        store: Store[dict[str, Any]] | None = None,
     ) -> None:
-        """Initialize global EC data updater."""
+        """Initialize global EC data updater.
+
+        The doorbells data is saved to `store` when it changes.
+        """
         super().__init__(
             hass, _LOGGER, name=f"{DOMAIN} {name}", update_interval=update_interval
         )
         self.fenotek_account: FenotekAccount = fenotek_account
         self.last_update_success: bool = False
         self._available: bool = False
+        # Data slices which changed during the last refresh, by doorbell ID
+        self.changes: dict[str, set[str]] = {}
+        # Frames extracted from notification videos, shared by the cameras
+        self.frames = FrameCache()
+        # Notifications are pushed, polling is only a safety net
+        self.push: bool = push
+        self._store: Store[dict[str, Any]] | None = store
+        # Requests and update phases metrics, for diagnostics
+        self.metrics = MetricsRecorder()
+        fenotek_account.add_metrics_hook(self.metrics)
+        self._adaptive_polling: bool = False
+        self._adaptive_interval = AdaptiveInterval(
+            base=update_interval.total_seconds(),
+            burst=ADAPTIVE_BURST_INTERVAL.total_seconds(),
+            idle=ADAPTIVE_IDLE_INTERVAL.total_seconds(),
+            burst_duration=ADAPTIVE_BURST_DURATION.total_seconds(),
+            idle_after=ADAPTIVE_IDLE_AFTER.total_seconds(),
+        )
+        self._apply_update_interval()
+
+    @property
+    def adaptive_polling(self) -> bool:
+        """Is the update interval adapted to the doorbells activity."""
+        return self._adaptive_polling
+
+    @adaptive_polling.setter
+    def adaptive_polling(self, enabled: bool) -> None:
+        """Enable or disable adaptive polling."""
+        self._adaptive_polling = enabled
+        self._apply_update_interval()
+
+    def set_base_update_interval(self, update_interval: timedelta) -> None:
+        """Set the update interval used when not adapting to events."""
+        self._adaptive_interval.base = update_interval.total_seconds()
+        self._apply_update_interval()
+
+    def _apply_update_interval(self) -> None:
+        """Set the update interval according to the polling mode.
+
+        With push, polling only reconciles missed notifications, slowly.
+        The interval is stretched by a random jitter, drawn again after
+        each refresh, so entries sharing the backend do not poll in lockstep.
+        """
+        if self.push:
+            seconds = max(
+                self._adaptive_interval.base,
+                PUSH_RECONCILIATION_INTERVAL.total_seconds(),
+            )
+        elif self._adaptive_polling:
+            seconds = self._adaptive_interval.interval()
+        else:
+            seconds = self._adaptive_interval.base
+        seconds *= 1 + random.uniform(0, TICK_JITTER)
+        self.update_interval = timedelta(seconds=seconds)
+
+    async def async_handle_push(self, payload: Any) -> None:
+        """Add pushed notifications and notify the entities right away."""
+        new_notifications = await self.fenotek_account.ingest_push(payload)
+        if not new_notifications:
+            return
+        _LOGGER.debug("Pushed notifications: %s", new_notifications)
+        self.changes = {
+            doorbell_id: {FENOTEK_SLICE_NOTIFICATIONS}
+            for doorbell_id in new_notifications
+        }
+        self._handle_new_notifications(new_notifications)
+        self._schedule_snapshot_save()
+        self.async_update_listeners()
+
+    def _handle_new_notifications(
+        self, new_notifications: dict[str, list[Notification]]
+    ) -> None:
+        """Record burst events and fetch the media of new notifications."""
+        snapshots: list[Notification] = []
+        for notifications in new_notifications.values():
+            for notification in notifications:
+                if notification.sub_type in BURST_SUB_TYPES:
+                    self._adaptive_interval.record_event(
+                        notification.created_at.timestamp()
+                    )
+                if notification.sub_type in SNAPSHOT_SUB_TYPES:
+                    snapshots.append(notification)
+        if snapshots:
+            self.hass.async_create_background_task(
+                self._prefetch_snapshots(snapshots), f"{self.name} snapshots prefetch"
+            )
+        if new_notifications and self.fenotek_account.archive is not None:
+            self.hass.async_create_background_task(
+                self._archive_media(new_notifications), f"{self.name} media archive"
+            )
+
+    async def _prefetch_snapshots(self, notifications: list[Notification]) -> None:
+        """Download new notification images before they are displayed."""
+        errors = await self.fenotek_account.snapshots.prefetch(notifications)
+        for notification_id, exp in errors.items():
+            _LOGGER.debug("Error prefetching snapshot %s: %r", notification_id, exp)
+
+    async def _archive_media(
+        self, notifications_by_doorbell: dict[str, list[Notification]]
+    ) -> None:
+        """Download new notification media to the local archive."""
+        archive = self.fenotek_account.archive
+        if archive is None:
+            return
+        for doorbell_id, notifications in notifications_by_doorbell.items():
+            errors = await archive.archive(doorbell_id, notifications)
+            for notification_id, exp in errors.items():
+                _LOGGER.warning(
+                    "Error archiving notification %s media: %r", notification_id, exp
+                )
+        try:
+            evicted = await archive.evict()
+        except OSError as exp:
+            _LOGGER.warning("Error evicting %s archived media: %s", self.name, exp)
+        else:
+            if evicted:
+                _LOGGER.debug("Evicted %s archived media", evicted)
+
+    def _schedule_snapshot_save(self) -> None:
+        """Save the doorbells data soon, once for several changes."""
+        if self._store is not None:
+            self._store.async_delay_save(
+                self.fenotek_account.snapshot, SNAPSHOT_SAVE_DELAY
+            )
+
+    async def async_save_snapshot(self) -> None:
+        """Save the doorbells data now."""
+        if self._store is not None:
+            await self._store.async_save(self.fenotek_account.snapshot())
+
+    def has_changed(self, doorbell_id: str, *slices: str) -> bool:
+        """Tell if any of the doorbell data slices changed during the last refresh."""
+        changes = self.changes.get(doorbell_id, set())
+        return any(slice_ in changes for slice_ in slices)
 
     async def _async_update_data(self) -> dict[str, Doorbell]:
+        """Fetch data from Fenotek, timing the refresh."""
+        start = time.perf_counter()
+        try:
+            return await self._async_fetch_data()
+        finally:
+            self.metrics.on_phase(UPDATE_PHASE, time.perf_counter() - start)
+
+    async def _async_fetch_data(self) -> dict[str, Doorbell]:
         """Fetch data from Fenotek."""
-        ret: dict[str, Doorbell] = {}
+        self.changes = {}
+        new_notifications: dict[str, list[Notification]] = {}
+        # The first load of a doorbell brings its notifications history, not
+        # events. Restored doorbells only get the notifications missed since.
+        loaded = {
+            doorbell.id_
+            for doorbell in self.fenotek_account.doorbells
+            if doorbell.loaded
+        }
+        # The client refreshes the token by itself when it expires
         try:
-            await self.fenotek_account.update()
-        except Exception:
-            try:
-                await self.fenotek_account.login()
-                await self.fenotek_account.update()
-            except Exception as exp:
-                raise UpdateFailed(f"Error fetching {self.name} data: {exp}") from exp
-        for doorbell in self.fenotek_account.doorbells:
-            await doorbell.ping()
-            ret[doorbell.id_] = doorbell
-
-        return ret
+            results = await self.fenotek_account.update(ping=True)
+        except FenotekError as exp:
+            raise UpdateFailed(f"Error fetching {self.name} data: {exp}") from exp
+
+        if results and not any(result.success for result in results.values()):
+            errors = ", ".join(repr(result.error) for result in results.values())
+            raise UpdateFailed(f"Error fetching {self.name} data: {errors}")
+        for doorbell_id, result in results.items():
+            if not result.success:
+                _LOGGER.warning(
+                    "Error fetching doorbell %s data: %r", doorbell_id, result.error
+                )
+            if result.changes:
+                _LOGGER.debug("Doorbell %s changed: %s", doorbell_id, result.changes)
+                self.changes[doorbell_id] = result.changes
+            if result.doorbell.new_notifications and doorbell_id in loaded:
+                new_notifications[doorbell_id] = result.doorbell.new_notifications
+        self._handle_new_notifications(new_notifications)
+        if self.changes:
+            self._schedule_snapshot_save()
+        self._apply_update_interval()
+
+        return {doorbell.id_: doorbell for doorbell in self.fenotek_account.doorbells}
@@ -0,0 +1,44 @@
+"""Diagnostics support for Fenotek."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_WEBHOOK_ID, DATA_HUB, DOMAIN
+from .coordinator import FenotekDataUpdateCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the diagnostics of a config entry, with its request metrics."""
+    coordinator: FenotekDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": async_redact_data(config_entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "adaptive_polling": coordinator.adaptive_polling,
+            "push": coordinator.push,
+        },
+        "doorbells": [
+            {"name": doorbell.name, "available": doorbell.available}
+            for doorbell in coordinator.fenotek_account.doorbells
+        ],
+        "metrics": coordinator.metrics.as_dict(),
+        "hub": hass.data[DATA_HUB].as_dict(),
+    }
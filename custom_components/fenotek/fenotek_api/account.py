@@ -1,11 +1,47 @@
 """Fenotek account module."""
 
+import asyncio
 import logging
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
 
 from aiohttp import ClientSession
 
 from .client import FenotekClient
+from .concurrency import gather_bounded
+from .consts import (
+    FENOTEK_ACCOUNT_MAX_CONCURRENCY,
+    FENOTEK_DOORBELL_MAX_CONCURRENCY,
+    FENOTEK_DOORBELL_UPDATE_TIMEOUT,
+    FENOTEK_MEDIA_HOSTS,
+    FENOTEK_SLICE_AVAILABILITY,
+    FENOTEK_SLICE_INTERVALS,
+    FENOTEK_URL,
+)
 from .doorbell import Doorbell
+from .exceptions import FenotekError
+from .hub import FenotekHub
+from .media_archive import MediaArchive
+from .media_cache import SnapshotCache
+from .metrics import MetricsHook
+from .notification import Notification
+from .push import PushTarget, parse_push_payload
+
+
+@dataclass
+class DoorbellUpdateResult:
+    """Result of a single doorbell refresh."""
+
+    doorbell: Doorbell
+    error: BaseException | None = None
+    changes: set[str] = field(default_factory=set)
+
+    @property
+    def success(self) -> bool:
+        """Doorbell refresh succeeded."""
+        return self.error is None
 
 
 class FenotekAccount:
@@ -18,8 +54,26 @@ class FenotekAccount:
         timezone: str,
         websession: ClientSession,
         logger: logging.Logger | None = None,
+        slice_intervals: Mapping[str, float] = FENOTEK_SLICE_INTERVALS,
+        push_target: PushTarget | None = None,
+        base_url: str = FENOTEK_URL,
+        hub: FenotekHub | None = None,
+        media_hosts: Collection[str] = FENOTEK_MEDIA_HOSTS,
     ) -> None:
-        """Fenotek account class constructor."""
+        """Fenotek account class constructor.
+
+        `slice_intervals` sets the minimum time in seconds between two
+        refreshes of each doorbell data slice, slices which are not in it
+        are refreshed on every update.
+        `push_target` is registered at login to receive pushed
+        notifications, which are then given to `ingest_push`.
+        `base_url` points the account to another backend, such as a local
+        stand-in.
+        `hub` bounds the requests of the account together with the other
+        accounts using it.
+        Pushed notifications are only accepted with media urls on
+        `media_hosts`, their subdomains, or the backend host.
+        """
         self._logger: logging.Logger = logger or logging.getLogger("fenotek")
         self._fenotek_client = FenotekClient(
             username,
@@ -27,9 +81,18 @@ class FenotekAccount:
             timezone,
             websession,
             self._logger.getChild("client"),
+            push_target=push_target,
+            base_url=base_url,
+            hub=hub,
         )
         self._username = username
+        self._media_hosts: tuple[str, ...] = tuple(media_hosts)
+        if backend_host := urlsplit(base_url).hostname:
+            self._media_hosts += (backend_host,)
+        self._slice_intervals: Mapping[str, float] = slice_intervals
         self._doorbells: list[Doorbell] = []
+        self._snapshots = SnapshotCache(self._fenotek_client)
+        self._archive: MediaArchive | None = None
 
     @property
     def username(self) -> str:
@@ -40,20 +103,190 @@ class FenotekAccount:
         """Login to Fenotek api."""
         return await self._fenotek_client.login()
 
-    async def get_doorbells(self) -> list[Doorbell]:
-        """Get Loging to Fenotek api."""
-        json_res = await self._fenotek_client.get_doorbells()
+    async def close(self) -> None:
+        """Stop the background tasks of the Fenotek client."""
+        await self._fenotek_client.close()
+
+    async def get_doorbells(
+        self,
+        update: bool = True,
+        max_concurrency: int = FENOTEK_ACCOUNT_MAX_CONCURRENCY,
+    ) -> list[Doorbell]:
+        """Discover the doorbells of the account.
+
+        With `update`, their data is loaded concurrently, at most
+        `max_concurrency` doorbells at a time, and the first error is
+        raised. Without it, new doorbells are left empty until the next
+        `update()`, which then loads everything once. Doorbells already
+        known, such as restored ones, are kept.
+        Discovery is timed as the `account.discovery` metrics phase.
+        """
+        with self._fenotek_client.record_phase("account.discovery"):
+            json_res = await self._fenotek_client.get_doorbells()
+            known = {doorbell.id_: doorbell for doorbell in self._doorbells}
+            self._doorbells = [
+                known.get(doorbell_id)
+                or Doorbell(self._fenotek_client, doorbell_id, self._slice_intervals)
+                for doorbell_id in json_res["visiophones"]
+            ]
+            if update:
+                results = await gather_bounded(
+                    (doorbell.update() for doorbell in self._doorbells),
+                    asyncio.Semaphore(max_concurrency),
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+        return self._doorbells
+
+    def snapshot(self) -> dict[str, Any]:
+        """Last known data of the doorbells, JSON serializable."""
+        return {
+            "doorbells": {
+                doorbell.id_: doorbell.snapshot()
+                for doorbell in self._doorbells
+                if doorbell.loaded
+            }
+        }
+
+    def restore(self, snapshot: Mapping[str, Any]) -> list[Doorbell]:
+        """Create the doorbells of a `snapshot`, without any request.
+
+        Doorbells whose snapshot cannot be read are skipped. The next
+        `update()` refreshes every data slice, and only fetches the
+        notifications received since the snapshot.
+        """
         self._doorbells = []
-        for doorbell_id in json_res["visiophones"]:
-            doorbell = Doorbell(self._fenotek_client, doorbell_id)
+        for doorbell_id, doorbell_snapshot in snapshot.get("doorbells", {}).items():
+            doorbell = Doorbell(
+                self._fenotek_client, doorbell_id, self._slice_intervals
+            )
+            try:
+                doorbell.restore(doorbell_snapshot)
+            except (KeyError, TypeError, ValueError) as exp:
+                self._logger.warning(
+                    "Unable to restore doorbell %s: %r", doorbell_id, exp
+                )
+                continue
             self._doorbells.append(doorbell)
-            await doorbell.update()
         return self._doorbells
 
-    async def update(self) -> None:
-        """Update all doorbells data."""
-        for doorbell in self._doorbells:
-            await doorbell.update()
+    async def update(
+        self,
+        ping: bool = False,
+        max_concurrency: int = FENOTEK_ACCOUNT_MAX_CONCURRENCY,
+        doorbell_max_concurrency: int = FENOTEK_DOORBELL_MAX_CONCURRENCY,
+        timeout: float | None = FENOTEK_DOORBELL_UPDATE_TIMEOUT,
+        all_slices: bool = False,
+    ) -> dict[str, DoorbellUpdateResult]:
+        """Update all doorbells data.
+
+        Doorbells are refreshed in parallel, at most `max_concurrency` at a
+        time, each one within its own `timeout`. When `ping` is set, a
+        doorbell is pinged after its refresh if the availability inferred
+        from its data is stale.
+        Only the data slices which are due for a refresh are fetched, unless
+        `all_slices` is set.
+        Errors are not raised but returned in the per doorbell results,
+        along with the data slices which changed.
+        The update is timed as the `account.update` metrics phase.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        was_available = {
+            doorbell.id_: doorbell.available for doorbell in self._doorbells
+        }
+        with self._fenotek_client.record_phase("account.update"):
+            results = await gather_bounded(
+                (
+                    self._update_doorbell(
+                        doorbell,
+                        None if all_slices else doorbell.due_slices(),
+                        ping,
+                        doorbell_max_concurrency,
+                        timeout,
+                    )
+                    for doorbell in self._doorbells
+                ),
+                semaphore,
+            )
+        ret: dict[str, DoorbellUpdateResult] = {}
+        for doorbell, result in zip(self._doorbells, results):
+            changes = set(doorbell.changes)
+            if doorbell.available != was_available[doorbell.id_]:
+                changes.add(FENOTEK_SLICE_AVAILABILITY)
+            ret[doorbell.id_] = DoorbellUpdateResult(
+                doorbell, result if isinstance(result, BaseException) else None, changes
+            )
+        return ret
+
+    async def ingest_push(self, payload: Any) -> dict[str, list[Notification]]:
+        """Add the notifications of a push payload to their doorbells.
+
+        Return the new notifications by doorbell ID. Notifications of
+        unknown doorbells are ignored.
+        """
+        doorbells = {doorbell.id_: doorbell for doorbell in self._doorbells}
+        new_notifications: dict[str, list[Notification]] = {}
+        pushed = parse_push_payload(payload, self._media_hosts)
+        for doorbell_id, raw_notifications in pushed.items():
+            if (doorbell := doorbells.get(doorbell_id)) is None:
+                self._logger.debug("Push for unknown doorbell %s", doorbell_id)
+                continue
+            if added := await doorbell.ingest_pushed(raw_notifications):
+                new_notifications[doorbell_id] = added
+        return new_notifications
+
+    async def _update_doorbell(
+        self,
+        doorbell: Doorbell,
+        slices: Collection[str] | None,
+        ping: bool,
+        max_concurrency: int,
+        timeout: float | None,
+    ) -> None:
+        """Refresh a single doorbell, and ping it if its availability is stale.
+
+        The availability is inferred from the refreshed data first, so most
+        refreshes do not need a ping.
+        """
+        ping = ping and (slices is None or FENOTEK_SLICE_AVAILABILITY in slices)
+        async with asyncio.timeout(timeout):
+            update_error: FenotekError | None = None
+            try:
+                await doorbell.update(max_concurrency, slices)
+            except FenotekError as exp:
+                update_error = exp
+            if ping and doorbell.availability.is_stale():
+                await doorbell.ping()
+            if update_error is not None:
+                raise update_error
+
+    def add_metrics_hook(self, hook: MetricsHook) -> Callable[[], None]:
+        """Report the requests and update phases to a hook.
+
+        Return a function unregistering it.
+        """
+        return self._fenotek_client.add_metrics_hook(hook)
+
+    @property
+    def snapshots(self) -> SnapshotCache:
+        """Notification images cache."""
+        return self._snapshots
+
+    @property
+    def archive(self) -> MediaArchive | None:
+        """Local notification media archive, None if disabled."""
+        return self._archive
+
+    async def enable_archive(
+        self, directory: str, max_age: float, max_bytes: int
+    ) -> MediaArchive:
+        """Archive notification media to local files in `directory`."""
+        self._archive = MediaArchive(
+            self._fenotek_client, directory, max_age=max_age, max_bytes=max_bytes
+        )
+        await self._archive.load()
+        return self._archive
 
     @property
     def doorbells(self) -> list[Doorbell]:
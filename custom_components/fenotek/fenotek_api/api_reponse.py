@@ -1,4 +1,8 @@
-"""HTTP response data structures module."""
+"""HTTP response data structures module.
+
+Responses are projected by the codec module, the fields it drops are
+missing at runtime.
+"""
 
 from typing import Any, NotRequired, TypedDict
 
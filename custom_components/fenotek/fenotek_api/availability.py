@@ -0,0 +1,83 @@
+"""Availability module."""
+
+import time
+from collections.abc import Iterable
+from datetime import datetime
+
+from .api_reponse import VisiophoneResponse
+from .consts import FENOTEK_AVAILABILITY_MAX_AGE
+from .notification import Notification, NotificationSubType, NotificationType
+
+
+def _timestamp(value: str) -> float | None:
+    """Timestamp of an API date, None if it cannot be parsed."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class AvailabilityEstimator:
+    """Doorbell reachability inferred from the data updates already fetch.
+
+    Every piece of evidence is dated, and the most recent one wins:
+
+    - the doorbell `lastPing`, and any notification but an unreachable one,
+      show the doorbell was reachable at that time
+    - a `DOORBELL_UNREACHABLE` or disconnected notification shows it was not
+    - doorbell data with `isTurnedOn` unset shows it is not, when fetched
+    - an active ping shows either, when sent
+
+    The estimate is stale once its evidence is older than `max_age`, an
+    active ping is then needed.
+    """
+
+    def __init__(self, max_age: float = FENOTEK_AVAILABILITY_MAX_AGE) -> None:
+        """Availability estimator class constructor."""
+        self._max_age: float = max_age
+        self._available: bool | None = None
+        self._observed_at: float | None = None
+
+    @property
+    def available(self) -> bool:
+        """Is the doorbell believed to be reachable, False when unknown."""
+        return bool(self._available)
+
+    @property
+    def observed_at(self) -> float | None:
+        """Timestamp of the evidence the estimate is based on."""
+        return self._observed_at
+
+    def is_stale(self, now: float | None = None) -> bool:
+        """Is the estimate unknown or too old to be trusted."""
+        if self._observed_at is None:
+            return True
+        if now is None:
+            now = time.time()
+        return now - self._observed_at > self._max_age
+
+    def observe(self, available: bool, observed_at: float) -> None:
+        """Record a piece of evidence, ignored if older than the current one."""
+        if self._observed_at is None or observed_at >= self._observed_at:
+            self._available = available
+            self._observed_at = observed_at
+
+    def observe_doorbell(
+        self, raw_data: VisiophoneResponse, fetched_at: float | None = None
+    ) -> None:
+        """Record the evidence of doorbell data fetched at `fetched_at`."""
+        if raw_data.get("isTurnedOn") is False:
+            self.observe(False, time.time() if fetched_at is None else fetched_at)
+            return
+        last_ping = _timestamp(raw_data.get("lastPing", ""))
+        if last_ping is not None:
+            self.observe(True, last_ping)
+
+    def observe_notifications(self, notifications: Iterable[Notification]) -> None:
+        """Record the evidence of notifications."""
+        for notification in notifications:
+            self.observe(
+                notification.sub_type != NotificationSubType.DOORBELL_UNREACHABLE
+                and notification.type_ != NotificationType.DISCONNECTED,
+                notification.created_at.timestamp(),
+            )
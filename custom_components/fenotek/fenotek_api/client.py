@@ -1,7 +1,16 @@
 """Fenotek client module."""
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import logging
-from typing import Any, cast
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Container, Mapping
+from contextlib import AbstractContextManager, aclosing, nullcontext, suppress
+from typing import IO, Any, Protocol, cast
 
 import aiohttp
 
@@ -14,16 +23,74 @@ from .api_reponse import (
     VisiophonesNotificationsResponse,
     VisiophonesResponse,
 )
+from .codec import DECODE_ERRORS, decode
+from .concurrency import SingleFlight
 from .consts import (
+    FENOTEK_DECODE_EXECUTOR_MIN_SIZE,
     FENOTEK_DRYCONTACT_ACTIVATE,
     FENOTEK_LOGIN,
+    FENOTEK_MEDIA_CHUNK_SIZE,
+    FENOTEK_MEDIA_MAX_SIZE,
     FENOTEK_PING,
+    FENOTEK_TOKEN_REFRESH_MARGIN,
     FENOTEK_URL,
     FENOTEK_VISIONPHONE,
     FENOTEK_VISIONPHONE_HOME,
     FENOTEK_VISIONPHONE_NOTIFICATIONS,
     FENOTEK_VISIONPHONES,
 )
+from .exceptions import (
+    FenotekAuthError,
+    FenotekError,
+    FenotekMediaTooLargeError,
+    FenotekPermanentError,
+    FenotekRateLimitError,
+    FenotekTransientError,
+)
+from .hub import FenotekHub
+from .metrics import (
+    MEDIA_ENDPOINT,
+    OUTCOME_FAILURE,
+    OUTCOME_RETRY,
+    OUTCOME_SUCCESS,
+    MetricsHook,
+    MetricsHooks,
+)
+from .push import PushTarget
+from .retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+class MediaWriter(Protocol):
+    """Destination media can be streamed to, like an aiohttp StreamResponse."""
+
+    async def write(self, data: bytes) -> None:
+        """Write a chunk of data."""
+
+
+def _discard_file(file: IO[bytes], path: str) -> None:
+    """Close and remove a partially written file."""
+    file.close()
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _finish_file(file: IO[bytes], tmp_path: str, path: str) -> None:
+    """Close a fully written file and move it to its final path."""
+    file.close()
+    os.replace(tmp_path, path)
+
+
+def token_expiry(token: str) -> float | None:
+    """Return the expiry timestamp of a JWT token, None if unknown."""
+    try:
+        payload = token.split(".")[1]
+        padding = "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload + padding))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
 
 
 class FenotekClient:
@@ -36,14 +103,56 @@ class FenotekClient:
         timezone: str,
         websession: aiohttp.ClientSession | None = None,
         logger: logging.Logger | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache_ttls: Mapping[str, float] | None = None,
+        push_target: PushTarget | None = None,
+        base_url: str = FENOTEK_URL,
+        hub: FenotekHub | None = None,
     ) -> None:
-        """Fenotek client class constructor."""
+        """Fenotek client class constructor.
+
+        `cache_ttls` enables a response cache for GET queries, giving for
+        endpoints, such as `FENOTEK_VISIONPHONE`, how many seconds their
+        responses are reused.
+        `push_target` is registered at login to receive pushed notifications.
+        `base_url` points the client to another backend, such as a local
+        stand-in.
+        `hub` bounds the requests together with the other clients using it.
+        """
         self._username: str = username
         self._password: str = password
         self._timezone: str = timezone
         self._websession: aiohttp.ClientSession = websession or aiohttp.ClientSession()
         self._token: str | None = None
+        self._token_expires_at: float | None = None
+        self._login_task: asyncio.Task[bool] | None = None
+        self._token_refresh: asyncio.TimerHandle | None = None
+        # Fingerprint of the last response body of each path
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self._circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker()
+        self._cache_ttls: dict[str, float] = dict(cache_ttls or {})
+        # Expiry time and body of cached responses, by path
+        self._response_cache: dict[str, tuple[float, bytes]] = {}
+        self._in_flight_bodies: SingleFlight[str, bytes] = SingleFlight()
+        self._in_flight_json: SingleFlight[str, dict[str, Any]] = SingleFlight()
         self._logger: logging.Logger = logger or logging.getLogger("fenotek-client")
+        self._push_target: PushTarget | None = push_target
+        self._base_url: str = base_url
+        self._hub: FenotekHub | None = hub
+        self._metrics: MetricsHooks = MetricsHooks()
+
+    def add_metrics_hook(self, hook: MetricsHook) -> Callable[[], None]:
+        """Report the requests and update phases to a hook.
+
+        Return a function unregistering it.
+        """
+        self._metrics.add(hook)
+        return lambda: self._metrics.remove(hook)
+
+    def record_phase(self, phase: str) -> AbstractContextManager[None]:
+        """Report the duration of the wrapped code to the metrics hooks."""
+        return self._metrics.phase(phase)
 
     @property
     def headers(self) -> dict[str, str]:
@@ -61,54 +170,310 @@ class FenotekClient:
         data: dict[str, Any] | None = None,
         status_code: int = 200,
         need_loggedin: bool = False,
+        retry: bool | None = None,
+        endpoint: str | None = None,
     ) -> dict[str, Any]:
-        """Make a HTTP query."""
-        if need_loggedin and self._token is None:
-            await self.login()
+        """Make a HTTP query.
+
+        Concurrent GET queries to the same path share one HTTP query and its
+        decoded result, which must then not be modified.
+        """
+        if method.lower() == "get" and data is None and status_code == 200:
+            return await self._in_flight_json.run(
+                path,
+                lambda: self._get_json(path, endpoint, need_loggedin, retry),
+            )
+        body = await self._http_request_body(
+            method, path, data, status_code, need_loggedin, retry, endpoint
+        )
+        return await self._decode(body, endpoint)
+
+    async def _get_json(
+        self,
+        path: str,
+        endpoint: str | None,
+        need_loggedin: bool = False,
+        retry: bool | None = None,
+    ) -> dict[str, Any]:
+        """Make a HTTP GET query and decode its body."""
+        body = await self._get_body(path, endpoint, need_loggedin, retry)
+        return await self._decode(body, endpoint)
+
+    async def _get_body(
+        self,
+        path: str,
+        endpoint: str | None = None,
+        need_loggedin: bool = False,
+        retry: bool | None = None,
+    ) -> bytes:
+        """Make a HTTP GET query and return the raw response body.
+
+        Concurrent queries to the same path share one HTTP query. Responses
+        are served from the cache when `endpoint`, the path by default, has
+        a cache TTL.
+        """
+        ttl = self._cache_ttls.get(endpoint or path)
+        if ttl is not None:
+            cached = self._response_cache.get(path)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+        body = await self._in_flight_bodies.run(
+            path,
+            lambda: self._http_request_body(
+                "get", path, need_loggedin=need_loggedin, retry=retry, endpoint=endpoint
+            ),
+        )
+        if ttl is not None:
+            self._response_cache[path] = (time.monotonic() + ttl, body)
+        return body
+
+    async def _get_if_changed(
+        self, path: str, fingerprint: bytes | None, endpoint: str | None = None
+    ) -> tuple[dict[str, Any] | None, bytes]:
+        """Make a HTTP GET query, return the body and its fingerprint.
+
+        The body is None, and not decoded, if its fingerprint is
+        `fingerprint`.
+        """
+        body = await self._get_body(path, endpoint)
+        new_fingerprint = hashlib.blake2b(body, digest_size=16).digest()
+        if new_fingerprint == fingerprint:
+            return None, new_fingerprint
+        return await self._decode(body, endpoint), new_fingerprint
+
+    async def _http_request_body(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None = None,
+        status_code: int = 200,
+        need_loggedin: bool = False,
+        retry: bool | None = None,
+        endpoint: str | None = None,
+    ) -> bytes:
+        """Make a HTTP query and return the raw response body.
 
-        url = FENOTEK_URL + path
+        Transient failures are retried with a jittered exponential backoff,
+        honoring Retry-After. By default only GET queries are retried, since
+        replaying a POST could trigger an action twice.
+        Requests fail fast with `FenotekCircuitOpenError` while the backend
+        is considered down.
+        A request rejected because of the token is replayed once after a
+        token refresh.
+        Attempts are reported to the metrics hooks under `endpoint`, the path
+        by default.
+        """
         method = method.lower()
         if method not in ("post", "get"):
-            raise
+            raise FenotekPermanentError(f"Unsupported HTTP method {method}")
+        if retry is None:
+            retry = method == "get"
+        if path == FENOTEK_LOGIN:
+            return await self._send(method, path, data, status_code, retry, endpoint)
 
+        if (need_loggedin and self._token is None) or self._token_expired():
+            await self.login()
+        token = self._token
         try:
-            res: aiohttp.ClientResponse = await getattr(self._websession, method)(
-                url, headers=self.headers, json=data
-            )
-        except Exception as exp:
-            raise RuntimeError from exp
-        if res.status != status_code:
-            raise
+            return await self._send(method, path, data, status_code, retry, endpoint)
+        except FenotekAuthError:
+            # Refresh the token, unless a concurrent request already did it
+            if self._token == token and not await self.login():
+                raise
+        return await self._send(method, path, data, status_code, retry, endpoint)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None,
+        status_code: int,
+        retry: bool,
+        endpoint: str | None = None,
+    ) -> bytes:
+        """Send a HTTP query, retrying it on transient failures."""
+        url = self._base_url + path
+        endpoint = endpoint or path
+        attempt = 0
+        while True:
+            self._circuit_breaker.before_request()
+            start = time.perf_counter()
+            try:
+                body = await self._http_request_once(method, url, data, status_code)
+            except FenotekTransientError as exp:
+                self._circuit_breaker.record_failure()
+                delay = self._retry_policy.delay(attempt, exp.retry_after)
+                if not retry or delay is None:
+                    self._record_request(endpoint, OUTCOME_FAILURE, start)
+                    raise
+                self._record_request(endpoint, OUTCOME_RETRY, start)
+                self._logger.debug(
+                    "%s %s failed (%s), retrying in %.1fs", method, path, exp, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except FenotekError:
+                # The backend answered, it is up
+                self._circuit_breaker.record_success()
+                self._record_request(endpoint, OUTCOME_FAILURE, start)
+                raise
+            except BaseException:
+                # Cancelled, or an unexpected error
+                self._circuit_breaker.record_cancelled()
+                raise
+            self._circuit_breaker.record_success()
+            self._record_request(endpoint, OUTCOME_SUCCESS, start, len(body))
+            return body
+
+    def _record_request(
+        self, endpoint: str, outcome: str, start: float, size: int = 0
+    ) -> None:
+        """Report a request attempt started at `start` to the metrics hooks."""
+        if self._metrics:
+            self._metrics.request(endpoint, outcome, time.perf_counter() - start, size)
+
+    async def _http_request_once(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | None,
+        status_code: int,
+    ) -> bytes:
+        """Send a single HTTP query and return the raw response body.
+
+        The query waits for the hub limits first, if any.
+        """
         try:
-            json_res: dict[str, Any] = await res.json()
-        except Exception as exp:
-            raise RuntimeError from exp
+            async with (
+                self._hub.request() if self._hub is not None else nullcontext(),
+                getattr(self._websession, method)(
+                    url, headers=self.headers, json=data
+                ) as res,
+            ):
+                if res.status == status_code:
+                    body: bytes = await res.read()
+                    return body
+                raise self._status_error(res)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exp:
+            raise FenotekTransientError(f"{method} {url} failed: {exp!r}") from exp
+
+    @staticmethod
+    def _status_error(res: aiohttp.ClientResponse) -> FenotekError:
+        """Build the error matching an unexpected HTTP status."""
+        message = f"{res.method} {res.url} returned HTTP {res.status}"
+        retry_after = parse_retry_after(res.headers.get("Retry-After"))
+        if res.status in (401, 403):
+            return FenotekAuthError(message)
+        if res.status == 429:
+            return FenotekRateLimitError(message, res.status, retry_after)
+        if res.status == 408 or res.status >= 500:
+            return FenotekTransientError(message, res.status, retry_after)
+        return FenotekPermanentError(message, res.status)
+
+    @staticmethod
+    async def _decode(body: bytes, endpoint: str | None = None) -> dict[str, Any]:
+        """Decode a JSON response body, projected according to its endpoint.
+
+        Large bodies are decoded in an executor, off the event loop.
+        """
+        try:
+            if len(body) >= FENOTEK_DECODE_EXECUTOR_MIN_SIZE:
+                loop = asyncio.get_running_loop()
+                json_res: dict[str, Any] = await loop.run_in_executor(
+                    None, decode, body, endpoint
+                )
+            else:
+                json_res = decode(body, endpoint)
+        except DECODE_ERRORS as exp:
+            raise FenotekPermanentError(f"Invalid JSON response: {exp}") from exp
         return json_res
 
     async def login(self) -> bool:
-        """Login to the API."""
+        """Login to the API.
+
+        Only one login runs at a time, concurrent callers share its result.
+        """
+        if self._login_task is None or self._login_task.done():
+            self._login_task = asyncio.create_task(self._login())
+        return await asyncio.shield(self._login_task)
+
+    async def close(self) -> None:
+        """Stop the background token refresh and any pending login."""
+        if self._token_refresh is not None:
+            self._token_refresh.cancel()
+            self._token_refresh = None
+        if self._login_task is not None and not self._login_task.done():
+            self._login_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._login_task
+        self._login_task = None
+
+    async def _login(self) -> bool:
+        """Send the login query."""
+        push_target = self._push_target
         data = {
             "email": self._username,
             "password": self._password,
             "device": {
-                "pushType": "",
+                "pushType": push_target.push_type if push_target else "",
                 "timeZone": self._timezone,
                 "type": "hass",
-                "duid": "",
+                "duid": push_target.duid if push_target else "",
                 "bypassDnd": True,
-                "tokenId": "",
+                "tokenId": push_target.token_id if push_target else "",
             },
         }
         json_res = cast(
             LoginResponse,
-            await self._http_request(method="post", path=FENOTEK_LOGIN, data=data),
+            await self._http_request(
+                method="post", path=FENOTEK_LOGIN, data=data, retry=True
+            ),
         )
         if "token" not in json_res:
             self._logger.error(json_res["error"])
             return False
         self._token = json_res["token"]
+        self._token_expires_at = token_expiry(self._token)
+        self._schedule_token_refresh()
         return True
 
+    def _token_expired(self) -> bool:
+        """Is the current token known to be expired."""
+        return (
+            self._token_expires_at is not None and self._token_expires_at <= time.time()
+        )
+
+    def _schedule_token_refresh(self) -> None:
+        """Refresh the token in the background shortly before it expires."""
+        if self._token_refresh is not None:
+            self._token_refresh.cancel()
+            self._token_refresh = None
+        if self._token_expires_at is None:
+            return
+        validity = self._token_expires_at - time.time()
+        refresh_in = max(validity - FENOTEK_TOKEN_REFRESH_MARGIN, validity / 2)
+        if refresh_in <= 0:
+            return
+        self._token_refresh = asyncio.get_running_loop().call_later(
+            refresh_in, self._refresh_token
+        )
+
+    def _refresh_token(self) -> None:
+        """Start a background login."""
+        self._token_refresh = None
+        if self._login_task is not None and not self._login_task.done():
+            return
+        self._login_task = asyncio.create_task(self._login())
+        self._login_task.add_done_callback(self._log_token_refresh)
+
+    def _log_token_refresh(self, task: asyncio.Task[bool]) -> None:
+        """Log a failed background login."""
+        if task.cancelled():
+            return
+        if (exp := task.exception()) is not None or not task.result():
+            self._logger.warning("Unable to refresh Fenotek token: %s", exp)
+
     async def get_doorbells(self) -> VisiophonesResponse:
         """Get list of doorbell IDs."""
         json_res = cast(
@@ -120,20 +485,41 @@ class FenotekClient:
         """Get doorbell data."""
         json_res = cast(
             VisiophoneResponse,
-            await self._http_request("get", FENOTEK_VISIONPHONE.format(doorbell_id)),
+            await self._http_request(
+                "get",
+                FENOTEK_VISIONPHONE.format(doorbell_id),
+                endpoint=FENOTEK_VISIONPHONE,
+            ),
         )
         return json_res
 
+    async def get_doorbell_if_changed(
+        self, doorbell_id: str, fingerprint: bytes | None
+    ) -> tuple[VisiophoneResponse | None, bytes]:
+        """Get doorbell data and its fingerprint.
+
+        The data is None if its fingerprint is `fingerprint`. The caller
+        keeps the fingerprint once the data has been handled.
+        """
+        json_res, new_fingerprint = await self._get_if_changed(
+            FENOTEK_VISIONPHONE.format(doorbell_id), fingerprint, FENOTEK_VISIONPHONE
+        )
+        return cast(VisiophoneResponse | None, json_res), new_fingerprint
+
     async def ping(self, doorbell_id: str) -> bool:
         """Ping doorbell."""
         try:
             json_res = cast(
                 PingResponse,
                 await self._http_request(
-                    method="post", path=FENOTEK_PING.format(doorbell_id), data={}
+                    method="post",
+                    path=FENOTEK_PING.format(doorbell_id),
+                    data={},
+                    retry=True,
+                    endpoint=FENOTEK_PING,
                 ),
             )
-        except Exception:
+        except FenotekError:
             return False
         return bool(json_res.get("success", False))
 
@@ -142,9 +528,44 @@ class FenotekClient:
         json_res = cast(
             VisiophoneHomeResponse,
             await self._http_request(
-                "get", path=FENOTEK_VISIONPHONE_HOME.format(doorbell_id)
+                "get",
+                path=FENOTEK_VISIONPHONE_HOME.format(doorbell_id),
+                endpoint=FENOTEK_VISIONPHONE_HOME,
             ),
         )
+        return await self._resolve_home_video_url(json_res)
+
+    async def home_if_changed(
+        self, doorbell_id: str, fingerprint: bytes | None
+    ) -> tuple[VisiophoneHomeResponse | None, bytes]:
+        """Get doorbell home data and its fingerprint.
+
+        The data is None if its fingerprint is `fingerprint`. The caller
+        keeps the fingerprint once the data has been handled, so data whose
+        video url could not be resolved is fetched again.
+        """
+        json_res, new_fingerprint = await self._get_if_changed(
+            FENOTEK_VISIONPHONE_HOME.format(doorbell_id),
+            fingerprint,
+            FENOTEK_VISIONPHONE_HOME,
+        )
+        if json_res is None:
+            return None, new_fingerprint
+        return (
+            await self._resolve_home_video_url(cast(VisiophoneHomeResponse, json_res)),
+            new_fingerprint,
+        )
+
+    async def _resolve_home_video_url(
+        self, json_res: VisiophoneHomeResponse
+    ) -> VisiophoneHomeResponse:
+        """Set the video url of the home last notification."""
+        # The response may be shared with other callers, do not modify it
+        json_res = json_res.copy()
+        json_res["lastNotification"] = json_res["lastNotification"].copy()
+        json_res["lastNotification"]["detail"] = json_res["lastNotification"][
+            "detail"
+        ].copy()
         json_res["lastNotification"]["detail"]["videoUrl"] = ""
         if json_res.get("lastNotification", {}).get("detail", {}).get("type") == 5:
             # TODO: detail what id notification type 5
@@ -167,6 +588,7 @@ class FenotekClient:
             method="post",
             path=FENOTEK_DRYCONTACT_ACTIVATE.format(doorbell_id, drycontact_id),
             data=data,
+            endpoint=FENOTEK_DRYCONTACT_ACTIVATE,
         )
 
         if json_res.get("error"):
@@ -178,21 +600,188 @@ class FenotekClient:
             return False
         return bool(json_res.get("success", False))
 
-    async def fetch_url(self, url: str) -> bytes:
+    async def fetch_url(
+        self, url: str, max_size: int | None = FENOTEK_MEDIA_MAX_SIZE
+    ) -> bytes:
         """Fetch a basic url raw data."""
-        res = await self._websession.get(url)
-        content = await res.read()
-        return content
+        return b"".join([chunk async for chunk in self.stream_url(url, max_size)])
 
-    async def notifications(
-        self, doorbell_id: str
-    ) -> list[VisiophoneHomeNotificationResponse]:
-        """Get doorbell notifications."""
-        json_res = cast(
+    async def stream_url(
+        self,
+        url: str,
+        max_size: int | None = FENOTEK_MEDIA_MAX_SIZE,
+        chunk_size: int = FENOTEK_MEDIA_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream the raw data of a url by chunks.
+
+        Raise `FenotekMediaTooLargeError` when the data is bigger than
+        `max_size`, before downloading it when the server sends its
+        Content-Length. The response is released when the iteration ends.
+        The request is reported to the metrics hooks under `MEDIA_ENDPOINT`,
+        once the iteration ends.
+        """
+        start = time.perf_counter()
+        received = 0
+        outcome = OUTCOME_FAILURE
+        try:
+            if self._hub is not None:
+                await self._hub.throttle()
+            async with self._websession.get(url) as res:
+                if res.status != 200:
+                    raise self._status_error(res)
+                if (
+                    max_size is not None
+                    and res.content_length is not None
+                    and res.content_length > max_size
+                ):
+                    raise FenotekMediaTooLargeError(
+                        f"{url} is {res.content_length} bytes, more than {max_size}"
+                    )
+                async for chunk in res.content.iter_chunked(chunk_size):
+                    received += len(chunk)
+                    if max_size is not None and received > max_size:
+                        raise FenotekMediaTooLargeError(
+                            f"{url} is more than {max_size} bytes"
+                        )
+                    yield chunk
+            outcome = OUTCOME_SUCCESS
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exp:
+            raise FenotekTransientError(f"get {url} failed: {exp!r}") from exp
+        finally:
+            self._record_request(MEDIA_ENDPOINT, outcome, start, received)
+
+    async def download_to_file(
+        self,
+        url: str,
+        path: str | os.PathLike[str],
+        max_size: int | None = FENOTEK_MEDIA_MAX_SIZE,
+    ) -> int:
+        """Download the raw data of a url to a file, return its size.
+
+        Data is written to a temporary file, moved to `path` once complete.
+        """
+        path = os.fspath(path)
+        tmp_path = f"{path}.part"
+        loop = asyncio.get_running_loop()
+        file: IO[bytes] = await loop.run_in_executor(None, open, tmp_path, "wb")
+        size = 0
+        try:
+            # Release the response as soon as the writing fails
+            async with aclosing(self.stream_url(url, max_size)) as chunks:
+                async for chunk in chunks:
+                    await loop.run_in_executor(None, file.write, chunk)
+                    size += len(chunk)
+        except BaseException:
+            await loop.run_in_executor(None, _discard_file, file, tmp_path)
+            raise
+        await loop.run_in_executor(None, _finish_file, file, tmp_path, path)
+        return size
+
+    async def stream_to(
+        self,
+        url: str,
+        writer: MediaWriter,
+        max_size: int | None = FENOTEK_MEDIA_MAX_SIZE,
+    ) -> int:
+        """Stream the raw data of a url to a writer, return its size."""
+        size = 0
+        async with aclosing(self.stream_url(url, max_size)) as chunks:
+            async for chunk in chunks:
+                await writer.write(chunk)
+                size += len(chunk)
+        return size
+
+    async def _notifications_page(
+        self, doorbell_id: str, page: int | None = None
+    ) -> VisiophonesNotificationsResponse:
+        """Get a page of doorbell notifications, the first one by default."""
+        path = FENOTEK_VISIONPHONE_NOTIFICATIONS.format(doorbell_id)
+        if page is not None:
+            path += f"?page={page}"
+        return cast(
             VisiophonesNotificationsResponse,
             await self._http_request(
-                method="get",
-                path=FENOTEK_VISIONPHONE_NOTIFICATIONS.format(doorbell_id),
+                method="get", path=path, endpoint=FENOTEK_VISIONPHONE_NOTIFICATIONS
             ),
         )
+
+    async def notifications_page_if_changed(
+        self, doorbell_id: str, fingerprint: bytes | None
+    ) -> tuple[VisiophonesNotificationsResponse | None, bytes]:
+        """Get the first page of doorbell notifications and its fingerprint.
+
+        The page is None if its fingerprint is `fingerprint`. The caller
+        keeps the fingerprint, and only once the page has been handled, so
+        a page is not skipped because its handling failed.
+        """
+        json_res, new_fingerprint = await self._get_if_changed(
+            FENOTEK_VISIONPHONE_NOTIFICATIONS.format(doorbell_id),
+            fingerprint,
+            FENOTEK_VISIONPHONE_NOTIFICATIONS,
+        )
+        return cast(VisiophonesNotificationsResponse | None, json_res), new_fingerprint
+
+    async def notifications(
+        self, doorbell_id: str
+    ) -> list[VisiophoneHomeNotificationResponse]:
+        """Get doorbell notifications."""
+        json_res = await self._notifications_page(doorbell_id)
         return json_res["notifications"]
+
+    async def iter_notifications(
+        self,
+        doorbell_id: str,
+        known_ids: Container[str] = (),
+        max_pages: int | None = None,
+        prefetch: int = 0,
+        first_page: VisiophonesNotificationsResponse | None = None,
+    ) -> AsyncIterator[list[VisiophoneHomeNotificationResponse]]:
+        """Iterate over doorbell notifications pages, most recent page first.
+
+        Pages are fetched lazily. Iteration stops after the first page
+        holding an ID from `known_ids`, only yielding its unknown
+        notifications, or after `max_pages` pages.
+        With `prefetch`, up to that many next pages are fetched in the
+        background while the current one is consumed.
+        The first page is fetched unless given as `first_page`.
+        """
+        if first_page is None:
+            first_page = await self._notifications_page(doorbell_id)
+        # Do not assume whether pages are numbered from 0 or 1
+        first_index = first_page.get("page", 1)
+        last_index = first_index + first_page.get("pages", 1) - 1
+        if max_pages is not None:
+            last_index = min(last_index, first_index + max_pages - 1)
+
+        pending: dict[int, asyncio.Task[VisiophonesNotificationsResponse]] = {}
+        try:
+            index = first_index
+            json_res: VisiophonesNotificationsResponse | None = first_page
+            while json_res is not None:
+                notifications = json_res["notifications"]
+                unknown = [
+                    notification
+                    for notification in notifications
+                    if notification["_id"] not in known_ids
+                ]
+                last = len(unknown) != len(notifications) or index >= last_index
+                if not last:
+                    # Fetched while the current page is consumed
+                    for next_index in range(
+                        index + 1, min(index + prefetch, last_index) + 1
+                    ):
+                        if next_index not in pending:
+                            pending[next_index] = asyncio.create_task(
+                                self._notifications_page(doorbell_id, next_index)
+                            )
+                yield unknown
+                if last:
+                    return
+                index += 1
+                if index in pending:
+                    json_res = await pending.pop(index)
+                else:
+                    json_res = await self._notifications_page(doorbell_id, index)
+        finally:
+            for task in pending.values():
+                task.cancel()
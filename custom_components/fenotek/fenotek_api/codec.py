@@ -0,0 +1,119 @@
+"""JSON decoding and response projection module.
+
+The fastest available JSON backend is used: orjson, then msgspec, then the
+standard library. Responses are projected down to the fields the doorbell,
+dry contact and notification objects read, so the rest is not kept in
+memory.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from .consts import (
+    FENOTEK_VISIONPHONE,
+    FENOTEK_VISIONPHONE_HOME,
+    FENOTEK_VISIONPHONE_NOTIFICATIONS,
+)
+
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+    loads: Callable[[bytes], Any] = orjson.loads
+    DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError,)
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        loads = msgspec.json.Decoder().decode
+        DECODE_ERRORS = (msgspec.DecodeError,)
+    except ImportError:
+        JSON_BACKEND = "json"
+        loads = json.loads
+        DECODE_ERRORS = (ValueError,)
+
+DOORBELL_FIELDS = frozenset(
+    (
+        "_id",
+        "connectionType",
+        "description",
+        "dryContacts",
+        "hiVersion",
+        "isInStandBy",
+        "isTurnedOn",
+        "lastPing",
+        "major",
+        "minor",
+        "suspended",
+    )
+)
+DRY_CONTACT_FIELDS = frozenset(
+    ("_id", "commandId", "delay", "icon", "isOnHold", "name")
+)
+HOME_FIELDS = frozenset(("lastNotification", "mediaUrl", "vuid"))
+NOTIFICATION_FIELDS = frozenset(("_id", "createdAt", "detail", "type"))
+NOTIFICATIONS_PAGE_FIELDS = frozenset(("notifications", "page", "pages"))
+
+
+def _pick(raw: dict[str, Any], fields: frozenset[str]) -> dict[str, Any]:
+    """Keep only `fields` of a JSON object."""
+    return {key: value for key, value in raw.items() if key in fields}
+
+
+def project_doorbell(raw: dict[str, Any]) -> dict[str, Any]:
+    """Project a doorbell response."""
+    projected = _pick(raw, DOORBELL_FIELDS)
+    if "dryContacts" in projected:
+        projected["dryContacts"] = [
+            _pick(dry_contact, DRY_CONTACT_FIELDS)
+            for dry_contact in projected["dryContacts"]
+        ]
+    return projected
+
+
+def project_notification(raw: dict[str, Any]) -> dict[str, Any]:
+    """Project a notification."""
+    return _pick(raw, NOTIFICATION_FIELDS)
+
+
+def project_home(raw: dict[str, Any]) -> dict[str, Any]:
+    """Project a doorbell home response."""
+    projected = _pick(raw, HOME_FIELDS)
+    if projected.get("lastNotification"):
+        projected["lastNotification"] = project_notification(
+            projected["lastNotification"]
+        )
+    return projected
+
+
+def project_notifications_page(raw: dict[str, Any]) -> dict[str, Any]:
+    """Project a doorbell notifications page response."""
+    projected = _pick(raw, NOTIFICATIONS_PAGE_FIELDS)
+    if "notifications" in projected:
+        projected["notifications"] = [
+            project_notification(notification)
+            for notification in projected["notifications"]
+        ]
+    return projected
+
+
+# Projection of the responses, by endpoint
+PROJECTIONS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    FENOTEK_VISIONPHONE: project_doorbell,
+    FENOTEK_VISIONPHONE_HOME: project_home,
+    FENOTEK_VISIONPHONE_NOTIFICATIONS: project_notifications_page,
+}
+
+
+def decode(body: bytes, endpoint: str | None = None) -> Any:
+    """Decode a JSON body, projected according to its endpoint.
+
+    Raise one of `DECODE_ERRORS` if the body is not valid JSON.
+    """
+    json_res = loads(body)
+    projection = PROJECTIONS.get(endpoint) if endpoint is not None else None
+    if projection is not None and isinstance(json_res, dict):
+        json_res = projection(json_res)
+    return json_res
@@ -0,0 +1,56 @@
+"""Concurrency helpers module."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+
+async def run_bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[_T]) -> _T:
+    """Await `awaitable` once a slot of `semaphore` is available."""
+    async with semaphore:
+        return await awaitable
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[_T]],
+    semaphore: asyncio.Semaphore,
+) -> list[_T | BaseException]:
+    """Run awaitables concurrently, never more than `semaphore` allows at a time.
+
+    Results are returned in the input order. Exceptions are returned in place
+    of the result instead of being raised, so each one can be reported
+    per request.
+    """
+    return await asyncio.gather(
+        *(run_bounded(semaphore, awaitable) for awaitable in awaitables),
+        return_exceptions=True,
+    )
+
+
+class SingleFlight(Generic[_K, _T]):
+    """Share one run between concurrent calls made with the same key.
+
+    The first call for a key starts the run, the calls made while it is in
+    flight wait for the same result, or exception. A caller being cancelled
+    does not cancel the run for the others.
+    """
+
+    def __init__(self) -> None:
+        """Single flight class constructor."""
+        self._in_flight: dict[_K, asyncio.Future[_T]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Is a run in flight for this key."""
+        return key in self._in_flight
+
+    async def run(self, key: _K, factory: Callable[[], Awaitable[_T]]) -> _T:
+        """Return the result of `factory()`, shared with concurrent callers."""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
@@ -9,3 +9,82 @@ FENOTEK_DRYCONTACTS = "/visiophones/{}/drycontacts"
 FENOTEK_PING = "/visiophones/{}/ping"
 FENOTEK_DRYCONTACT_ACTIVATE = "/visiophones/{}/drycontacts/{}/activate"
 FENOTEK_VISIONPHONE_NOTIFICATIONS = "/visiophones/{}/notifications"
+
+# Maximum number of concurrent HTTP requests issued by a single doorbell update
+FENOTEK_DOORBELL_MAX_CONCURRENCY = 4
+# Maximum number of doorbells updated at the same time by an account update
+FENOTEK_ACCOUNT_MAX_CONCURRENCY = 8
+# Limits shared by all accounts using a hub: requests per second, burst size
+# and maximum number of concurrent API requests
+FENOTEK_HUB_RATE = 10
+FENOTEK_HUB_BURST = 50
+FENOTEK_HUB_MAX_CONCURRENCY = 16
+# Time in seconds after which a single doorbell update is abandoned
+FENOTEK_DOORBELL_UPDATE_TIMEOUT = 15
+# Maximum number of notifications kept in memory per doorbell
+FENOTEK_NOTIFICATIONS_MAX_SIZE = 500
+# Time in seconds a resolved call video url is kept when it has no known expiry
+FENOTEK_RESOLVED_URL_TTL = 3600
+# Time in seconds before a signed url expiry at which it is resolved again
+FENOTEK_RESOLVED_URL_EXPIRY_MARGIN = 60
+# Maximum number of notification pages walked by an incremental sync
+FENOTEK_NOTIFICATIONS_MAX_PAGES = 10
+# Number of notification pages fetched ahead during a backfill
+FENOTEK_NOTIFICATIONS_PREFETCH = 2
+# Number of most recent calls of each kind whose video url is kept resolved
+FENOTEK_RESOLVED_URL_RECENT_CALLS = 20
+# Age in seconds, beyond the doorbell data refresh interval which brings the
+# last ping date, after which an inferred availability needs an active ping
+FENOTEK_AVAILABILITY_MAX_AGE = 5 * 60
+# Number of most recent notifications saved in a doorbell snapshot
+FENOTEK_SNAPSHOT_NOTIFICATIONS = 100
+
+# Doorbell data slices, used to report what changed after an update
+FENOTEK_SLICE_DOORBELL = "doorbell"
+FENOTEK_SLICE_HOME = "home"
+FENOTEK_SLICE_NOTIFICATIONS = "notifications"
+FENOTEK_SLICE_AVAILABILITY = "availability"
+
+# Minimum time in seconds between two refreshes of a doorbell data slice.
+# Slices without an interval are refreshed on every update.
+FENOTEK_SLICE_INTERVALS = {
+    FENOTEK_SLICE_DOORBELL: 15 * 60,
+    FENOTEK_SLICE_AVAILABILITY: 60,
+}
+FENOTEK_SLICES = (
+    FENOTEK_SLICE_DOORBELL,
+    FENOTEK_SLICE_HOME,
+    FENOTEK_SLICE_NOTIFICATIONS,
+    FENOTEK_SLICE_AVAILABILITY,
+)
+
+# Attempts made for a retryable request, and backoff delays in seconds
+FENOTEK_RETRY_ATTEMPTS = 3
+FENOTEK_RETRY_BASE_DELAY = 0.5
+FENOTEK_RETRY_MAX_DELAY = 10
+# Consecutive failures opening the circuit breaker, and seconds it stays open
+FENOTEK_CIRCUIT_FAILURE_THRESHOLD = 5
+FENOTEK_CIRCUIT_RESET_TIMEOUT = 30
+# Seconds before the token expiry at which it is refreshed in the background
+FENOTEK_TOKEN_REFRESH_MARGIN = 5 * 60
+
+# Hosts, with their subdomains, notification media urls may point to,
+# besides the backend one. Pushed notifications with other urls are ignored.
+FENOTEK_MEDIA_HOSTS = ("fenotek.net", "amazonaws.com")
+# Media downloads: chunk size and maximum size in bytes
+FENOTEK_MEDIA_CHUNK_SIZE = 64 * 1024
+FENOTEK_MEDIA_MAX_SIZE = 100 * 1024 * 1024
+# Memory budget in bytes of the snapshot cache, and maximum size of a snapshot
+FENOTEK_SNAPSHOT_CACHE_MAX_BYTES = 20 * 1024 * 1024
+FENOTEK_SNAPSHOT_MAX_SIZE = 5 * 1024 * 1024
+# Memory budget in bytes of the video frame cache, and maximum number of
+# concurrent frame extractions per doorbell
+FENOTEK_FRAME_CACHE_MAX_BYTES = 10 * 1024 * 1024
+FENOTEK_FRAME_MAX_CONCURRENCY = 1
+# Local media archive: maximum age in seconds, total size in bytes and
+# number of concurrent downloads
+FENOTEK_ARCHIVE_MAX_AGE = 30 * 24 * 3600
+FENOTEK_ARCHIVE_MAX_BYTES = 1024 * 1024 * 1024
+FENOTEK_ARCHIVE_MAX_CONCURRENCY = 2
+# Size in bytes from which JSON responses are decoded in an executor
+FENOTEK_DECODE_EXECUTOR_MIN_SIZE = 256 * 1024
@@ -1,13 +1,38 @@
 """Doorbell module."""
 
+import asyncio
+import time
+from collections.abc import Collection, Mapping
+from typing import Any
+
 from .api_reponse import (
     VisiophoneHomeNotificationResponse,
     VisiophoneHomeResponse,
     VisiophoneResponse,
 )
+from .availability import AvailabilityEstimator
 from .client import FenotekClient
+from .concurrency import gather_bounded, run_bounded
+from .consts import (
+    FENOTEK_AVAILABILITY_MAX_AGE,
+    FENOTEK_DOORBELL_MAX_CONCURRENCY,
+    FENOTEK_NOTIFICATIONS_MAX_PAGES,
+    FENOTEK_NOTIFICATIONS_PREFETCH,
+    FENOTEK_RESOLVED_URL_RECENT_CALLS,
+    FENOTEK_SLICE_AVAILABILITY,
+    FENOTEK_SLICE_DOORBELL,
+    FENOTEK_SLICE_HOME,
+    FENOTEK_SLICE_INTERVALS,
+    FENOTEK_SLICE_NOTIFICATIONS,
+    FENOTEK_SLICES,
+    FENOTEK_SNAPSHOT_NOTIFICATIONS,
+)
 from .dry_contact import DryContact
+from .exceptions import FenotekUpdateError
 from .notification import Notification, NotificationSubType
+from .notification_store import NotificationStore
+from .scheduler import TieredScheduler
+from .url_cache import ResolvedUrlCache
 
 
 class Doorbell:
@@ -17,48 +42,330 @@ class Doorbell:
     _raw_home: VisiophoneHomeResponse
     _raw_notifications: list[VisiophoneHomeNotificationResponse]
 
-    def __init__(self, fenotek_client: FenotekClient, id_: str) -> None:
+    def __init__(
+        self,
+        fenotek_client: FenotekClient,
+        id_: str,
+        slice_intervals: Mapping[str, float] = FENOTEK_SLICE_INTERVALS,
+    ) -> None:
         """Doorbell class constructor."""
         self._fenotek_client = fenotek_client
         self.id_ = id_
         self._camera = None
         self._dry_contacts: list[DryContact] = []
-        self._available = False
-        self._notifications: list[Notification] = []
-
-    async def update(self) -> None:
-        """Update doorbell data."""
-        self._raw_data = await self._fenotek_client.get_doorbell(self.id_)
-        self._raw_home = await self._fenotek_client.home(self.id_)
-        self._raw_notifications = await self._fenotek_client.notifications(self.id_)
-        self._notifications = []
-        i = 0
-        for raw_notification in self._raw_notifications:
-            notification = Notification.new(self._fenotek_client, raw_notification)
-            if notification.sub_type in (
-                NotificationSubType.ANSWERED_CALL,
-                NotificationSubType.MISSED_CALL,
-            ):
-                await notification.fetch_details_url()
-            self._notifications.append(notification)
-            i += 1
-        self._notifications.sort(key=lambda x: x.created_at)
-
-        if not self._dry_contacts:
+        # The last ping date comes with the doorbell data, so the estimate
+        # must last until the next refresh of that slice
+        self._availability = AvailabilityEstimator(
+            slice_intervals.get(FENOTEK_SLICE_DOORBELL, 0)
+            + FENOTEK_AVAILABILITY_MAX_AGE
+        )
+        self._notifications = NotificationStore(fenotek_client)
+        self._new_notifications: list[Notification] = []
+        # Fingerprints of the last handled response of each slice
+        self._data_fingerprint: bytes | None = None
+        self._home_fingerprint: bytes | None = None
+        self._notifications_fingerprint: bytes | None = None
+        self._video_urls = ResolvedUrlCache()
+        self._changes: set[str] = set()
+        self._scheduler = TieredScheduler(FENOTEK_SLICES, slice_intervals)
+
+    @property
+    def scheduler(self) -> TieredScheduler:
+        """Doorbell data slices refresh scheduler."""
+        return self._scheduler
+
+    def due_slices(self) -> set[str]:
+        """Return the data slices which are due for a refresh."""
+        return self._scheduler.due()
+
+    async def update(
+        self,
+        max_concurrency: int = FENOTEK_DOORBELL_MAX_CONCURRENCY,
+        slices: Collection[str] | None = None,
+    ) -> None:
+        """Update doorbell data.
+
+        The doorbell, home and notifications endpoints, or only those in
+        `slices`, are fetched concurrently, then the call details urls which
+        are not cached yet or expired, never running more than
+        `max_concurrency` requests at the same time.
+        Data from the requests which succeeded is kept, failures are raised
+        together as a `FenotekUpdateError`.
+        Responses which did not change since the previous update are not
+        parsed again, the data slices which did change are available in
+        `changes` until the next update.
+        Only notifications not seen before are parsed, they are available
+        in `new_notifications` until the next update.
+        The fetch and call details phases are timed as the `doorbell.fetch`
+        and `doorbell.calls` metrics phases.
+        """
+        self._new_notifications = []
+        self._changes = set()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        errors: dict[str, BaseException] = {}
+
+        if slices is None:
+            slices = FENOTEK_SLICES
+        with self._fenotek_client.record_phase("doorbell.fetch"):
+            fetched_data, fetched_home, fetched_notifications = await asyncio.gather(
+                run_bounded(
+                    semaphore, self._fetch_data(FENOTEK_SLICE_DOORBELL in slices)
+                ),
+                run_bounded(semaphore, self._fetch_home(FENOTEK_SLICE_HOME in slices)),
+                run_bounded(
+                    semaphore,
+                    self._fetch_new_notifications(
+                        FENOTEK_SLICE_NOTIFICATIONS in slices
+                    ),
+                ),
+                return_exceptions=True,
+            )
+        if isinstance(fetched_data, BaseException):
+            self._data_fingerprint = None
+            errors[FENOTEK_SLICE_DOORBELL] = fetched_data
+        elif fetched_data is not None:
+            raw_data, fingerprint = fetched_data
+            if raw_data is not None:
+                self._raw_data = raw_data
+                self._availability.observe_doorbell(raw_data)
+                self._changes.add(FENOTEK_SLICE_DOORBELL)
+            self._data_fingerprint = fingerprint
+        if isinstance(fetched_home, BaseException):
+            self._home_fingerprint = None
+            errors[FENOTEK_SLICE_HOME] = fetched_home
+        elif fetched_home is not None:
+            raw_home, fingerprint = fetched_home
+            if raw_home is not None:
+                self._raw_home = raw_home
+                self._changes.add(FENOTEK_SLICE_HOME)
+            self._home_fingerprint = fingerprint
+        if isinstance(fetched_notifications, BaseException):
+            # Fetch the first page again next time, even if unchanged
+            self._notifications_fingerprint = None
+            errors[FENOTEK_SLICE_NOTIFICATIONS] = fetched_notifications
+        elif fetched_notifications is not None:
+            raw_notifications, fingerprint = fetched_notifications
+            self._raw_notifications = raw_notifications
+            self._new_notifications = self._notifications.ingest(raw_notifications)
+            self._notifications_fingerprint = fingerprint
+            self._availability.observe_notifications(self._new_notifications)
+            if self._new_notifications:
+                self._changes.add(FENOTEK_SLICE_NOTIFICATIONS)
+            calls = [
+                notification
+                for sub_type in (
+                    NotificationSubType.ANSWERED_CALL,
+                    NotificationSubType.MISSED_CALL,
+                )
+                for notification in self._notifications.by_sub_type(sub_type)[
+                    -FENOTEK_RESOLVED_URL_RECENT_CALLS:
+                ]
+                if not self._video_urls.is_fresh(notification.id_)
+            ]
+            with self._fenotek_client.record_phase("doorbell.calls"):
+                results = await gather_bounded(
+                    (call.with_video_url() for call in calls), semaphore
+                )
+            for call, result in zip(calls, results):
+                if isinstance(result, BaseException):
+                    errors[f"details {call.id_}"] = result
+                elif result.video_url != result.url:
+                    if result.video_url != self._video_urls.get(call.id_):
+                        self._changes.add(FENOTEK_SLICE_NOTIFICATIONS)
+                    self._video_urls.set(call.id_, result.video_url)
+                    self._notifications.replace(result)
+            # New calls may have been replaced by their resolved record
+            self._new_notifications = [
+                self._notifications.get(notification.id_) or notification
+                for notification in self._new_notifications
+            ]
+            self._video_urls.prune(self._notifications)
+
+        self._build_dry_contacts()
+
+        self._scheduler.mark_refreshed(
+            slice_
+            for slice_ in (
+                FENOTEK_SLICE_DOORBELL,
+                FENOTEK_SLICE_HOME,
+                FENOTEK_SLICE_NOTIFICATIONS,
+            )
+            if slice_ in slices and slice_ not in errors
+        )
+        if errors:
+            raise FenotekUpdateError(self.id_, errors)
+
+    def _build_dry_contacts(self) -> None:
+        """Create the dry contacts from the doorbell data, once."""
+        if not self._dry_contacts and hasattr(self, "_raw_data"):
             for dry_contact_data in self._raw_data["dryContacts"]:
                 self._dry_contacts.append(
                     DryContact(self._fenotek_client, self.id_, dry_contact_data)
                 )
 
+    def snapshot(self) -> dict[str, Any]:
+        """Last known data, JSON serializable, to be given to `restore`.
+
+        Only the most recent notifications are kept. Their IDs are enough
+        for the next update to only fetch the notifications received since.
+        """
+        snapshot: dict[str, Any] = {
+            "available": self._availability.available,
+            "notifications": [
+                notification.as_raw()
+                for notification in list(self._notifications)[
+                    -FENOTEK_SNAPSHOT_NOTIFICATIONS:
+                ]
+            ],
+        }
+        if hasattr(self, "_raw_data"):
+            snapshot["data"] = self._raw_data
+        if hasattr(self, "_raw_home"):
+            snapshot["home"] = self._raw_home
+        return snapshot
+
+    def restore(self, snapshot: Mapping[str, Any]) -> None:
+        """Load the data of a `snapshot`, without any request.
+
+        Every data slice is still due for a refresh, and the saved
+        availability is stale until confirmed.
+        """
+        if "data" in snapshot:
+            self._raw_data = snapshot["data"]
+            self._build_dry_contacts()
+        if "home" in snapshot:
+            self._raw_home = snapshot["home"]
+        self._notifications.ingest(snapshot.get("notifications", []))
+        self._availability.observe(bool(snapshot.get("available", False)), 0)
+
+    async def _fetch_data(
+        self, refresh: bool
+    ) -> tuple[VisiophoneResponse | None, bytes] | None:
+        """Fetch the doorbell data and its fingerprint, None if not refreshed.
+
+        The data is None if it did not change since it was last handled.
+        """
+        if not refresh:
+            return None
+        return await self._fenotek_client.get_doorbell_if_changed(
+            self.id_, self._data_fingerprint
+        )
+
+    async def _fetch_home(
+        self, refresh: bool
+    ) -> tuple[VisiophoneHomeResponse | None, bytes] | None:
+        """Fetch the doorbell home data and its fingerprint, None if not refreshed.
+
+        The data is None if it did not change since it was last handled.
+        """
+        if not refresh:
+            return None
+        return await self._fenotek_client.home_if_changed(
+            self.id_, self._home_fingerprint
+        )
+
+    async def _fetch_new_notifications(
+        self, refresh: bool
+    ) -> tuple[list[VisiophoneHomeNotificationResponse], bytes] | None:
+        """Fetch the notifications more recent than the known ones.
+
+        Only the first page is fetched when no notification is known yet,
+        nothing is returned when it did not change since the last ingest.
+        Return the notifications with the first page fingerprint, to be
+        kept once they are ingested, None if not refreshed.
+        """
+        if not refresh:
+            return None
+        first_page, fingerprint = (
+            await self._fenotek_client.notifications_page_if_changed(
+                self.id_, self._notifications_fingerprint
+            )
+        )
+        if first_page is None:
+            return [], fingerprint
+        max_pages = FENOTEK_NOTIFICATIONS_MAX_PAGES if self._notifications else 1
+        raw_notifications: list[VisiophoneHomeNotificationResponse] = []
+        async for page in self._fenotek_client.iter_notifications(
+            self.id_,
+            known_ids=self._notifications,
+            max_pages=max_pages,
+            first_page=first_page,
+        ):
+            raw_notifications.extend(page)
+        return raw_notifications, fingerprint
+
+    async def ingest_pushed(
+        self, raw_notifications: list[VisiophoneHomeNotificationResponse]
+    ) -> list[Notification]:
+        """Add pushed notifications and return the new ones, oldest first.
+
+        The video url of new calls is resolved right away, failures are
+        left to the next update.
+        """
+        added = self._notifications.ingest(raw_notifications)
+        self._availability.observe_notifications(added)
+        calls = [
+            notification
+            for notification in added
+            if notification.sub_type
+            in (NotificationSubType.ANSWERED_CALL, NotificationSubType.MISSED_CALL)
+        ]
+        results = await asyncio.gather(
+            *(call.with_video_url() for call in calls), return_exceptions=True
+        )
+        for call, result in zip(calls, results):
+            if not isinstance(result, BaseException) and result.video_url != result.url:
+                self._video_urls.set(call.id_, result.video_url)
+                self._notifications.replace(result)
+        return [
+            self._notifications.get(notification.id_) or notification
+            for notification in added
+        ]
+
+    async def backfill(
+        self,
+        max_pages: int | None = None,
+        prefetch: int = FENOTEK_NOTIFICATIONS_PREFETCH,
+    ) -> list[Notification]:
+        """Walk the notifications history and add the missing notifications.
+
+        Up to `prefetch` pages are fetched ahead. Return the added
+        notifications. Updates do not run it, it is meant to be called on
+        demand.
+        """
+        added: list[Notification] = []
+        async for page in self._fenotek_client.iter_notifications(
+            self.id_, max_pages=max_pages, prefetch=prefetch
+        ):
+            added.extend(self._notifications.ingest(page))
+        return added
+
     async def ping(self) -> bool:
         """Doorbell ping."""
-        self._available = await self._fenotek_client.ping(self.id_)
-        return self._available
+        available = await self._fenotek_client.ping(self.id_)
+        self._availability.observe(available, time.time())
+        self._scheduler.mark_refreshed((FENOTEK_SLICE_AVAILABILITY,))
+        return available
+
+    @property
+    def availability(self) -> AvailabilityEstimator:
+        """Doorbell availability inferred from its data and pings."""
+        return self._availability
+
+    @property
+    def changes(self) -> set[str]:
+        """Data slices which changed during the last update."""
+        return self._changes
 
     @property
     def available(self) -> bool:
         """Doorbell available."""
-        return self._available
+        return self._availability.available
+
+    @property
+    def loaded(self) -> bool:
+        """Was the doorbell data loaded at least once."""
+        return hasattr(self, "_raw_data")
 
     @property
     def dry_contacts(self) -> list[DryContact]:
@@ -104,91 +411,68 @@ class Doorbell:
     @property
     def calls(self) -> list[Notification]:
         """Return all the answered call notifications."""
-        return [
-            notif
-            for notif in self._notifications
-            if notif.sub_type == NotificationSubType.ANSWERED_CALL
-        ]
+        return self._notifications.by_sub_type(NotificationSubType.ANSWERED_CALL)
 
     @property
     def last_call(self) -> Notification | None:
         """Return the last answered call notification."""
-        if self.calls:
-            return self.calls[-1]
-        return None
+        return self._notifications.last_by_sub_type(NotificationSubType.ANSWERED_CALL)
 
     @property
     def missed_calls(self) -> list[Notification]:
         """Return all the missed call notifications."""
-        return [
-            notif
-            for notif in self._notifications
-            if notif.sub_type == NotificationSubType.MISSED_CALL
-        ]
+        return self._notifications.by_sub_type(NotificationSubType.MISSED_CALL)
 
     @property
     def last_missed_call(self) -> Notification | None:
         """Return the last missed call notification."""
-        if self.missed_calls:
-            return self.missed_calls[-1]
-        return None
+        return self._notifications.last_by_sub_type(NotificationSubType.MISSED_CALL)
 
     @property
     def activations(self) -> list[Notification]:
         """Return all the activate notifications."""
-        return [
-            notif
-            for notif in self._notifications
-            if notif.sub_type == NotificationSubType.ACTIVATION
-        ]
+        return self._notifications.by_sub_type(NotificationSubType.ACTIVATION)
 
     @property
     def last_activate(self) -> Notification | None:
         """Return the last activation notification."""
-        if self.activations:
-            return self.activations[-1]
-        return None
+        return self._notifications.last_by_sub_type(NotificationSubType.ACTIVATION)
+
+    def last_activation_by_label(self, label: str) -> Notification | None:
+        """Return the last activation notification of a dry contact label."""
+        return self._notifications.last_activation_by_label(label)
 
     @property
     def notifications(self) -> list[Notification]:
         """Return all notifications."""
         return [notif for notif in self._notifications]
 
+    @property
+    def new_notifications(self) -> list[Notification]:
+        """Return the notifications added by the last update."""
+        return self._new_notifications
+
     @property
     def last_notification(self) -> Notification | None:
         """Return the last notification."""
-        if self.notifications:
-            return self.notifications[-1]
-        return None
+        return self._notifications.last
 
     @property
     def motions(self) -> list[Notification]:
         """Return all the motion notifications."""
-        return [
-            notif
-            for notif in self._notifications
-            if notif.sub_type == NotificationSubType.MOTION_VIDEO
-        ]
+        return self._notifications.by_sub_type(NotificationSubType.MOTION_VIDEO)
 
     @property
     def last_motion(self) -> Notification | None:
         """Return the last motion notification."""
-        if self.motions:
-            return self.motions[-1]
-        return None
+        return self._notifications.last_by_sub_type(NotificationSubType.MOTION_VIDEO)
 
     @property
     def rings(self) -> list[Notification]:
         """Return all the rings notifications."""
-        return [
-            notif
-            for notif in self._notifications
-            if notif.sub_type == NotificationSubType.RING
-        ]
+        return self._notifications.by_sub_type(NotificationSubType.RING)
 
     @property
     def last_ring(self) -> Notification | None:
         """Return the last ring notification."""
-        if self.rings:
-            return self.rings[-1]
-        return None
+        return self._notifications.last_by_sub_type(NotificationSubType.RING)
@@ -0,0 +1,57 @@
+"""Fenotek exceptions module."""
+
+
+class FenotekError(Exception):
+    """Base Fenotek error."""
+
+
+class FenotekAuthError(FenotekError):
+    """The API rejected the credentials or the token."""
+
+
+class FenotekPermanentError(FenotekError):
+    """Request failure which will not go away by retrying it."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Fenotek permanent error constructor."""
+        self.status: int | None = status
+        super().__init__(message)
+
+
+class FenotekTransientError(FenotekError):
+    """Request failure which may go away by retrying it later."""
+
+    def __init__(
+        self,
+        message: str,
+        status: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Fenotek transient error constructor."""
+        self.status: int | None = status
+        # Seconds to wait before retrying, as asked by the backend
+        self.retry_after: float | None = retry_after
+        super().__init__(message)
+
+
+class FenotekRateLimitError(FenotekTransientError):
+    """The API asked to slow down."""
+
+
+class FenotekCircuitOpenError(FenotekTransientError):
+    """Request not sent because the backend is considered down."""
+
+
+class FenotekUpdateError(FenotekError):
+    """One or more requests failed while updating a doorbell."""
+
+    def __init__(self, doorbell_id: str, errors: dict[str, BaseException]) -> None:
+        """Fenotek update error constructor."""
+        self.doorbell_id: str = doorbell_id
+        self.errors: dict[str, BaseException] = errors
+        details = ", ".join(f"{name}: {exp!r}" for name, exp in errors.items())
+        super().__init__(f"Doorbell {doorbell_id} update failed ({details})")
+
+
+class FenotekMediaTooLargeError(FenotekPermanentError):
+    """Media bigger than the allowed maximum size."""
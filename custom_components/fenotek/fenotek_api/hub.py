@@ -0,0 +1,113 @@
+"""Hub module.
+
+A hub is shared by the clients of several accounts, so their requests to
+the backend are bounded together, whatever the number of accounts.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .consts import FENOTEK_HUB_BURST, FENOTEK_HUB_MAX_CONCURRENCY, FENOTEK_HUB_RATE
+
+# Wait in seconds from which a request counts as throttled
+THROTTLED_MIN_WAIT = 0.001
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Tokens are added at `rate` per second, up to `burst`. Waiting callers
+    are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        """Token bucket class constructor."""
+        self._rate: float = rate
+        self._burst: float = burst
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        elapsed = time.monotonic() - self._updated_at
+        return min(self._burst, self._tokens + elapsed * self._rate)
+
+    async def acquire(self) -> float:
+        """Take a token, waiting for one if needed. Return the time waited."""
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class FenotekHub:
+    """Limits shared by the clients of several accounts.
+
+    API requests take a token from a shared bucket, allowing `rate`
+    requests per second with bursts of `burst`, and run at most
+    `max_concurrency` at a time. Media downloads only take a token, since
+    they are held for as long as their reader consumes them.
+    """
+
+    def __init__(
+        self,
+        rate: float = FENOTEK_HUB_RATE,
+        burst: float = FENOTEK_HUB_BURST,
+        max_concurrency: int = FENOTEK_HUB_MAX_CONCURRENCY,
+    ) -> None:
+        """Fenotek hub class constructor."""
+        self._bucket = TokenBucket(rate, burst)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency: int = max_concurrency
+        self._in_flight: int = 0
+        self._requests: int = 0
+        self._throttled: int = 0
+        self._waited: float = 0.0
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """Hold a request slot and a token while the request runs."""
+        start = time.monotonic()
+        async with self._semaphore:
+            await self._bucket.acquire()
+            self._record_wait(time.monotonic() - start)
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    async def throttle(self) -> None:
+        """Take a token for a media download."""
+        self._record_wait(await self._bucket.acquire())
+
+    def _record_wait(self, waited: float) -> None:
+        """Count a request and the time it waited for the limits."""
+        self._requests += 1
+        if waited > THROTTLED_MIN_WAIT:
+            self._throttled += 1
+            self._waited += waited
+
+    def as_dict(self) -> dict[str, Any]:
+        """Hub state and counters."""
+        return {
+            "tokens": self._bucket.tokens,
+            "in_flight": self._in_flight,
+            "max_concurrency": self._max_concurrency,
+            "requests": self._requests,
+            "throttled": self._throttled,
+            "waited": self._waited,
+        }
@@ -0,0 +1,305 @@
+"""Local media archive module."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import astuple, dataclass
+from functools import partial
+
+from .client import FenotekClient
+from .concurrency import SingleFlight, gather_bounded
+from .consts import (
+    FENOTEK_ARCHIVE_MAX_AGE,
+    FENOTEK_ARCHIVE_MAX_BYTES,
+    FENOTEK_ARCHIVE_MAX_CONCURRENCY,
+    FENOTEK_MEDIA_CHUNK_SIZE,
+)
+from .notification import Notification, NotificationSubType
+
+ARCHIVE_INDEX_FILE = "index.json"
+ARCHIVE_INDEX_VERSION = 1
+
+MEDIA_CONTENT_TYPES = {"jpg": "image/jpeg", "mp4": "video/mp4"}
+
+
+@dataclass(frozen=True)
+class ArchivedMedia:
+    """Media of a notification stored in the archive."""
+
+    digest: str
+    extension: str
+    size: int
+    created_at: float
+    doorbell_id: str
+    sub_type: int
+
+    @property
+    def content_type(self) -> str:
+        """Media content type."""
+        return MEDIA_CONTENT_TYPES[self.extension]
+
+    @property
+    def is_video(self) -> bool:
+        """Is the media a video."""
+        return self.extension == "mp4"
+
+
+def notification_media(notification: Notification) -> tuple[str, str] | None:
+    """Return the url and file extension of a notification media, if any."""
+    sub_type = notification.sub_type
+    if sub_type in (NotificationSubType.RING, NotificationSubType.MOTION_IMAGE):
+        return (notification.url, "jpg") if notification.url else None
+    if sub_type == NotificationSubType.MOTION_VIDEO:
+        return (notification.download, "mp4") if notification.download else None
+    if sub_type in (
+        NotificationSubType.ANSWERED_CALL,
+        NotificationSubType.MISSED_CALL,
+    ):
+        # The video url is only known once the details url is resolved
+        if notification.video_url != notification.url:
+            return notification.video_url, "mp4"
+        if notification.download:
+            return notification.download, "mp4"
+    return None
+
+
+def _read_index(path: str) -> dict[str, ArchivedMedia]:
+    """Read the archive index file."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            raw = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if raw.get("version") != ARCHIVE_INDEX_VERSION:
+        return {}
+    return {
+        notification_id: ArchivedMedia(*fields)
+        for notification_id, fields in raw["media"].items()
+    }
+
+
+def _write_index(path: str, media: dict[str, ArchivedMedia]) -> None:
+    """Write the archive index file atomically."""
+    raw = {
+        "version": ARCHIVE_INDEX_VERSION,
+        "media": {
+            notification_id: astuple(archived)
+            for notification_id, archived in media.items()
+        },
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.part"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(raw, file, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _store_file(tmp_path: str, directory: str, extension: str) -> str:
+    """Move a downloaded file to its content addressed path, return its digest."""
+    digest = hashlib.sha256()
+    with open(tmp_path, "rb") as file:
+        while chunk := file.read(FENOTEK_MEDIA_CHUNK_SIZE):
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    path = os.path.join(directory, hexdigest[:2], f"{hexdigest}.{extension}")
+    if os.path.exists(path):
+        # Same content already archived for another notification
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return hexdigest
+
+
+def _remove_unreferenced_files(directory: str, referenced: set[str]) -> None:
+    """Remove the content addressed files which are not referenced."""
+    for entry in os.scandir(directory):
+        if not entry.is_dir() or len(entry.name) != 2:
+            continue
+        for file in os.scandir(entry.path):
+            if file.path not in referenced:
+                os.remove(file.path)
+
+
+class MediaArchive:
+    """Notification media downloaded to local, content addressed, files.
+
+    Files are named after the SHA-256 of their content, an index maps
+    notification IDs to them. Media older than `max_age` seconds is evicted,
+    then the oldest media until the archive fits in `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        fenotek_client: FenotekClient,
+        directory: str,
+        max_age: float = FENOTEK_ARCHIVE_MAX_AGE,
+        max_bytes: int = FENOTEK_ARCHIVE_MAX_BYTES,
+        max_concurrency: int = FENOTEK_ARCHIVE_MAX_CONCURRENCY,
+    ) -> None:
+        """Media archive class constructor."""
+        self._fenotek_client: FenotekClient = fenotek_client
+        self._directory: str = directory
+        self.max_age: float = max_age
+        self.max_bytes: int = max_bytes
+        self._max_concurrency: int = max_concurrency
+        self._media: dict[str, ArchivedMedia] = {}
+        self._in_flight: SingleFlight[str, ArchivedMedia | None] = SingleFlight()
+        # Files are not evicted while others are being archived
+        self._lock = asyncio.Lock()
+
+    def __contains__(self, notification_id: object) -> bool:
+        """Is the media of this notification archived."""
+        return notification_id in self._media
+
+    def __len__(self) -> int:
+        """Return the number of archived media."""
+        return len(self._media)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the archived media.
+
+        Files shared by several notifications are counted once.
+        """
+        sizes = {media.digest: media.size for media in self._media.values()}
+        return sum(sizes.values())
+
+    def get(self, notification_id: str) -> ArchivedMedia | None:
+        """Get the archived media of a notification."""
+        return self._media.get(notification_id)
+
+    def items(self) -> list[tuple[str, ArchivedMedia]]:
+        """Return the archived media by notification ID, newest first."""
+        return sorted(
+            self._media.items(), key=lambda item: item[1].created_at, reverse=True
+        )
+
+    def path(self, media: ArchivedMedia) -> str:
+        """Path of an archived media file."""
+        return os.path.join(
+            self._directory, media.digest[:2], f"{media.digest}.{media.extension}"
+        )
+
+    async def load(self) -> None:
+        """Load the archive index."""
+        loop = asyncio.get_running_loop()
+        self._media = await loop.run_in_executor(
+            None, _read_index, os.path.join(self._directory, ARCHIVE_INDEX_FILE)
+        )
+
+    async def archive(
+        self, doorbell_id: str, notifications: Iterable[Notification]
+    ) -> dict[str, BaseException]:
+        """Download the media of notifications which are not archived yet.
+
+        Errors are not raised but returned by notification ID.
+        """
+        notifications = [
+            notification
+            for notification in notifications
+            if notification.id_ not in self._media
+            and notification_media(notification) is not None
+        ]
+        if not notifications:
+            return {}
+        async with self._lock:
+            results = await gather_bounded(
+                (
+                    self._in_flight.run(
+                        notification.id_,
+                        partial(self._download, doorbell_id, notification),
+                    )
+                    for notification in notifications
+                ),
+                asyncio.Semaphore(self._max_concurrency),
+            )
+            await self._save_index()
+        return {
+            notification.id_: result
+            for notification, result in zip(notifications, results)
+            if isinstance(result, BaseException)
+        }
+
+    async def evict(self, now: float | None = None) -> int:
+        """Remove expired media, then the oldest ones over the size budget.
+
+        Return the number of evicted media.
+        """
+        now = time.time() if now is None else now
+        async with self._lock:
+            evicted = [
+                notification_id
+                for notification_id, media in self._media.items()
+                if now - media.created_at > self.max_age
+            ]
+            for notification_id in evicted:
+                del self._media[notification_id]
+            size = self.size
+            if size > self.max_bytes:
+                references = Counter(media.digest for media in self._media.values())
+                for notification_id, media in reversed(self.items()):
+                    del self._media[notification_id]
+                    evicted.append(notification_id)
+                    references[media.digest] -= 1
+                    if not references[media.digest]:
+                        size -= media.size
+                    if size <= self.max_bytes:
+                        break
+            if evicted:
+                await self._save_index()
+                await self._remove_unreferenced()
+        return len(evicted)
+
+    async def _download(
+        self, doorbell_id: str, notification: Notification
+    ) -> ArchivedMedia | None:
+        """Download a notification media to the archive."""
+        media = notification_media(notification)
+        if media is None:
+            return None
+        url, extension = media
+        loop = asyncio.get_running_loop()
+        tmp_directory = os.path.join(self._directory, "tmp")
+        await loop.run_in_executor(
+            None, lambda: os.makedirs(tmp_directory, exist_ok=True)
+        )
+        # The notification ID comes from the backend, it must not be a path
+        tmp_name = hashlib.sha256(notification.id_.encode()).hexdigest()
+        tmp_path = os.path.join(tmp_directory, f"{tmp_name}.part")
+        size = await self._fenotek_client.download_to_file(url, tmp_path)
+        digest = await loop.run_in_executor(
+            None, _store_file, tmp_path, self._directory, extension
+        )
+        archived = ArchivedMedia(
+            digest,
+            extension,
+            size,
+            notification.created_at.timestamp(),
+            doorbell_id,
+            notification.sub_type.value,
+        )
+        self._media[notification.id_] = archived
+        return archived
+
+    async def _save_index(self) -> None:
+        """Write the archive index."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            _write_index,
+            os.path.join(self._directory, ARCHIVE_INDEX_FILE),
+            dict(self._media),
+        )
+
+    async def _remove_unreferenced(self) -> None:
+        """Remove files which no notification refers to anymore."""
+        referenced = {self.path(media) for media in self._media.values()}
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, _remove_unreferenced_files, self._directory, referenced
+        )
@@ -0,0 +1,181 @@
+"""Media cache module."""
+
+import asyncio
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+from .client import FenotekClient
+from .concurrency import SingleFlight
+from .consts import (
+    FENOTEK_FRAME_CACHE_MAX_BYTES,
+    FENOTEK_FRAME_MAX_CONCURRENCY,
+    FENOTEK_SNAPSHOT_CACHE_MAX_BYTES,
+    FENOTEK_SNAPSHOT_MAX_SIZE,
+)
+from .notification import Notification
+
+_K = TypeVar("_K", bound=Hashable)
+
+# Notification ID, width and height of a video frame
+FrameKey = tuple[str, int | None, int | None]
+
+
+class ByteLRUCache(Generic[_K]):
+    """Least recently used cache of bytes, bounded by its total size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Byte LRU cache class constructor."""
+        self._max_bytes: int = max_bytes
+        self._size: int = 0
+        self._entries: OrderedDict[_K, bytes] = OrderedDict()
+
+    def __contains__(self, key: object) -> bool:
+        """Is the key cached."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached entries."""
+        return self._size
+
+    def get(self, key: _K) -> bytes | None:
+        """Get cached bytes, marking them as recently used."""
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def put(self, key: _K, data: bytes) -> None:
+        """Cache bytes, evicting the least recently used ones over budget.
+
+        Data bigger than the whole budget is not cached.
+        """
+        self.pop(key)
+        if len(data) > self._max_bytes:
+            return
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def pop(self, key: _K) -> bytes | None:
+        """Remove cached bytes."""
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._size -= len(data)
+        return data
+
+
+class SnapshotCache:
+    """Notification images kept in memory, keyed by notification ID."""
+
+    def __init__(
+        self,
+        fenotek_client: FenotekClient,
+        max_bytes: int = FENOTEK_SNAPSHOT_CACHE_MAX_BYTES,
+        max_size: int = FENOTEK_SNAPSHOT_MAX_SIZE,
+    ) -> None:
+        """Snapshot cache class constructor."""
+        self._fenotek_client: FenotekClient = fenotek_client
+        self._max_size: int = max_size
+        self._cache: ByteLRUCache[str] = ByteLRUCache(max_bytes)
+        self._in_flight: SingleFlight[str, bytes] = SingleFlight()
+
+    def cached(self, notification: Notification) -> bytes | None:
+        """Get a notification image if it is already cached."""
+        return self._cache.get(notification.id_)
+
+    async def get(self, notification: Notification) -> bytes | None:
+        """Get a notification image, downloading it if it is not cached.
+
+        Concurrent calls for the same notification share one download.
+        """
+        if not notification.url:
+            return None
+        data = self._cache.get(notification.id_)
+        if data is None:
+            data = await self._in_flight.run(
+                notification.id_,
+                lambda: self._fenotek_client.fetch_url(
+                    notification.url, self._max_size
+                ),
+            )
+            self._cache.put(notification.id_, data)
+        return data
+
+    async def prefetch(
+        self, notifications: Iterable[Notification]
+    ) -> dict[str, BaseException]:
+        """Download the images of notifications which are not cached yet.
+
+        Errors are not raised but returned by notification ID.
+        """
+        notifications = list(notifications)
+        results = await asyncio.gather(
+            *(self.get(notification) for notification in notifications),
+            return_exceptions=True,
+        )
+        return {
+            notification.id_: result
+            for notification, result in zip(notifications, results)
+            if isinstance(result, BaseException)
+        }
+
+
+class FrameCache:
+    """Frames extracted from notification videos, keyed by notification ID and size.
+
+    Concurrent requests for the same frame share one extraction, and at most
+    `max_concurrency` extractions run at a time for each doorbell.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = FENOTEK_FRAME_CACHE_MAX_BYTES,
+        max_concurrency: int = FENOTEK_FRAME_MAX_CONCURRENCY,
+    ) -> None:
+        """Frame cache class constructor."""
+        self._cache: ByteLRUCache[FrameKey] = ByteLRUCache(max_bytes)
+        self._in_flight: SingleFlight[FrameKey, bytes | None] = SingleFlight()
+        self._semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_concurrency)
+        )
+
+    async def get(
+        self,
+        doorbell_id: str,
+        notification_id: str,
+        width: int | None,
+        height: int | None,
+        extract: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        """Get a frame, running `extract()` if it is not cached.
+
+        Failed extractions, returning None, are not cached.
+        """
+        key: FrameKey = (notification_id, width, height)
+        frame = self._cache.get(key)
+        if frame is None:
+            frame = await self._in_flight.run(
+                key, lambda: self._extract(doorbell_id, key, extract)
+            )
+        return frame
+
+    async def _extract(
+        self,
+        doorbell_id: str,
+        key: FrameKey,
+        extract: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        """Run an extraction within the doorbell limit and cache its result."""
+        async with self._semaphores[doorbell_id]:
+            frame = await extract()
+        if frame:
+            self._cache.put(key, frame)
+        return frame
@@ -0,0 +1,236 @@
+"""Metrics module.
+
+The client reports every HTTP request, and the doorbell and account
+updates report the duration of their phases, to the metrics hooks
+registered on the client. `MetricsRecorder` is a hook aggregating them.
+"""
+
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+# Media urls, which are not API endpoints
+MEDIA_ENDPOINT = "media"
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_FAILURE = "failure"
+OUTCOME_RETRY = "retry"
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class MetricsHook(Protocol):
+    """Receiver of the client metrics."""
+
+    def on_request(
+        self, endpoint: str, outcome: str, duration: float, size: int
+    ) -> None:
+        """Record an HTTP request attempt.
+
+        `outcome` is `OUTCOME_SUCCESS`, `OUTCOME_FAILURE`, or `OUTCOME_RETRY`
+        for a failed attempt which is retried. `size` is the number of bytes
+        received.
+        """
+
+    def on_phase(self, phase: str, duration: float) -> None:
+        """Record the duration of an update phase."""
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Latency histogram class constructor."""
+        self._buckets: tuple[float, ...] = buckets
+        # The last count is for values above the last bucket
+        self._counts: list[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a duration, in seconds."""
+        self._counts[bisect_left(self._buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def quantile(self, quantile: float) -> float | None:
+        """Estimate a quantile, such as 0.95, None if nothing was recorded.
+
+        The value is interpolated inside its bucket.
+        """
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if count and seen + count >= rank:
+                lower = self._buckets[index - 1] if index else 0.0
+                upper = self._buckets[index] if index < len(self._buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Histogram summary."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "buckets": dict(
+                zip((*map(str, self._buckets), "inf"), self._counts, strict=True)
+            ),
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """Request metrics of an endpoint."""
+
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def requests(self) -> int:
+        """Number of request attempts."""
+        return self.successes + self.failures + self.retries
+
+    def as_dict(self) -> dict[str, Any]:
+        """Endpoint metrics summary."""
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class MetricsRecorder:
+    """Metrics hook aggregating requests by endpoint and phases by name.
+
+    The request times of the last `window` seconds are kept to compute the
+    request rate.
+    """
+
+    def __init__(self, window: float = 300) -> None:
+        """Metrics recorder class constructor."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.phases: dict[str, LatencyHistogram] = {}
+        self._window: float = window
+        self._request_times: deque[float] = deque()
+
+    def on_request(
+        self, endpoint: str, outcome: str, duration: float, size: int
+    ) -> None:
+        """Record an HTTP request attempt."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        if outcome == OUTCOME_SUCCESS:
+            metrics.successes += 1
+        elif outcome == OUTCOME_RETRY:
+            metrics.retries += 1
+        else:
+            metrics.failures += 1
+        metrics.bytes_received += size
+        metrics.latency.record(duration)
+        now = time.monotonic()
+        self._request_times.append(now)
+        self._prune(now)
+
+    def on_phase(self, phase: str, duration: float) -> None:
+        """Record the duration of an update phase."""
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = LatencyHistogram()
+        histogram.record(duration)
+
+    def requests_per_minute(self) -> float:
+        """Request rate over the window."""
+        self._prune(time.monotonic())
+        return len(self._request_times) * 60 / self._window
+
+    @property
+    def requests(self) -> int:
+        """Total number of request attempts."""
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def failures(self) -> int:
+        """Total number of failed requests, not counting retried attempts."""
+        return sum(metrics.failures for metrics in self.endpoints.values())
+
+    @property
+    def bytes_received(self) -> int:
+        """Total number of bytes received."""
+        return sum(metrics.bytes_received for metrics in self.endpoints.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics summary."""
+        return {
+            "requests_per_minute": self.requests_per_minute(),
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in self.endpoints.items()
+            },
+            "phases": {
+                phase: histogram.as_dict() for phase, histogram in self.phases.items()
+            },
+        }
+
+    def _prune(self, now: float) -> None:
+        """Forget the request times older than the window."""
+        while self._request_times and self._request_times[0] < now - self._window:
+            self._request_times.popleft()
+
+
+class MetricsHooks:
+    """Metrics hooks registered on a client."""
+
+    def __init__(self) -> None:
+        """Metrics hooks class constructor."""
+        self._hooks: list[MetricsHook] = []
+
+    def __bool__(self) -> bool:
+        """Is any hook registered."""
+        return bool(self._hooks)
+
+    def add(self, hook: MetricsHook) -> None:
+        """Register a hook."""
+        self._hooks.append(hook)
+
+    def remove(self, hook: MetricsHook) -> None:
+        """Unregister a hook."""
+        self._hooks.remove(hook)
+
+    def request(self, endpoint: str, outcome: str, duration: float, size: int) -> None:
+        """Report an HTTP request attempt to the hooks."""
+        for hook in self._hooks:
+            hook.on_request(endpoint, outcome, duration, size)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Report the duration of the wrapped code to the hooks."""
+        if not self._hooks:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            for hook in self._hooks:
+                hook.on_phase(phase, duration)
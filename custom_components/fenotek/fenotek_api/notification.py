@@ -1,19 +1,23 @@
 """Notification module."""
 
-import json
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
+from typing import Any, TypeVar, cast
 
 from .api_reponse import (
     VisiophoneHomeNotificationDetailResponse,
     VisiophoneHomeNotificationResponse,
 )
 from .client import FenotekClient
+from .codec import DECODE_ERRORS, loads
+from .exceptions import FenotekPermanentError
 
 
 class NotificationType(Enum):
     """List of notification types."""
 
+    UNKNOWN = "unknown"
     DRY_CONTACT = "drycontact"
     NOTIFICATION = "notification"
     CALL = "call"
@@ -42,108 +46,114 @@ class NotificationSubType(Enum):
     DOORBELL_REACHABLE = 13
 
 
-class Notification:
-    """Notification class."""
-
-    def __init__(
-        self,
-        fenotek_client: FenotekClient,
-        id_: str,
-        type_: str,
-        created_at: datetime,
-        details: VisiophoneHomeNotificationDetailResponse,
-    ):
-        """Notification class construction."""
-        self._fenotek_client: FenotekClient = fenotek_client
-        self._id: str = id_
-        self._type: str = type_
-        self._created_at: datetime = created_at
-        self._details: VisiophoneHomeNotificationDetailResponse = details
-        self._video_url: str = ""
+_E = TypeVar("_E", NotificationType, NotificationSubType)
 
-    @property
-    def id_(self) -> str:
-        """Return notification ID."""
-        return self._id
 
-    @property
-    def type_(self) -> NotificationType:
-        """Return notification type."""
-        return NotificationType(self._type)
+def _enum_or_unknown(enum: type[_E], value: Any) -> _E:
+    """Return the enum member of a value, UNKNOWN if it is not known."""
+    try:
+        return enum(value)
+    except ValueError:
+        return enum.UNKNOWN
 
-    @property
-    def created_at(self) -> datetime:
-        """Return notification creation date."""
-        return self._created_at
 
-    @property
-    def label(self) -> str:
-        """Return notification label."""
-        return self._details.get("label", "")
-
-    @property
-    def name(self) -> str:
-        """Return the name of who triggered the notification."""
-        return self._details.get("name", "")
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class Notification:
+    """Notification record.
+
+    Every field is computed once when the notification is parsed. The
+    resolved video url of a call is set by building a new record with
+    `with_video_url`.
+    """
+
+    fenotek_client: FenotekClient
+    id_: str
+    type_: NotificationType
+    created_at: datetime
+    sub_type: NotificationSubType
+    # Label and name of who triggered the notification
+    label: str = ""
+    name: str = ""
+    # Could be a jpeg file or json data with link to mp4 file
+    url: str = ""
+    # mp4 video file url
+    download: str = ""
+    resolved_video_url: str = ""
 
     @property
-    def sub_type(self) -> NotificationSubType:
-        """Return notification sub type."""
-        return NotificationSubType(self._details.get("type", -1))
+    def video_url(self) -> str:
+        """Return video url."""
+        return self.resolved_video_url or self.url
 
-    @property
-    def url(self) -> str:
-        """Notification data url.
+    def as_raw(self) -> VisiophoneHomeNotificationResponse:
+        """Notification data as returned by the API, the fields `new` reads.
 
-        Could be:
-        * a jpeg file
-        * json data with link to mp4 file
+        The resolved video url, which expires, is not included.
         """
-        return self._details.get("url", "")
-
-    @property
-    def download(self) -> str:
-        """mp4 video file url."""
-        return self._details.get("download", "")
-
-    @property
-    def video_url(self) -> str:
-        """Return video url."""
-        if self._video_url:
-            return self._video_url
-        return self.url
+        return cast(
+            VisiophoneHomeNotificationResponse,
+            {
+                "_id": self.id_,
+                "type": self.type_.value,
+                "createdAt": self.created_at.isoformat(),
+                "detail": {
+                    "type": self.sub_type.value,
+                    "label": self.label,
+                    "name": self.name,
+                    "url": self.url,
+                    "download": self.download,
+                },
+            },
+        )
 
     @classmethod
     def new(
-        self,
+        cls,
         fenotek_client: FenotekClient,
         notification_raw_data: VisiophoneHomeNotificationResponse,
     ) -> "Notification":
         """Create new notification object."""
-        notif = Notification(
+        details: VisiophoneHomeNotificationDetailResponse = notification_raw_data[
+            "detail"
+        ]
+        return cls(
             fenotek_client=fenotek_client,
             id_=notification_raw_data["_id"],
-            type_=notification_raw_data["type"],
+            type_=_enum_or_unknown(NotificationType, notification_raw_data["type"]),
             created_at=datetime.fromisoformat(notification_raw_data["createdAt"]),
-            details=notification_raw_data["detail"],
+            sub_type=_enum_or_unknown(NotificationSubType, details.get("type", -1)),
+            label=details.get("label", ""),
+            name=details.get("name", ""),
+            url=details.get("url", ""),
+            download=details.get("download", ""),
         )
-        return notif
 
     async def fetch_details_url(self) -> bytes | None:
         """Get the content of the url in the details."""
         if not self.url:
             return None
-        data = await self._fenotek_client.fetch_url(self.url)
-        if self.sub_type in (
+        return await self.fenotek_client.fetch_url(self.url)
+
+    async def with_video_url(self) -> "Notification":
+        """Return a copy of a call notification with its video url resolved."""
+        if self.sub_type not in (
             NotificationSubType.MISSED_CALL,
             NotificationSubType.ANSWERED_CALL,
         ):
-            self._video_url = json.loads(data).get("data", {}).get("url", {})
-        return data
+            return self
+        data = await self.fetch_details_url()
+        if data is None:
+            return self
+        try:
+            details = loads(data)
+        except DECODE_ERRORS as exp:
+            raise FenotekPermanentError(f"Invalid call details: {exp}") from exp
+        video_url = details.get("data", {}).get("url", "")
+        return replace(self, resolved_video_url=video_url)
 
     def __repr__(self) -> str:
         """Object representation."""
         return (
-            f"""<Notification - {self._id} - {self.created_at}"""
+            f"""<Notification - {self.id_} - {self.created_at}"""
             f""" - {self.type_} - {self.sub_type}>"""
         )
@@ -0,0 +1,172 @@
+"""Notification store module."""
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from .api_reponse import VisiophoneHomeNotificationResponse
+from .client import FenotekClient
+from .consts import FENOTEK_NOTIFICATIONS_MAX_SIZE
+from .notification import Notification, NotificationSubType
+
+
+def _created_at(notification: Notification) -> datetime:
+    """Sort key of the notifications."""
+    return notification.created_at
+
+
+def _insert(notifications: list[Notification], notification: Notification) -> None:
+    """Insert a notification in a time ordered list."""
+    if not notifications or notifications[-1].created_at <= notification.created_at:
+        notifications.append(notification)
+    else:
+        insort(notifications, notification, key=_created_at)
+
+
+def _remove_oldest(
+    notifications: list[Notification], notification: Notification
+) -> None:
+    """Remove a notification which is among the oldest of a time ordered list."""
+    for index, item in enumerate(notifications):
+        if item is notification:
+            del notifications[index]
+            return
+
+
+def _replace(
+    notifications: list[Notification], old: Notification, new: Notification
+) -> None:
+    """Replace a notification of a time ordered list, keeping its position."""
+    index = bisect_left(notifications, old.created_at, key=_created_at)
+    for index in range(index, len(notifications)):
+        if notifications[index] is old:
+            notifications[index] = new
+            return
+
+
+class NotificationStore:
+    """Doorbell notifications keyed by ID and kept in time order.
+
+    Notifications are also indexed by sub type, and activations by label,
+    so the last one of each is available without scanning the store.
+    """
+
+    def __init__(
+        self,
+        fenotek_client: FenotekClient,
+        max_size: int = FENOTEK_NOTIFICATIONS_MAX_SIZE,
+    ) -> None:
+        """Notification store class constructor."""
+        self._fenotek_client: FenotekClient = fenotek_client
+        self._max_size: int = max_size
+        self._by_id: dict[str, Notification] = {}
+        # Oldest first
+        self._ordered: list[Notification] = []
+        self._by_sub_type: dict[NotificationSubType, list[Notification]] = {}
+        self._activations_by_label: dict[str, list[Notification]] = {}
+
+    def __contains__(self, id_: object) -> bool:
+        """Return whether the notification ID is known."""
+        return id_ in self._by_id
+
+    def __len__(self) -> int:
+        """Return the number of stored notifications."""
+        return len(self._ordered)
+
+    def __iter__(self) -> Iterator[Notification]:
+        """Iterate over notifications, oldest first."""
+        return iter(self._ordered)
+
+    def get(self, id_: str) -> Notification | None:
+        """Get a notification by its ID."""
+        return self._by_id.get(id_)
+
+    @property
+    def last(self) -> Notification | None:
+        """Most recent notification."""
+        if self._ordered:
+            return self._ordered[-1]
+        return None
+
+    def by_sub_type(self, sub_type: NotificationSubType) -> list[Notification]:
+        """Notifications of a sub type, oldest first."""
+        return list(self._by_sub_type.get(sub_type, ()))
+
+    def last_by_sub_type(self, sub_type: NotificationSubType) -> Notification | None:
+        """Most recent notification of a sub type."""
+        notifications = self._by_sub_type.get(sub_type)
+        if notifications:
+            return notifications[-1]
+        return None
+
+    def activations_by_label(self, label: str) -> list[Notification]:
+        """Activation notifications with a label, oldest first."""
+        return list(self._activations_by_label.get(label, ()))
+
+    def last_activation_by_label(self, label: str) -> Notification | None:
+        """Most recent activation notification with a label."""
+        notifications = self._activations_by_label.get(label)
+        if notifications:
+            return notifications[-1]
+        return None
+
+    def ingest(
+        self, raw_notifications: Iterable[VisiophoneHomeNotificationResponse]
+    ) -> list[Notification]:
+        """Add the notifications not seen yet and return them, oldest first.
+
+        Already known IDs are skipped without being parsed again. Added
+        notifications evicted right away, because the store is full of
+        more recent ones, are not returned.
+        """
+        added: list[Notification] = []
+        for raw_notification in raw_notifications:
+            if raw_notification["_id"] in self._by_id:
+                continue
+            notification = Notification.new(self._fenotek_client, raw_notification)
+            self._by_id[notification.id_] = notification
+            added.append(notification)
+        if not added:
+            return added
+
+        added.sort(key=_created_at)
+        if not self._ordered or self._ordered[-1].created_at <= added[0].created_at:
+            # Usual case: everything new happened after what we already know
+            self._ordered.extend(added)
+        else:
+            for notification in added:
+                insort(self._ordered, notification, key=_created_at)
+        for notification in added:
+            for index in self._indexes(notification):
+                _insert(index, notification)
+
+        if len(self._ordered) > self._max_size:
+            evicted = self._ordered[: len(self._ordered) - self._max_size]
+            del self._ordered[: len(evicted)]
+            for notification in evicted:
+                del self._by_id[notification.id_]
+                for index in self._indexes(notification):
+                    _remove_oldest(index, notification)
+            added = [notification for notification in added if notification.id_ in self]
+        return added
+
+    def replace(self, notification: Notification) -> None:
+        """Replace a stored notification by an updated record with the same ID.
+
+        The updated record must keep the creation date, sub type and label.
+        """
+        old = self._by_id.get(notification.id_)
+        if old is None or old is notification:
+            return
+        self._by_id[notification.id_] = notification
+        for notifications in (self._ordered, *self._indexes(old)):
+            _replace(notifications, old, notification)
+
+    def _indexes(self, notification: Notification) -> list[list[Notification]]:
+        """Index lists a notification belongs to."""
+        indexes = [self._by_sub_type.setdefault(notification.sub_type, [])]
+        if notification.sub_type == NotificationSubType.ACTIVATION:
+            indexes.append(
+                self._activations_by_label.setdefault(notification.label, [])
+            )
+        return indexes
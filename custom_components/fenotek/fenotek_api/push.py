@@ -0,0 +1,94 @@
+"""Push notifications module."""
+
+import re
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any, cast
+from urllib.parse import urlsplit
+
+from .api_reponse import VisiophoneHomeNotificationResponse
+from .codec import project_notification
+from .consts import FENOTEK_MEDIA_HOSTS
+
+# Notification IDs are MongoDB ObjectIds
+NOTIFICATION_ID_PATTERN = re.compile(r"[0-9a-f]{24}")
+
+
+@dataclass(frozen=True)
+class PushTarget:
+    """Destination the backend pushes notifications to, sent at login."""
+
+    push_type: str
+    token_id: str
+    duid: str
+
+
+def _is_media_url(url: Any, media_hosts: Collection[str]) -> bool:
+    """Return whether a url is unset or on one of the media hosts."""
+    if url == "":
+        return True
+    if not isinstance(url, str):
+        return False
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    host = parts.hostname
+    return (
+        parts.scheme in ("http", "https")
+        and host is not None
+        and any(
+            host == media_host or host.endswith(f".{media_host}")
+            for media_host in media_hosts
+        )
+    )
+
+
+def _is_notification(item: Any, media_hosts: Collection[str]) -> bool:
+    """Return whether an item is a valid notification."""
+    if not isinstance(item, dict) or not all(
+        key in item for key in ("_id", "vuid", "type", "createdAt", "detail")
+    ):
+        return False
+    detail = item["detail"]
+    return (
+        isinstance(item["_id"], str)
+        and NOTIFICATION_ID_PATTERN.fullmatch(item["_id"]) is not None
+        and isinstance(item["vuid"], str)
+        and isinstance(detail, dict)
+        and all(
+            _is_media_url(detail.get(key, ""), media_hosts)
+            for key in ("url", "download")
+        )
+    )
+
+
+def parse_push_payload(
+    payload: Any, media_hosts: Collection[str] = FENOTEK_MEDIA_HOSTS
+) -> dict[str, list[VisiophoneHomeNotificationResponse]]:
+    """Extract the notifications of a push payload, by doorbell ID.
+
+    A payload is a notification, as returned by the notifications endpoint,
+    a list of them, or an object holding them in `notification` or
+    `notifications`. Items which are not notifications are ignored, as are
+    notifications with an invalid ID, or with media urls which are not on
+    `media_hosts` or their subdomains, since the payload comes from outside
+    and its urls are downloaded.
+    """
+    if isinstance(payload, dict):
+        if "notifications" in payload:
+            payload = payload["notifications"]
+        elif "notification" in payload:
+            payload = payload["notification"]
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list):
+        return {}
+    notifications: dict[str, list[VisiophoneHomeNotificationResponse]] = {}
+    for item in payload:
+        if not _is_notification(item, media_hosts):
+            continue
+        notifications.setdefault(item["vuid"], []).append(
+            cast(VisiophoneHomeNotificationResponse, project_notification(item))
+        )
+    return notifications
@@ -0,0 +1,117 @@
+"""Retry and circuit breaker module."""
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .consts import (
+    FENOTEK_CIRCUIT_FAILURE_THRESHOLD,
+    FENOTEK_CIRCUIT_RESET_TIMEOUT,
+    FENOTEK_RETRY_ATTEMPTS,
+    FENOTEK_RETRY_BASE_DELAY,
+    FENOTEK_RETRY_MAX_DELAY,
+)
+from .exceptions import FenotekCircuitOpenError
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    attempts: int = FENOTEK_RETRY_ATTEMPTS
+    base_delay: float = FENOTEK_RETRY_BASE_DELAY
+    max_delay: float = FENOTEK_RETRY_MAX_DELAY
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Seconds to wait before the retry following `attempt`, counted from 0.
+
+        Return None when the request should not be retried, either because
+        there are no attempts left or because the backend asked to wait longer
+        than `max_delay`.
+        """
+        if attempt + 1 >= self.attempts:
+            return None
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fail fast while the backend is down.
+
+    The circuit opens after `failure_threshold` consecutive failures. While
+    it is open, requests fail immediately. After `reset_timeout` seconds, a
+    single trial request is let through: the circuit closes if it succeeds
+    and opens again if it fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = FENOTEK_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = FENOTEK_CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Circuit breaker class constructor."""
+        self._failure_threshold: int = failure_threshold
+        self._reset_timeout: float = reset_timeout
+        self._failures: int = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Are requests currently refused."""
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """Raise `FenotekCircuitOpenError` if a request must not be sent."""
+        if self._opened_at is None:
+            return
+        remaining = self._opened_at + self._reset_timeout - time.monotonic()
+        if remaining > 0 or self._trial_in_flight:
+            raise FenotekCircuitOpenError(
+                "Fenotek backend unavailable, request not sent",
+                retry_after=max(remaining, 0),
+            )
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a request which reached the backend."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a request which failed because of the backend."""
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def record_cancelled(self) -> None:
+        """Record a request which ended without telling the backend state.
+
+        A cancelled trial request frees its slot, so another one can be let
+        through instead of keeping the circuit open.
+        """
+        self._trial_in_flight = False
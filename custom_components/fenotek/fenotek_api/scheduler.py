@@ -0,0 +1,95 @@
+"""Refresh scheduler module."""
+
+import time
+from collections.abc import Iterable, Mapping
+
+
+class TieredScheduler:
+    """Tell which data slices are due for a refresh.
+
+    Each slice has its own refresh interval in seconds, slices without one
+    are due every time. A slice is due until it is marked as refreshed.
+    """
+
+    def __init__(self, slices: Iterable[str], intervals: Mapping[str, float]) -> None:
+        """Tiered scheduler class constructor."""
+        self._slices: tuple[str, ...] = tuple(slices)
+        self._intervals: dict[str, float] = dict(intervals)
+        self._refreshed_at: dict[str, float] = {}
+
+    def set_interval(self, slice_: str, interval: float | None) -> None:
+        """Change the refresh interval of a slice, None to refresh it every time."""
+        if interval is None:
+            self._intervals.pop(slice_, None)
+        else:
+            self._intervals[slice_] = interval
+
+    def due(self, now: float | None = None) -> set[str]:
+        """Slices which are due for a refresh."""
+        if now is None:
+            now = time.monotonic()
+        return {
+            slice_
+            for slice_ in self._slices
+            if slice_ not in self._refreshed_at
+            or now - self._refreshed_at[slice_] >= self._intervals.get(slice_, 0)
+        }
+
+    def mark_refreshed(self, slices: Iterable[str], now: float | None = None) -> None:
+        """Record that slices were just refreshed."""
+        if now is None:
+            now = time.monotonic()
+        for slice_ in slices:
+            self._refreshed_at[slice_] = now
+
+    def invalidate(self, slices: Iterable[str] | None = None) -> None:
+        """Make slices, all by default, due on the next refresh."""
+        if slices is None:
+            self._refreshed_at.clear()
+            return
+        for slice_ in slices:
+            self._refreshed_at.pop(slice_, None)
+
+
+class AdaptiveInterval:
+    """Polling interval speeding up after events and slowing down when idle.
+
+    For `burst_duration` seconds after an event, the interval is `burst`.
+    It then goes back to `base`, and to `idle` once no event happened for
+    `idle_after` seconds. Times are wall clock timestamps, so events can be
+    recorded at the time they happened.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        burst: float,
+        idle: float,
+        burst_duration: float,
+        idle_after: float,
+    ) -> None:
+        """Adaptive interval class constructor."""
+        self.base: float = base
+        self.burst: float = burst
+        self.idle: float = idle
+        self.burst_duration: float = burst_duration
+        self.idle_after: float = idle_after
+        # Start at the base interval
+        self._last_event: float = time.time() - burst_duration
+
+    def record_event(self, at: float | None = None) -> None:
+        """Record an event, now by default."""
+        if at is None:
+            at = time.time()
+        self._last_event = max(self._last_event, at)
+
+    def interval(self, now: float | None = None) -> float:
+        """Return the current polling interval in seconds."""
+        if now is None:
+            now = time.time()
+        since_event = now - self._last_event
+        if since_event < self.burst_duration:
+            return min(self.burst, self.base)
+        if since_event < self.idle_after:
+            return self.base
+        return max(self.idle, self.base)
@@ -0,0 +1,72 @@
+"""Resolved url cache module."""
+
+import time
+from collections.abc import Container
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from .consts import FENOTEK_RESOLVED_URL_EXPIRY_MARGIN, FENOTEK_RESOLVED_URL_TTL
+
+
+def signed_url_expiry(url: str) -> float | None:
+    """Return the expiry timestamp of a signed url, if it has one.
+
+    Supports AWS (v2 and v4) and Google Cloud Storage signed urls.
+    """
+    query = {
+        key.lower(): values[0] for key, values in parse_qs(urlsplit(url).query).items()
+    }
+    try:
+        for prefix in ("x-amz-", "x-goog-"):
+            if f"{prefix}date" in query and f"{prefix}expires" in query:
+                signed_at = datetime.strptime(
+                    query[f"{prefix}date"], "%Y%m%dT%H%M%SZ"
+                ).replace(tzinfo=timezone.utc)
+                return signed_at.timestamp() + int(query[f"{prefix}expires"])
+        if "expires" in query:
+            return float(query["expires"])
+    except ValueError:
+        pass
+    return None
+
+
+class ResolvedUrlCache:
+    """Resolved urls keyed by notification ID, valid until they expire."""
+
+    def __init__(
+        self,
+        ttl: float = FENOTEK_RESOLVED_URL_TTL,
+        expiry_margin: float = FENOTEK_RESOLVED_URL_EXPIRY_MARGIN,
+    ) -> None:
+        """Initialize the resolved url cache."""
+        self._ttl: float = ttl
+        self._expiry_margin: float = expiry_margin
+        self._entries: dict[str, tuple[str, float]] = {}
+
+    def get(self, id_: str) -> str | None:
+        """Get a resolved url if it is still valid."""
+        entry = self._entries.get(id_)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def is_fresh(self, id_: str) -> bool:
+        """Return whether a still valid url is cached for this ID."""
+        return self.get(id_) is not None
+
+    def set(self, id_: str, url: str) -> None:
+        """Save a resolved url.
+
+        The url is kept for the cache TTL, or less if it is a signed url
+        expiring before.
+        """
+        expire_at = time.time() + self._ttl
+        signed_expiry = signed_url_expiry(url)
+        if signed_expiry is not None:
+            expire_at = min(expire_at, signed_expiry - self._expiry_margin)
+        self._entries[id_] = (url, expire_at)
+
+    def prune(self, ids: Container[str]) -> None:
+        """Forget urls of IDs not in `ids`."""
+        for id_ in [id_ for id_ in self._entries if id_ not in ids]:
+            del self._entries[id_]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -11,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FenotekDataUpdateCoordinator
+from .fenotek_api.consts import FENOTEK_SLICE_AVAILABILITY, FENOTEK_SLICE_NOTIFICATIONS
 from .fenotek_api.doorbell import Doorbell
 
 
@@ -21,8 +24,10 @@ async def async_setup_entry(
 ) -> None:
     """Add a ring event imaeg from a config_entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for doorbell in coordinator.fenotek_account.doorbells:
-        async_add_entities([FenotekImage(coordinator, hass, doorbell)])
+    async_add_entities(
+        FenotekImage(coordinator, hass, doorbell)
+        for doorbell in coordinator.fenotek_account.doorbells
+    )
 
 
 IMAGE_TYPE = ImageEntityDescription(  # type: ignore[call-arg]
@@ -64,6 +69,21 @@ class FenotekImage(CoordinatorEntity, ImageEntity):
         self._attr_content_type = "image/jpeg"
         self.entity_description = IMAGE_TYPE
 
+    async def async_image(self) -> bytes | None:
+        """Return the last ring image, from the archive or the snapshot cache."""
+        if not (last_ring := self._doorbell.last_ring):
+            return None
+        archive = self.coordinator.fenotek_account.archive
+        if archive and (media := archive.get(last_ring.id_)):
+            try:
+                return await self.hass.async_add_executor_job(
+                    Path(archive.path(media)).read_bytes
+                )
+            except OSError:
+                # Evicted meanwhile, fall back to the remote image
+                pass
+        return await self.coordinator.fenotek_account.snapshots.get(last_ring)
+
     @property
     def available(self) -> bool:
         """Get current availability."""
@@ -72,12 +92,14 @@ class FenotekImage(CoordinatorEntity, ImageEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
+        if not self.coordinator.has_changed(
+            self._doorbell.id_, FENOTEK_SLICE_NOTIFICATIONS, FENOTEK_SLICE_AVAILABILITY
+        ):
+            return
         if (
             self._doorbell.last_ring
             and self._attr_image_url != self._doorbell.last_ring.url
         ):
             self._attr_image_url = self._doorbell.last_ring.url
             self._attr_image_last_updated = self._doorbell.last_ring.created_at
-            self._cached_image = None
-        self.async_write_ha_state()
         super()._handle_coordinator_update()
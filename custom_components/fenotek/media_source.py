@@ -0,0 +1,126 @@
+"""Fenotek media source module, browsing the archived notification media."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.components.media_player import MediaClass
+from homeassistant.components.media_source import (
+    BrowseMediaSource,
+    MediaSource,
+    MediaSourceItem,
+    PlayMedia,
+    Unresolvable,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .fenotek_api.media_archive import ArchivedMedia, MediaArchive
+from .fenotek_api.notification import NotificationSubType
+from .views import media_url
+
+MEDIA_URL_EXPIRATION = timedelta(minutes=30)
+
+
+async def async_get_media_source(hass: HomeAssistant) -> FenotekMediaSource:
+    """Set up the Fenotek media source."""
+    return FenotekMediaSource(hass)
+
+
+class FenotekMediaSource(MediaSource):
+    """Notification media archived by the Fenotek accounts."""
+
+    name = "Fenotek"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the media source."""
+        super().__init__(DOMAIN)
+        self.hass = hass
+
+    def _archive(self, entry_id: str) -> MediaArchive | None:
+        """Return the media archive of a config entry."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        return coordinator and coordinator.fenotek_account.archive
+
+    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
+        """Resolve an archived media to a signed url."""
+        entry_id, _, notification_id = item.identifier.partition("/")
+        archive = self._archive(entry_id)
+        if not archive or (media := archive.get(notification_id)) is None:
+            raise Unresolvable(f"Unknown media {item.identifier}")
+        url = async_sign_path(
+            self.hass, media_url(entry_id, notification_id), MEDIA_URL_EXPIRATION
+        )
+        return PlayMedia(url, media.content_type)
+
+    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+        """Browse the accounts, then their archived media."""
+        if not item.identifier:
+            return self._browse_root()
+        entry_id = item.identifier
+        archive = self._archive(entry_id)
+        if not archive:
+            raise Unresolvable(f"Unknown account {entry_id}")
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=entry_id,
+            media_class=MediaClass.DIRECTORY,
+            media_content_type="",
+            title=entry.title if entry else entry_id,
+            can_play=False,
+            can_expand=True,
+            children_media_class=MediaClass.VIDEO,
+            children=[
+                _browse_media(entry_id, notification_id, media)
+                for notification_id, media in archive.items()
+            ],
+        )
+
+    def _browse_root(self) -> BrowseMediaSource:
+        """List the accounts with an archive."""
+        children = []
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if not self._archive(entry.entry_id):
+                continue
+            children.append(
+                BrowseMediaSource(
+                    domain=DOMAIN,
+                    identifier=entry.entry_id,
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_type="",
+                    title=entry.title,
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=None,
+            media_class=MediaClass.DIRECTORY,
+            media_content_type="",
+            title=self.name,
+            can_play=False,
+            can_expand=True,
+            children_media_class=MediaClass.DIRECTORY,
+            children=children,
+        )
+
+
+def _browse_media(
+    entry_id: str, notification_id: str, media: ArchivedMedia
+) -> BrowseMediaSource:
+    """Describe an archived media."""
+    created_at = dt_util.as_local(dt_util.utc_from_timestamp(media.created_at))
+    sub_type = NotificationSubType(media.sub_type).name.replace("_", " ").lower()
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=f"{entry_id}/{notification_id}",
+        media_class=MediaClass.VIDEO if media.is_video else MediaClass.IMAGE,
+        media_content_type=media.content_type,
+        title=f"{created_at:%Y-%m-%d %H:%M:%S} {sub_type}",
+        can_play=True,
+        can_expand=False,
+    )
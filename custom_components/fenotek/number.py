@@ -12,7 +12,7 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -29,8 +29,10 @@ async def async_setup_entry(
 ) -> None:
     """Add a number input from a config_entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for doorbell in coordinator.fenotek_account.doorbells:
-        async_add_entities([FenotekNumber(coordinator, doorbell)])
+    async_add_entities(
+        FenotekNumber(coordinator, doorbell)
+        for doorbell in coordinator.fenotek_account.doorbells
+    )
 
 
 class FenotekNumber(CoordinatorEntity, RestoreNumber):
@@ -70,6 +72,7 @@ class FenotekNumber(CoordinatorEntity, RestoreNumber):
             key="update_interval",
             translation_key="update_interval",
         )
+        self._last_available: bool | None = None
 
     @property
     def native_value(self) -> float | None:
@@ -78,6 +81,15 @@ class FenotekNumber(CoordinatorEntity, RestoreNumber):
             return self.restored_data.native_value
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update."""
+        # The value does not depend on the data, only the availability does
+        if self.available == self._last_available:
+            return
+        self._last_available = self.available
+        super()._handle_coordinator_update()
+
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
@@ -87,8 +99,8 @@ class FenotekNumber(CoordinatorEntity, RestoreNumber):
         """Update the current value."""
         assert self.restored_data is not None
         self.restored_data.native_value = int(value)
-        self.coordinator.update_interval = datetime.timedelta(
-            seconds=self.restored_data.native_value
+        self.coordinator.set_base_update_interval(
+            datetime.timedelta(seconds=self.restored_data.native_value)
         )
         self.async_write_ha_state()
         await self.coordinator.async_refresh()
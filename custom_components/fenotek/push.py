@@ -0,0 +1,65 @@
+"""Fenotek push notifications module, received through a webhook."""
+
+from __future__ import annotations
+
+import logging
+
+from aiohttp import hdrs, web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.network import NoURLAvailableError
+
+from .const import CONF_WEBHOOK_ID, DOMAIN
+from .fenotek_api.push import PushTarget
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_TYPE = "webhook"
+
+
+def async_push_target(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> PushTarget | None:
+    """Return the push target of a config entry, None if it has no url."""
+    webhook_id = config_entry.options[CONF_WEBHOOK_ID]
+    try:
+        url = webhook.async_generate_url(hass, webhook_id)
+    except NoURLAvailableError:
+        _LOGGER.warning("No Home Assistant url available, push is disabled")
+        return None
+    return PushTarget(push_type=PUSH_TYPE, token_id=url, duid=config_entry.entry_id)
+
+
+def async_register_push(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Receive the pushed notifications of a config entry."""
+    webhook_id = config_entry.options[CONF_WEBHOOK_ID]
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"Fenotek {config_entry.title}",
+        webhook_id,
+        _async_handle_push,
+        allowed_methods=[hdrs.METH_POST],
+    )
+    config_entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+
+
+async def _async_handle_push(
+    hass: HomeAssistant, webhook_id: str, request: web.Request
+) -> web.Response:
+    """Handle a pushed notification payload."""
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        if config_entry.options.get(CONF_WEBHOOK_ID) == webhook_id:
+            break
+    else:
+        return web.Response(status=404)
+    coordinator = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
+    if coordinator is None:
+        return web.Response(status=503)
+    try:
+        payload = await request.json()
+    except ValueError:
+        return web.Response(status=400)
+    await coordinator.async_handle_push(payload)
+    return web.Response(status=200)
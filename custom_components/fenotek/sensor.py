@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import FenotekDataUpdateCoordinator
+from .const import DOMAIN, MANUFACTURER
+from .coordinator import UPDATE_PHASE, FenotekDataUpdateCoordinator
+from .fenotek_api.consts import FENOTEK_SLICE_AVAILABILITY, FENOTEK_SLICE_NOTIFICATIONS
 from .fenotek_api.doorbell import Doorbell
+from .fenotek_api.metrics import MetricsRecorder
 from .fenotek_api.notification import Notification
 
 
@@ -22,11 +33,65 @@ async def async_setup_entry(
 ) -> None:
     """Add sensor entities from a config_entry."""
     coordinator: FenotekDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    for doorbell in coordinator.fenotek_account.doorbells:
-        for dry_contact in doorbell.dry_contacts:
-            async_add_entities(
-                [FenotekSensor(coordinator, hass, doorbell, dry_contact.name)]
-            )
+    entities: list[SensorEntity] = [
+        FenotekSensor(coordinator, hass, doorbell, dry_contact.name)
+        for doorbell in coordinator.fenotek_account.doorbells
+        for dry_contact in doorbell.dry_contacts
+    ]
+    entities.extend(
+        FenotekMetricSensor(coordinator, config_entry, description)
+        for description in METRIC_SENSORS
+    )
+    async_add_entities(entities)
+
+
+def _update_p95(metrics: MetricsRecorder) -> float | None:
+    """95th percentile of the refresh duration, in seconds."""
+    histogram = metrics.phases.get(UPDATE_PHASE)
+    if histogram is None:
+        return None
+    p95 = histogram.quantile(0.95)
+    return None if p95 is None else round(p95, 3)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FenotekMetricSensorDescription(SensorEntityDescription):
+    """Description of a request metrics sensor."""
+
+    value_fn: Callable[[MetricsRecorder], float | int | None]
+
+
+METRIC_SENSORS = (
+    FenotekMetricSensorDescription(
+        key="update_duration_p95",
+        name="Update duration p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_update_p95,
+    ),
+    FenotekMetricSensorDescription(
+        key="requests_per_minute",
+        name="Requests per minute",
+        native_unit_of_measurement="requests/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: round(metrics.requests_per_minute(), 1),
+    ),
+    FenotekMetricSensorDescription(
+        key="failed_requests",
+        name="Failed requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.failures,
+    ),
+    FenotekMetricSensorDescription(
+        key="bytes_received",
+        name="Data received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.bytes_received,
+    ),
+)
 
 
 class FenotekSensor(CoordinatorEntity, SensorEntity):
@@ -70,16 +135,57 @@ class FenotekSensor(CoordinatorEntity, SensorEntity):
 
     def _set_value(self) -> None:
         """Set value."""
-        notifs = [
-            n for n in self._doorbell.activations if n.label == self._dry_contact_name
-        ]
-        if notifs:
-            self._last_notif = notifs[-1]
-            self._attr_native_value = self._last_notif.created_at
+        last_notif = self._doorbell.last_activation_by_label(self._dry_contact_name)
+        if last_notif:
+            self._last_notif = last_notif
+            self._attr_native_value = last_notif.created_at
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
+        if not self.coordinator.has_changed(
+            self._doorbell.id_, FENOTEK_SLICE_NOTIFICATIONS, FENOTEK_SLICE_AVAILABILITY
+        ):
+            return
         self._set_value()
-        self.async_write_ha_state()
         super()._handle_coordinator_update()
+
+
+class FenotekMetricSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor of the account requests metrics.
+
+    The sensors belong to a service device of the account, since the
+    requests of all its doorbells share the client.
+    """
+
+    entity_description: FenotekMetricSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: FenotekDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+        description: FenotekMetricSensorDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        username = coordinator.fenotek_account.username
+        self._attr_unique_id = f"{config_entry.entry_id}-{description.key}"
+        self._attr_name = f"Fenotek {username} {description.name}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=f"Fenotek {username}",
+            manufacturer=MANUFACTURER,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Metrics are available even when the refresh fails."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Current metric value."""
+        return self.entity_description.value_fn(self.coordinator.metrics)
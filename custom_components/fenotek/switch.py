@@ -0,0 +1,93 @@
+"""Fenotek switch module."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, MANUFACTURER
+from .coordinator import FenotekDataUpdateCoordinator
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add an adaptive polling switch from a config_entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([FenotekAdaptivePollingSwitch(coordinator, config_entry)])
+
+
+class FenotekAdaptivePollingSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
+    """Implementation of the adaptive polling switch.
+
+    When on, the update interval speeds up right after rings, motions and
+    dry contact activations, and slows down when the doorbells are idle.
+    The switch belongs to the service device of the account, since all its
+    doorbells are updated together.
+    """
+
+    def __init__(
+        self, coordinator: FenotekDataUpdateCoordinator, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the switch."""
+        super().__init__(coordinator)
+        username = coordinator.fenotek_account.username
+
+        self._attr_unique_id = f"{config_entry.entry_id}-adaptive-polling"
+        self._attr_name = f"Fenotek {username} Adaptive polling"
+
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=f"Fenotek {username}",
+            manufacturer=MANUFACTURER,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.CONFIG
+        self.entity_description = SwitchEntityDescription(
+            key="adaptive_polling",
+            translation_key="adaptive_polling",
+        )
+        self._last_available: bool | None = None
+
+    @property
+    def is_on(self) -> bool:
+        """Is adaptive polling enabled."""
+        return bool(self.coordinator.adaptive_polling)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update."""
+        # The state does not depend on the data, only the availability does
+        if self.available == self._last_available:
+            return
+        self._last_available = self.available
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        if last_state is not None:
+            self.coordinator.adaptive_polling = last_state.state == STATE_ON
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable adaptive polling."""
+        self.coordinator.adaptive_polling = True
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable adaptive polling."""
+        self.coordinator.adaptive_polling = False
+        self.async_write_ha_state()
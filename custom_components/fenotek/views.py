@@ -0,0 +1,40 @@
+"""Fenotek HTTP views module."""
+
+from __future__ import annotations
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+MEDIA_URL = "/api/fenotek/media/{entry_id}/{notification_id}"
+
+
+def media_url(entry_id: str, notification_id: str) -> str:
+    """Return the url of an archived notification media."""
+    return MEDIA_URL.format(entry_id=entry_id, notification_id=notification_id)
+
+
+class FenotekMediaView(HomeAssistantView):
+    """Serve archived notification media from local files."""
+
+    url = MEDIA_URL
+    name = "api:fenotek:media"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(
+        self, request: web.Request, entry_id: str, notification_id: str
+    ) -> web.StreamResponse:
+        """Return an archived media file."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        archive = coordinator and coordinator.fenotek_account.archive
+        if not archive or (media := archive.get(notification_id)) is None:
+            raise web.HTTPNotFound
+        return web.FileResponse(
+            archive.path(media), headers={"Content-Type": media.content_type}
+        )
@@ -0,0 +1,71 @@
+"""Post recorded Fenotek push payloads to a Home Assistant webhook.
+
+Stand-in for the Fenotek backend, to try the push mode locally:
+
+    python scripts/push_replay.py \
+        http://localhost:8123/api/webhook/<webhook_id> \
+        scripts/push_payloads.jsonl
+
+Each line of the payloads file is a JSON payload, posted as is. The `vuid`
+of the recorded notifications must match a doorbell of the account.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+
+def load_payloads(path: Path, refresh: bool) -> list[Any]:
+    """Load the recorded payloads, with new IDs and dates if `refresh`."""
+    payloads = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        payload = json.loads(line)
+        if refresh and isinstance(payload, dict) and "_id" in payload:
+            # Still a valid ObjectId, made of the current time
+            payload["_id"] = f"{time.time_ns():024x}"
+            payload["createdAt"] = datetime.now(UTC).isoformat()
+        payloads.append(payload)
+    return payloads
+
+
+async def replay(url: str, payloads: list[Any], interval: float) -> None:
+    """Post the payloads one after the other."""
+    async with aiohttp.ClientSession() as session:
+        for index, payload in enumerate(payloads):
+            if index:
+                await asyncio.sleep(interval)
+            start = time.perf_counter()
+            async with session.post(url, json=payload) as res:
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"payload {index}: HTTP {res.status} in {elapsed:.1f} ms")
+
+
+def main() -> None:
+    """Parse the arguments and replay the payloads."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="Home Assistant webhook url")
+    parser.add_argument("payloads", type=Path, help="JSON lines payloads file")
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="seconds between payloads"
+    )
+    parser.add_argument(
+        "--keep-ids",
+        action="store_true",
+        help="post the recorded IDs and dates, already known notifications "
+        "are then ignored",
+    )
+    args = parser.parse_args()
+    payloads = load_payloads(args.payloads, refresh=not args.keep_ids)
+    asyncio.run(replay(args.url, payloads, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Pytest configuration.
+
+`fenotek_api` is imported as a top level package, as the benchmarks do, so
+it can be tested without Home Assistant. The test dependencies are listed
+in `requirements_test.txt`. Tests of the integration itself import it as
+`custom_components.fenotek`, and are skipped without Home Assistant.
+"""
+
+import sys
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+import pytest
+
+ROOT = Path(__file__).parents[1]
+sys.path[:0] = [
+    str(ROOT),
+    str(ROOT / "custom_components" / "fenotek"),
+    str(ROOT / "benchmarks"),
+]
+
+from fenotek_api.client import FenotekClient  # noqa: E402
+from mock_backend import MockConfig, MockFenotekBackend  # noqa: E402
+
+BackendFactory = Callable[
+    ..., AbstractAsyncContextManager[tuple[MockFenotekBackend, FenotekClient]]
+]
+
+
+@asynccontextmanager
+async def _running_backend(
+    **config: Any,
+) -> AsyncIterator[tuple[MockFenotekBackend, FenotekClient]]:
+    """Start a mock backend and a logged in client pointed at it."""
+    backend = MockFenotekBackend(MockConfig(**config))
+    base_url = await backend.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = FenotekClient("test", "test", "UTC", session, base_url=base_url)
+            try:
+                assert await client.login()
+                yield backend, client
+            finally:
+                await client.close()
+    finally:
+        await backend.stop()
+
+
+@pytest.fixture
+def running_backend() -> BackendFactory:
+    """Return a factory of mock backends, each with a logged in client."""
+    return _running_backend
@@ -0,0 +1,67 @@
+"""Tests of the account updates against the mock backend."""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+import aiohttp
+import mock_backend
+import pytest
+from conftest import BackendFactory
+from fenotek_api import availability, doorbell, scheduler
+from fenotek_api.account import FenotekAccount
+
+PING_ROUTE = "/visiophones/{id}/ping"
+
+
+class _Clock:
+    """Simulated wall and monotonic clock."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at the current time."""
+        self.now = datetime.now(UTC).timestamp()
+
+    def time(self) -> float:
+        """Return the simulated timestamp."""
+        return self.now
+
+    def monotonic(self) -> float:
+        """Return the simulated timestamp."""
+        return self.now
+
+
+def test_steady_state_needs_no_ping(
+    running_backend: BackendFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A doorbell reporting its pings is never pinged by the 60 s ticks."""
+    clock = _Clock()
+    for module in (availability, doorbell, scheduler):
+        monkeypatch.setattr(module, "time", clock)
+
+    class _Datetime(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> "_Datetime":
+            return cls.fromtimestamp(clock.now, tz)
+
+    # The backend reports the doorbell last ping at the simulated time
+    monkeypatch.setattr(mock_backend, "datetime", _Datetime)
+
+    async def run() -> None:
+        async with (
+            running_backend() as (backend, _),
+            aiohttp.ClientSession() as session,
+        ):
+            account = FenotekAccount(
+                "test", "test", "UTC", session, base_url=backend.base_url
+            )
+            try:
+                assert await account.login()
+                await account.get_doorbells()
+                for _ in range(60):
+                    clock.now += 60
+                    await account.update(ping=True)
+                assert backend.requests[PING_ROUTE] == 0
+            finally:
+                await account.close()
+
+    asyncio.run(run())
@@ -0,0 +1,110 @@
+"""Tests of the Fenotek client against the mock backend."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from conftest import BackendFactory
+
+NOTIFICATIONS_ROUTE = "/visiophones/{id}/notifications"
+
+
+def test_iter_notifications_walks_pages(running_backend: BackendFactory) -> None:
+    """Every page is yielded, most recent first, until a known ID."""
+
+    async def run() -> None:
+        async with running_backend(notifications=25, page_size=10) as (
+            backend,
+            client,
+        ):
+            doorbell_id = backend.doorbell_ids[0]
+            pages = [page async for page in client.iter_notifications(doorbell_id)]
+            assert [len(page) for page in pages] == [10, 10, 5]
+            known = {backend.notifications[doorbell_id][12]["_id"]}
+            pages = [
+                page
+                async for page in client.iter_notifications(
+                    doorbell_id, known_ids=known
+                )
+            ]
+            assert [len(page) for page in pages] == [10, 9]
+
+    asyncio.run(run())
+
+
+def test_iter_notifications_prefetch_depth(running_backend: BackendFactory) -> None:
+    """Exactly `prefetch` pages are requested ahead of the consumed one."""
+
+    async def run() -> None:
+        async with running_backend(notifications=50, page_size=10) as (
+            backend,
+            client,
+        ):
+            for prefetch in (1, 2):
+                backend.requests.clear()
+                pages = client.iter_notifications(
+                    backend.doorbell_ids[0], prefetch=prefetch
+                )
+                await anext(pages)
+                await asyncio.sleep(0.05)
+                # The first page, being consumed, and the next ones
+                assert backend.requests[NOTIFICATIONS_ROUTE] == 1 + prefetch
+                await anext(pages)
+                await asyncio.sleep(0.05)
+                assert backend.requests[NOTIFICATIONS_ROUTE] == 2 + prefetch
+                await pages.aclose()
+
+    asyncio.run(run())
+
+
+def test_close_cancels_token_refresh(running_backend: BackendFactory) -> None:
+    """Closing the client stops its background token refresh and login."""
+
+    async def run() -> None:
+        async with running_backend() as (_, client):
+            refresh = client._token_refresh
+            assert refresh is not None
+            login = asyncio.create_task(client.login())
+            await asyncio.sleep(0)
+            await client.close()
+            assert refresh.cancelled()
+            assert client._token_refresh is None
+            with pytest.raises(asyncio.CancelledError):
+                await login
+
+    asyncio.run(run())
+
+
+def test_stream_to_releases_response_on_write_error(
+    running_backend: BackendFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failing writer closes the media stream right away."""
+
+    async def run() -> None:
+        async with running_backend(media_size=200_000) as (backend, client):
+            stream_url = client.stream_url
+            closed: list[bool] = []
+
+            async def tracked_stream_url(*args: Any) -> AsyncIterator[bytes]:
+                try:
+                    async for chunk in stream_url(*args):
+                        yield chunk
+                finally:
+                    closed.append(True)
+
+            class FailingWriter:
+                """Writer of a full disk."""
+
+                async def write(self, data: bytes) -> None:
+                    """Fail to write the data."""
+                    raise OSError("disk full")
+
+            monkeypatch.setattr(client, "stream_url", tracked_stream_url)
+            with pytest.raises(OSError):
+                await client.stream_to(
+                    f"{backend.base_url}/media/video.mp4", FailingWriter()
+                )
+            assert closed == [True]
+
+    asyncio.run(run())
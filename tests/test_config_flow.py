@@ -0,0 +1,32 @@
+"""Tests of the config flow of the integration."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME  # noqa: E402
+
+from custom_components.fenotek import config_flow  # noqa: E402
+from custom_components.fenotek.const import CONF_TIMEZONE  # noqa: E402
+
+USER_INPUT = {CONF_USERNAME: "user", CONF_PASSWORD: "secret", CONF_TIMEZONE: "UTC"}
+
+
+@pytest.mark.parametrize(
+    "login", [AsyncMock(return_value=True), AsyncMock(side_effect=OSError)]
+)
+def test_validate_input_closes_client(login: AsyncMock) -> None:
+    """The client used to validate the credentials is closed, even on failure."""
+    client = MagicMock(login=login, close=AsyncMock())
+    with (
+        patch.object(config_flow, "FenotekClient", return_value=client),
+        patch.object(config_flow.aiohttp_client, "async_get_clientsession"),
+    ):
+        try:
+            asyncio.run(config_flow.validate_input(MagicMock(), USER_INPUT))
+        except config_flow.CannotConnect:
+            pass
+    client.close.assert_awaited_once()
@@ -0,0 +1,85 @@
+"""Tests of the doorbell updates against the mock backend."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from conftest import BackendFactory
+from fenotek_api.consts import FENOTEK_SLICE_HOME
+from fenotek_api.doorbell import Doorbell
+from fenotek_api.exceptions import FenotekTransientError, FenotekUpdateError
+from mock_backend import ACTIVATION
+
+
+def test_update_failed_page_fetched_again(
+    running_backend: BackendFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Notifications lost to a failing page are fetched by the next update."""
+
+    async def run() -> None:
+        async with running_backend(notifications=5, page_size=10) as (
+            backend,
+            client,
+        ):
+            doorbell_id = backend.doorbell_ids[0]
+            doorbell = Doorbell(client, doorbell_id)
+            await doorbell.update()
+            assert len(doorbell.new_notifications) == 5
+
+            added = [
+                backend.add_notification(doorbell_id, ACTIVATION) for _ in range(15)
+            ]
+            notifications_page = client._notifications_page
+
+            async def failing_page(
+                doorbell_id: str, page: int | None = None, **kwargs: Any
+            ) -> Any:
+                if page is not None:
+                    raise FenotekTransientError("page unavailable")
+                return await notifications_page(doorbell_id, page, **kwargs)
+
+            monkeypatch.setattr(client, "_notifications_page", failing_page)
+            with pytest.raises(FenotekUpdateError):
+                await doorbell.update()
+            assert doorbell.new_notifications == []
+
+            monkeypatch.undo()
+            await doorbell.update()
+            assert [
+                notification.id_ for notification in doorbell.new_notifications
+            ] == [notification["_id"] for notification in added]
+
+    asyncio.run(run())
+
+
+def test_update_failed_home_fetched_again(
+    running_backend: BackendFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Home data whose video url failed to resolve is applied next update."""
+
+    async def run() -> None:
+        async with running_backend() as (backend, client):
+            doorbell_id = backend.doorbell_ids[0]
+            doorbell = Doorbell(client, doorbell_id)
+            await doorbell.update(slices=[FENOTEK_SLICE_HOME])
+            # The home data holds the last notification
+            backend.add_notification(doorbell_id, ACTIVATION)
+            resolve_home_video_url = client._resolve_home_video_url
+
+            async def failing_resolve(json_res: Any) -> Any:
+                monkeypatch.setattr(
+                    client, "_resolve_home_video_url", resolve_home_video_url
+                )
+                raise FenotekTransientError("details unavailable")
+
+            monkeypatch.setattr(client, "_resolve_home_video_url", failing_resolve)
+            with pytest.raises(FenotekUpdateError):
+                await doorbell.update(slices=[FENOTEK_SLICE_HOME])
+            assert FENOTEK_SLICE_HOME not in doorbell.changes
+
+            await doorbell.update(slices=[FENOTEK_SLICE_HOME])
+            assert FENOTEK_SLICE_HOME in doorbell.changes
+            await doorbell.update(slices=[FENOTEK_SLICE_HOME])
+            assert FENOTEK_SLICE_HOME not in doorbell.changes
+
+    asyncio.run(run())
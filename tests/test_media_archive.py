@@ -0,0 +1,46 @@
+"""Tests of the local media archive against the mock backend."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import BackendFactory
+from fenotek_api.media_archive import MediaArchive
+from fenotek_api.notification import Notification
+
+
+def test_archive_names_files_after_content(
+    running_backend: BackendFactory,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No file is named after the notification ID, even a path like one."""
+
+    async def run() -> None:
+        async with running_backend(media_size=100) as (backend, client):
+            doorbell_id = backend.doorbell_ids[0]
+            raw = backend.add_notification(doorbell_id, 6)
+            raw["_id"] = "../../escaped"
+            notification = Notification.new(client, raw)
+            download_to_file = client.download_to_file
+            downloaded_to: list[str] = []
+
+            async def spy(url: str, path: str, *args: Any) -> int:
+                downloaded_to.append(path)
+                return await download_to_file(url, path, *args)
+
+            monkeypatch.setattr(client, "download_to_file", spy)
+            directory = tmp_path / "archive"
+            archive = MediaArchive(client, str(directory))
+            assert await archive.archive(doorbell_id, [notification]) == {}
+            media = archive.get("../../escaped")
+            assert media is not None and media.size == 100
+            assert os.path.dirname(archive.path(media)).startswith(str(directory))
+            assert [os.path.dirname(path) for path in downloaded_to] == [
+                str(directory / "tmp")
+            ]
+            assert not any((directory / "tmp").iterdir())
+
+    asyncio.run(run())
@@ -0,0 +1,35 @@
+"""Tests of the media caches."""
+
+from fenotek_api.media_cache import ByteLRUCache
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    """Entries over budget are evicted, least recently used first."""
+    cache: ByteLRUCache[str] = ByteLRUCache(10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert (len(cache), cache.size) == (2, 8)
+
+
+def test_lru_replace_updates_size() -> None:
+    """Replacing an entry accounts for its new size only."""
+    cache: ByteLRUCache[str] = ByteLRUCache(10)
+    cache.put("a", b"aaaa")
+    cache.put("a", b"aaaaaaaa")
+    assert (len(cache), cache.size) == (1, 8)
+    assert cache.pop("a") == b"aaaaaaaa"
+    assert (len(cache), cache.size) == (0, 0)
+
+
+def test_lru_skips_data_over_budget() -> None:
+    """Data bigger than the whole budget is not cached, nor evicts anything."""
+    cache: ByteLRUCache[str] = ByteLRUCache(10)
+    cache.put("a", b"aaaa")
+    cache.put("big", b"x" * 11)
+    assert "big" not in cache
+    assert cache.get("a") == b"aaaa"
+    assert cache.size == 4
@@ -0,0 +1,48 @@
+"""Tests of the notification record."""
+
+import asyncio
+from typing import Any, cast
+
+import pytest
+from fenotek_api.client import FenotekClient
+from fenotek_api.exceptions import FenotekPermanentError
+from fenotek_api.notification import Notification
+
+
+class _DetailsClient:
+    """Client stand-in serving the same call details for every url."""
+
+    def __init__(self, details: bytes) -> None:
+        """Initialize the client stand-in."""
+        self._details = details
+
+    async def fetch_url(self, url: str, *args: Any) -> bytes:
+        """Return the call details."""
+        return self._details
+
+
+def _call(details: bytes) -> Notification:
+    """Build a missed call notification whose details url serves `details`."""
+    return Notification.new(
+        cast(FenotekClient, _DetailsClient(details)),
+        {
+            "_id": f"{1:024x}",
+            "type": "missedcall",
+            "createdAt": "2024-01-01T00:00:00+00:00",
+            "detail": {"type": 8, "url": "https://example.com/details.json"},
+        },
+    )
+
+
+def test_with_video_url_resolves_call() -> None:
+    """The video url of a call is read from its details."""
+    notification = asyncio.run(
+        _call(b'{"data": {"url": "https://example.com/call.mp4"}}').with_video_url()
+    )
+    assert notification.video_url == "https://example.com/call.mp4"
+
+
+def test_with_video_url_invalid_details() -> None:
+    """Call details which are not JSON raise a Fenotek error."""
+    with pytest.raises(FenotekPermanentError):
+        asyncio.run(_call(b"<html>").with_video_url())
@@ -0,0 +1,56 @@
+"""Tests of the notification store."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+from fenotek_api.client import FenotekClient
+from fenotek_api.notification import NotificationSubType
+from fenotek_api.notification_store import NotificationStore
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+CLIENT = cast(FenotekClient, None)
+
+
+def _raw(index: int, sub_type: int = 6, label: str = "") -> dict[str, Any]:
+    """Build a raw notification created `index` minutes after START."""
+    return {
+        "_id": f"{index:024x}",
+        "type": "notification",
+        "createdAt": (START + timedelta(minutes=index)).isoformat(),
+        "detail": {"type": sub_type, "label": label},
+    }
+
+
+def test_ingest_skips_known_and_sorts() -> None:
+    """New notifications are returned oldest first, known ones skipped."""
+    store = NotificationStore(CLIENT)
+    assert [n.id_ for n in store.ingest([_raw(2), _raw(1)])] == [
+        f"{1:024x}",
+        f"{2:024x}",
+    ]
+    assert [n.id_ for n in store.ingest([_raw(3), _raw(2)])] == [f"{3:024x}"]
+    assert len(store) == 3
+    assert store.last is not None and store.last.id_ == f"{3:024x}"
+
+
+def test_ingest_overflow_evicts_oldest() -> None:
+    """The oldest notifications are evicted from the store and its indexes."""
+    store = NotificationStore(CLIENT, max_size=3)
+    store.ingest([_raw(1, 10, "gate"), _raw(2), _raw(3)])
+    added = store.ingest([_raw(4), _raw(5)])
+    assert [n.id_ for n in added] == [f"{4:024x}", f"{5:024x}"]
+    assert [n.id_ for n in store] == [f"{i:024x}" for i in (3, 4, 5)]
+    assert f"{1:024x}" not in store
+    assert store.last_activation_by_label("gate") is None
+    assert len(store.by_sub_type(NotificationSubType.RING)) == 3
+
+
+def test_ingest_overflow_does_not_return_evicted() -> None:
+    """Added notifications evicted in the same call are not returned."""
+    store = NotificationStore(CLIENT, max_size=2)
+    store.ingest([_raw(10), _raw(11)])
+    # Older than everything stored, evicted right away
+    assert store.ingest([_raw(1), _raw(2)]) == []
+    added = store.ingest([_raw(1), _raw(12), _raw(13), _raw(14)])
+    assert [n.id_ for n in added] == [f"{13:024x}", f"{14:024x}"]
+    assert [n.id_ for n in store] == [f"{13:024x}", f"{14:024x}"]
@@ -0,0 +1,57 @@
+"""Tests of the push payload parsing."""
+
+from typing import Any
+
+from fenotek_api.push import parse_push_payload
+
+MEDIA_HOSTS = ("fenotek.net",)
+
+
+def _pushed(id_: str = f"{1:024x}", url: str = "") -> dict[str, Any]:
+    """Build a pushed ring notification."""
+    return {
+        "_id": id_,
+        "vuid": "doorbell",
+        "type": "notification",
+        "createdAt": "2024-01-01T00:00:00+00:00",
+        "detail": {"type": 6, "url": url},
+    }
+
+
+def test_parse_payload_shapes() -> None:
+    """A notification, a list of them, or an object holding them is parsed."""
+    for payload in (
+        _pushed(),
+        [_pushed()],
+        {"notification": _pushed()},
+        {"notifications": [_pushed(), "not a notification"]},
+    ):
+        parsed = parse_push_payload(payload, MEDIA_HOSTS)
+        assert [raw["_id"] for raw in parsed["doorbell"]] == [f"{1:024x}"]
+
+
+def test_parse_rejects_invalid_ids() -> None:
+    """Notifications whose ID is not an ObjectId are ignored."""
+    for id_ in ("../../escaped", "a" * 23, "A" * 24, "g" * 24):
+        assert parse_push_payload(_pushed(id_=id_), MEDIA_HOSTS) == {}
+    payload = _pushed()
+    payload["_id"] = 1
+    assert parse_push_payload(payload, MEDIA_HOSTS) == {}
+
+
+def test_parse_rejects_foreign_media_urls() -> None:
+    """Only media urls on the media hosts, or their subdomains, are accepted."""
+    for url in (
+        "https://fenotek.net/ring.jpg",
+        "https://media.fenotek.net/ring.jpg",
+    ):
+        assert parse_push_payload(_pushed(url=url), MEDIA_HOSTS)
+    for url in (
+        "https://evil.com/ring.jpg",
+        "https://fenotek.net.evil.com/ring.jpg",
+        "https://fenotek.net@evil.com/ring.jpg",
+        "http://192.168.1.1/admin",
+        "file:///etc/passwd",
+        "fenotek.net/ring.jpg",
+    ):
+        assert parse_push_payload(_pushed(url=url), MEDIA_HOSTS) == {}
@@ -0,0 +1,29 @@
+"""Tests of the push webhook registration of the integration."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.fenotek.const import CONF_WEBHOOK_ID, DOMAIN  # noqa: E402
+from custom_components.fenotek.push import async_register_push  # noqa: E402
+
+
+def test_register_push_webhook() -> None:
+    """The webhook accepts POST requests and is unregistered on unload."""
+    hass = MagicMock()
+    config_entry = MagicMock(title="user", options={CONF_WEBHOOK_ID: "hook"})
+    with (
+        patch("homeassistant.components.webhook.async_register") as register,
+        patch("homeassistant.components.webhook.async_unregister") as unregister,
+    ):
+        async_register_push(hass, config_entry)
+        register.assert_called_once()
+        args, kwargs = register.call_args
+        assert args[1:4] == (DOMAIN, "Fenotek user", "hook")
+        assert kwargs["allowed_methods"] == ["POST"]
+
+        (on_unload,), _ = config_entry.async_on_unload.call_args
+        on_unload()
+        unregister.assert_called_once_with(hass, "hook")
@@ -0,0 +1,68 @@
+"""Tests of the retry policy and circuit breaker."""
+
+import asyncio
+import time
+
+import pytest
+from conftest import BackendFactory
+from fenotek_api.exceptions import FenotekCircuitOpenError
+from fenotek_api.retry import CircuitBreaker
+
+
+def test_circuit_opens_after_threshold() -> None:
+    """Consecutive failures open the circuit, a success resets the count."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(FenotekCircuitOpenError):
+        breaker.before_request()
+
+
+def test_circuit_single_trial() -> None:
+    """Once the timeout passed, a single trial request is let through."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    breaker.before_request()
+    with pytest.raises(FenotekCircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_request()
+
+
+def test_circuit_failed_trial_reopens() -> None:
+    """A failed trial opens the circuit again for the whole timeout."""
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.05)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.05)
+    breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(FenotekCircuitOpenError):
+        breaker.before_request()
+
+
+def test_circuit_cancelled_trial_frees_slot(running_backend: BackendFactory) -> None:
+    """A cancelled trial request lets another trial through."""
+
+    async def run() -> None:
+        async with running_backend() as (backend, client):
+            breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+            client._circuit_breaker = breaker
+            breaker.record_failure()
+            backend.config.latency = 1
+            # Not a GET, which would be shared and shielded from cancellation
+            trial = asyncio.create_task(client.ping(backend.doorbell_ids[0]))
+            await asyncio.sleep(0.05)
+            with pytest.raises(FenotekCircuitOpenError):
+                breaker.before_request()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            breaker.before_request()
+
+    asyncio.run(run())
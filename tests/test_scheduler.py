@@ -0,0 +1,48 @@
+"""Tests of the refresh schedulers."""
+
+from fenotek_api.scheduler import AdaptiveInterval
+
+# After the construction time of the intervals
+NOW = 4_000_000_000.0
+
+
+def _interval() -> AdaptiveInterval:
+    """Build an adaptive interval with distinct tiers."""
+    return AdaptiveInterval(
+        base=60, burst=5, idle=300, burst_duration=120, idle_after=900
+    )
+
+
+def test_adaptive_interval_tiers() -> None:
+    """The interval is `burst`, then `base`, then `idle` after an event."""
+    interval = _interval()
+    interval.record_event(NOW)
+    assert interval.interval(NOW) == 5
+    assert interval.interval(NOW + 119) == 5
+    assert interval.interval(NOW + 120) == 60
+    assert interval.interval(NOW + 899) == 60
+    assert interval.interval(NOW + 900) == 300
+
+
+def test_adaptive_interval_starts_at_base() -> None:
+    """Without any event, the interval starts at `base`."""
+    assert _interval().interval() == 60
+
+
+def test_adaptive_interval_keeps_latest_event() -> None:
+    """An event recorded late does not replace a more recent one."""
+    interval = _interval()
+    interval.record_event(NOW)
+    interval.record_event(NOW - 1000)
+    assert interval.interval(NOW + 1) == 5
+
+
+def test_adaptive_interval_bounded_by_base() -> None:
+    """Burst and idle tiers never slow down, or speed up, the base interval."""
+    interval = _interval()
+    interval.base = 600
+    interval.record_event(NOW)
+    assert interval.interval(NOW) == 5
+    assert interval.interval(NOW + 1000) == 600
+    interval.base = 1
+    assert interval.interval(NOW) == 1
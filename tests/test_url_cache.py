@@ -0,0 +1,46 @@
+"""Tests of the resolved url cache."""
+
+import time
+
+from fenotek_api.url_cache import ResolvedUrlCache, signed_url_expiry
+
+
+def test_signed_url_expiry() -> None:
+    """Expiry is read from AWS v4 and plain expires signatures."""
+    assert (
+        signed_url_expiry(
+            "https://bucket/video.mp4?X-Amz-Date=20240101T000000Z&X-Amz-Expires=600"
+        )
+        == 1704067800
+    )
+    assert signed_url_expiry("https://host/video.mp4?Expires=1700000000") == 1.7e9
+    assert signed_url_expiry("https://host/video.mp4") is None
+    assert signed_url_expiry("https://host/video.mp4?Expires=soon") is None
+
+
+def test_set_uses_ttl_without_signature() -> None:
+    """Unsigned urls are kept for the TTL."""
+    cache = ResolvedUrlCache(ttl=60)
+    cache.set("a", "https://host/a.mp4")
+    assert cache.get("a") == "https://host/a.mp4"
+    assert cache.is_fresh("a")
+    assert not cache.is_fresh("b")
+
+
+def test_signed_url_expires_before_ttl() -> None:
+    """Signed urls expire the margin before their signature does."""
+    cache = ResolvedUrlCache(ttl=3600, expiry_margin=60)
+    cache.set("soon", f"https://host/a.mp4?Expires={int(time.time()) + 30}")
+    cache.set("later", f"https://host/b.mp4?Expires={int(time.time()) + 600}")
+    assert not cache.is_fresh("soon")
+    assert cache.is_fresh("later")
+
+
+def test_prune() -> None:
+    """Urls of forgotten IDs are dropped."""
+    cache = ResolvedUrlCache()
+    cache.set("a", "https://host/a.mp4")
+    cache.set("b", "https://host/b.mp4")
+    cache.prune({"b"})
+    assert cache.get("a") is None
+    assert cache.get("b") == "https://host/b.mp4"